@@ -41,6 +41,21 @@ dfc22_converters.configurations.DEFAULT_MINIMAL_PAGE_COMBINATION_COUNT = (
 options when picking the actual movements == hopefully more harmonic
 result)"""
 
+ONLY_FIND_PAGE_COMBINATIONS_FOR_MOVEMENTS = True
+"""Only search page combinations for the movements of the sequential
+unisono event (much faster than searching page combinations for all
+reachable non terminal pairs)"""
+
+dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_CACHE_DIRECTORY_PATH = (
+    PAGE_COMBINATION_CACHE_DIRECTORY_PATH
+) = "etc/.page_combination_shards"
+"""Partial results of the page combination search are stored here, so
+that an interrupted search doesn't have to start again from scratch"""
+
+PAGE_CONVERSION_PROCESS_COUNT = 4
+"""Higher = more pages are converted to notes at the same time (1 =
+convert all pages in the main process)"""
+
 FORCE_TO_COMPUTE_NON_TERMINAL_PAIR_TO_PAGE_TUPLE = False
 
 FORCE_TO_COMPUTE_NON_TERMINAL_PAIR_PER_SEQUENTIAL_UNISONO_EVENT = False
@@ -45,13 +45,13 @@ except AssertionError:
         "need to have an equal amount of non terminals."
     )
 
-SEQUENTIAL_UNISONO_EVENT = dfc22_converters.ReaderCountToSequentialUnisonoEvent(
-    dfc22.configurations.MIN_READER_COMBINATION_COUNT,
-    dfc22.configurations.MAX_READER_COMBINATION_COUNT,
-).convert(dfc22.configurations.READER_COUNT)
-
-for _ in range(dfc22.configurations.SEQUENTIAL_UNISONO_EVENT_REPEAT_COUNT - 1):
-    SEQUENTIAL_UNISONO_EVENT.extend(SEQUENTIAL_UNISONO_EVENT)
+SEQUENTIAL_UNISONO_EVENT = dfc22_events.RepeatedSequentialUnisonoEvent(
+    dfc22_converters.ReaderCountToSequentialUnisonoEvent(
+        dfc22.configurations.MIN_READER_COMBINATION_COUNT,
+        dfc22.configurations.MAX_READER_COMBINATION_COUNT,
+    ).convert(dfc22.configurations.READER_COUNT),
+    repetition_count=dfc22.configurations.SEQUENTIAL_UNISONO_EVENT_REPEAT_COUNT,
+)
 
 UNISONO_COUNT = len(SEQUENTIAL_UNISONO_EVENT)
 
@@ -76,24 +76,6 @@ NON_TERMINAL_PAIR_TO_PAGE_TUPLE = core_utilities.compute_lazy(
     dfc22.configurations.SEQUENTIAL_UNISONO_EVENT_REPEAT_COUNT,
 )
 
-NON_TERMINAL_PAIR_TO_PAGE_COMBINATION_TUPLE = core_utilities.compute_lazy(
-    "etc/.non_terminal_pair_to_page_combination_tuple.pickled",
-    force_to_compute=dfc22.configurations.FORCE_TO_COMPUTE_NON_TERMINAL_PAIR_TO_PAGE_COMBINATION_TUPLE,
-)(
-    lambda _, __, ___, ____, ______, _______, ________: dfc22_converters.PageCatalogToPageCombinationCatalog().convert(
-        NON_TERMINAL_PAIR_TO_PAGE_TUPLE
-    )
-)(
-    dfc22.configurations.MAX_PAPER_GENERATION_DEPTH,
-    dfc22.configurations.MINIMAL_LANGUAGE_STRUCTURE_LENGTH,
-    dfc22.configurations.MINIMAL_PAGE_COMBINATION_COUNT,
-    dfc22.configurations.MAXIMUM_PAGE_COMBINATION_COUNT,
-    dfc22.configurations.MIN_READER_COMBINATION_COUNT,
-    dfc22.configurations.MAX_READER_COMBINATION_COUNT,
-    dfc22.configurations.SEQUENTIAL_UNISONO_EVENT_REPEAT_COUNT,
-)
-
-
 PAGE_PER_SEQUENTIAL_UNISONO_EVENT = dfc22_converters.SequentialUnisonoEventToPageTuple(
     NON_TERMINAL_PAIR_TO_PAGE_TUPLE
 ).convert(SEQUENTIAL_UNISONO_EVENT)
@@ -113,32 +95,11 @@ vowel, consonant = (
 ]
 
 
-NON_TERMINAL_PAIR_PER_SEQUENTIAL_UNISONO_EVENT = core_utilities.compute_lazy(
-    "etc/.non_terminal_pair_per_sequential_unisono_event.pickled",
-    force_to_compute=dfc22.configurations.FORCE_TO_COMPUTE_NON_TERMINAL_PAIR_PER_SEQUENTIAL_UNISONO_EVENT,
-)(
-    lambda _, __, ___: dfc22_converters.SequentialUnisonoEventToNonTerminalPairTuple(
-        NON_TERMINAL_PAIR_TO_PAGE_COMBINATION_TUPLE
-    ).convert(SEQUENTIAL_UNISONO_EVENT)
-)(
-    SEQUENTIAL_UNISONO_EVENT,
-    dfc22.configurations.MAX_PAPER_GENERATION_DEPTH,
-    dfc22.configurations.MINIMAL_LANGUAGE_STRUCTURE_LENGTH,
-)
-
-[
-    unisono_event.set_parameter("non_terminal_pair", non_terminal_pair)
-    for unisono_event, non_terminal_pair in zip(
-        SEQUENTIAL_UNISONO_EVENT, NON_TERMINAL_PAIR_PER_SEQUENTIAL_UNISONO_EVENT
-    )
-]
-
 NON_TERMINAL_PAIR_PER_SEQUENTIAL_UNISONO_EVENT = core_utilities.compute_lazy(
     "etc/.non_terminal_pair_per_sequential_unisono_event.pickled",
     force_to_compute=dfc22.configurations.FORCE_TO_COMPUTE_NON_TERMINAL_PAIR_PER_SEQUENTIAL_UNISONO_EVENT,
 )(
     lambda pitch_offset, rhythm_offset, _, __, ___: dfc22_converters.SequentialUnisonoEventToNonTerminalPairTuple(
-        NON_TERMINAL_PAIR_TO_PAGE_COMBINATION_TUPLE,
         pitch_offset=pitch_offset,
         rhythm_offset=rhythm_offset,
     ).convert(
@@ -159,16 +120,32 @@ NON_TERMINAL_PAIR_PER_SEQUENTIAL_UNISONO_EVENT = core_utilities.compute_lazy(
     )
 ]
 
+if dfc22.configurations.ONLY_FIND_PAGE_COMBINATIONS_FOR_MOVEMENTS:
+    MOVEMENT_NON_TERMINAL_PAIR_TUPLE = (
+        dfc22_converters.SequentialUnisonoEventToMovementNonTerminalPairTuple().convert(
+            SEQUENTIAL_UNISONO_EVENT
+        )
+    )
+else:
+    MOVEMENT_NON_TERMINAL_PAIR_TUPLE = None
 
-# movement_set = SEQUENTIAL_UNISONO_EVENT.get_movement_set()
-# available_count, unavailable_count = 0, 0
-# for movement in movement_set:
-#     non_terminal_pair = movement.as_non_terminal_pair
-#     print(non_terminal_pair)
-#     if non_terminal_pair in NON_TERMINAL_PAIR_TO_PAGE_COMBINATION_TUPLE.keys():
-#         available_count += 1
-#     else:
-#         unavailable_count += 1
+NON_TERMINAL_PAIR_TO_PAGE_COMBINATION_TUPLE = core_utilities.compute_lazy(
+    "etc/.non_terminal_pair_to_page_combination_tuple.pickled",
+    force_to_compute=dfc22.configurations.FORCE_TO_COMPUTE_NON_TERMINAL_PAIR_TO_PAGE_COMBINATION_TUPLE,
+)(
+    lambda non_terminal_pair_to_find_tuple, _, __, ___, ____, _____, ______, _______: dfc22_converters.PageCatalogToPageCombinationCatalog().convert(
+        NON_TERMINAL_PAIR_TO_PAGE_TUPLE, non_terminal_pair_to_find_tuple
+    )
+)(
+    MOVEMENT_NON_TERMINAL_PAIR_TUPLE,
+    dfc22.configurations.MAX_PAPER_GENERATION_DEPTH,
+    dfc22.configurations.MINIMAL_LANGUAGE_STRUCTURE_LENGTH,
+    dfc22.configurations.MINIMAL_PAGE_COMBINATION_COUNT,
+    dfc22.configurations.MAXIMUM_PAGE_COMBINATION_COUNT,
+    dfc22.configurations.MIN_READER_COMBINATION_COUNT,
+    dfc22.configurations.MAX_READER_COMBINATION_COUNT,
+    dfc22.configurations.SEQUENTIAL_UNISONO_EVENT_REPEAT_COUNT,
+)
 
 
 SIMULTANEOUS_EVENT_WITH_PAGES = core_utilities.compute_lazy(
@@ -189,47 +166,15 @@ SIMULTANEOUS_EVENT_WITH_PAGES = core_utilities.compute_lazy(
     force_to_compute=dfc22.configurations.FORCE_TO_COMPUTE_SIMULTANEOUS_EVENT_WITH_NOTES,
 )
 def _make_simultaneous_events_with_notes(_):
-    import progressbar
-
-    from mutwo import core_events
-
-    nested_language_structure_to_sequential_event = (
-        dfc22_converters.NestedLanguageStructureToSequentialEvent()
-    )
-
-    simultaneous_event_with_notes = core_events.SimultaneousEvent([])
+    return dfc22_converters.SimultaneousEventWithPagesToSimultaneousEventWithNotes(
+        dfc22_converters.NestedLanguageStructureToSequentialEvent,
+        dfc22.configurations.PAGE_CONVERSION_PROCESS_COUNT,
+    ).convert(SIMULTANEOUS_EVENT_WITH_PAGES)
 
-    for sequential_event in SIMULTANEOUS_EVENT_WITH_PAGES:
-        new_sequential_event = core_events.SequentialEvent([])
-        for event in progressbar.progressbar(sequential_event):
-            if isinstance(event, dfc22_events.Page):
-                new_sequential_event.append(
-                    nested_language_structure_to_sequential_event(event)
-                )
-            else:
-                new_sequential_event.append(event)
 
-        simultaneous_event_with_notes.append(new_sequential_event)
-
-    return simultaneous_event_with_notes
-
-
-SIMULTANEOUS_EVENT_WITH_NOTES = _make_simultaneous_events_with_notes(
-    dfc22.configurations.READER_COUNT
-)
-
-
-@core_utilities.compute_lazy(
-    "etc/.simultaneous_event_with_isis_friendly--_--notes.pickled",
-    force_to_compute=dfc22.configurations.FORCE_TO_COMPUTE_SIMULTANEOUS_EVENT_WITH_NOTES
-    or dfc22.configurations.FORCE_TO_COMPUTE_SIMULTANEOUS_EVENT_WITH_NOTES_FOR_ISIS,
-)
-def _make_simultaneous_events_with_isis_friendly_notes():
-    import copy
-
-    import progressbar
-
-    from mutwo import core_events
+def make_page_to_isis_friendly_sequential_event():
+    """Make a function which converts a page to notes which can be
+    synthesized by ISiS"""
 
     nested_language_structure_to_isis_friendly_nested_language_structure = (
         dfc22_converters.NestedLanguageStructureToISiSSafeNestedLanguageStructure()
@@ -243,38 +188,53 @@ def _make_simultaneous_events_with_isis_friendly_notes():
         )
     )
 
-    simultaneous_event_with_isis_friendly_notes = core_events.SimultaneousEvent([])
+    def is_rest(note_like):
+        return note_like.vowel == "_"
 
-    for sequential_event in copy.deepcopy(SIMULTANEOUS_EVENT_WITH_PAGES):
-        new_sequential_event = core_events.SequentialEvent([])
-        for event in progressbar.progressbar(sequential_event):
-            if isinstance(event, dfc22_events.Page):
-                event = nested_language_structure_to_isis_friendly_nested_language_structure.convert(
-                    event
-                )
-                converted_page = nested_language_structure_to_sequential_event(event)
+    def process_surviving_event(event0, event1):
+        event0.duration += event1.duration
+        event0.pitch_list = [music_parameters.MidiPitch(0)]
 
-                def is_rest(note_like):
-                    return note_like.vowel == "_"
+    def page_to_isis_friendly_sequential_event(page):
+        page = nested_language_structure_to_isis_friendly_nested_language_structure.convert(
+            page
+        )
+        converted_page = nested_language_structure_to_sequential_event(page)
+        return converted_page.tie_by(
+            lambda event0, event1: is_rest(event0) and is_rest(event1),
+            process_surviving_event,
+            mutate=False,
+        )
+
+    return page_to_isis_friendly_sequential_event
 
-                def process_surviving_event(event0, event1):
-                    event0.duration += event1.duration
-                    event0.pitch_list = [music_parameters.MidiPitch(0)]
 
-                converted_page = converted_page.tie_by(
-                    lambda event0, event1: is_rest(event0) and is_rest(event1),
-                    process_surviving_event,
-                    mutate=False,
-                )
-                new_sequential_event.append(converted_page)
-            else:
-                new_sequential_event.append(event)
+@core_utilities.compute_lazy(
+    "etc/.simultaneous_event_with_isis_friendly--_--notes.pickled",
+    force_to_compute=dfc22.configurations.FORCE_TO_COMPUTE_SIMULTANEOUS_EVENT_WITH_NOTES
+    or dfc22.configurations.FORCE_TO_COMPUTE_SIMULTANEOUS_EVENT_WITH_NOTES_FOR_ISIS,
+)
+def _make_simultaneous_events_with_isis_friendly_notes():
+    return dfc22_converters.SimultaneousEventWithPagesToSimultaneousEventWithNotes(
+        make_page_to_isis_friendly_sequential_event,
+        dfc22.configurations.PAGE_CONVERSION_PROCESS_COUNT,
+    ).convert(SIMULTANEOUS_EVENT_WITH_PAGES)
 
-        simultaneous_event_with_isis_friendly_notes.append(new_sequential_event)
 
-    return simultaneous_event_with_isis_friendly_notes
+_NAME_TO_MAKE_CONSTANT = {
+    "SIMULTANEOUS_EVENT_WITH_NOTES": lambda: _make_simultaneous_events_with_notes(
+        dfc22.configurations.READER_COUNT
+    ),
+    "SIMULTANEOUS_EVENT_WITH_ISIS_FRIENDLY_NOTES": _make_simultaneous_events_with_isis_friendly_notes,
+}
 
 
-SIMULTANEOUS_EVENT_WITH_ISIS_FRIENDLY_NOTES = (
-    _make_simultaneous_events_with_isis_friendly_notes()
-)
+def __getattr__(name: str):
+    # The conversions of all pages to notes are only calculated when
+    # they are needed (rendering a time window doesn't need them).
+    try:
+        make_constant = _NAME_TO_MAKE_CONSTANT[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    constant = globals()[name] = make_constant()
+    return constant
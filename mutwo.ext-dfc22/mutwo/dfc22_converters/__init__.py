@@ -5,6 +5,9 @@ from .images import *
 from .languages import *
 from .letters import *
 from .papers import *
+from .harmonicities import *
+from .searches import *
+from .timelines import *
 from .unisonos import *
 from .pulses import *
 from .csound import *
@@ -6,4 +6,29 @@ DEFAULT_MAXIMUM_PAGE_COMBINATION_COUNT = 4
 
 DEFAULT_MINIMAL_PAGE_COMBINATION_COUNT = 200
 
+DEFAULT_PAGE_COMBINATION_PROCESS_COUNT = None
+"""How many processes are used to find page combinations
+(`None` uses all available cores)"""
+
+DEFAULT_PAGE_COMBINATION_CACHE_DIRECTORY_PATH = None
+"""Directory where each shard of the page combination catalog is stored
+(`None` disables the cache)"""
+
+DEFAULT_PAGE_COMBINATION_SEARCH_ITERATION_COUNT = 20000
+"""How many neighbours each search chain evaluates"""
+
+DEFAULT_PAGE_COMBINATION_SEARCH_TIME_BUDGET = None
+"""Maximum duration of each search chain in seconds (`None` = no limit)"""
+
+DEFAULT_PAGE_COMBINATION_SEARCH_CHAIN_COUNT = 8
+"""How many search chains are run (the best result of all chains is used)"""
+
+DEFAULT_PAGE_COMBINATION_SEARCH_PROCESS_COUNT = None
+"""How many search chains run in parallel (`None` uses all available cores)"""
+
+DEFAULT_PAGE_COMBINATION_SEARCH_SEED = 100
+
+DEFAULT_PAGE_COMBINATION_SEARCH_PATIENCE = 5000
+"""Stop a search chain if it didn't improve for this many iterations"""
+
 PAGE_BUFFER_DURATION = 2.5
@@ -0,0 +1,292 @@
+"""Measure how harmonic the pitches and pulses of multiple readers are"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import itertools
+import typing
+
+import numpy as np
+
+from mutwo import core_converters
+from mutwo import core_events
+from mutwo import dfc22_converters
+from mutwo import dfc22_events
+from mutwo import dfc22_parameters
+
+
+__all__ = (
+    "Trajectory",
+    "PageToTrajectory",
+    "TrajectoryPairToHarmonicity",
+    "SimultaneousEventToHarmonicity",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tenney_weight_array(exponent_count: int) -> np.ndarray:
+    """log2 of the first primes (the Tenney height of each prime)"""
+
+    prime_list = []
+    for number in itertools.count(2):
+        if len(prime_list) == exponent_count:
+            break
+        if all(number % prime for prime in prime_list):
+            prime_list.append(number)
+    return np.log2(np.array(prime_list, dtype=float))
+
+
+@dataclasses.dataclass(frozen=True)
+class Trajectory(object):
+    """Pitches and pulses of one reader as arrays.
+
+    Each row describes one phoneme group: it starts at
+    ``start_time_array[i]``, stops at ``stop_time_array[i]`` and has
+    the exponent vector ``exponent_array[i]`` (see
+    :class:`mutwo.dfc22_parameters.CompactNonTerminalPair`: pulse
+    exponents followed by pitch exponents). Rows are sorted by start
+    time and don't overlap.
+    """
+
+    start_time_array: np.ndarray
+    stop_time_array: np.ndarray
+    exponent_array: np.ndarray
+
+    @classmethod
+    def concatenate(cls, trajectory_sequence: typing.Sequence[Trajectory]) -> Trajectory:
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        if not trajectory_sequence:
+            return cls(
+                np.zeros(0), np.zeros(0), np.zeros((0, exponent_count * 2), dtype=int)
+            )
+        start_time_array, stop_time_array, exponent_array = (
+            np.concatenate(
+                [getattr(trajectory, attribute_name) for trajectory in trajectory_sequence]
+            )
+            for attribute_name in (
+                "start_time_array",
+                "stop_time_array",
+                "exponent_array",
+            )
+        )
+        sorting_index_array = np.argsort(start_time_array, kind="stable")
+        return cls(
+            start_time_array[sorting_index_array],
+            stop_time_array[sorting_index_array],
+            exponent_array[sorting_index_array],
+        )
+
+    def move(
+        self,
+        start_time: float,
+        initial_non_terminal_pair: typing.Union[
+            dfc22_parameters.NonTerminalPair, dfc22_parameters.CompactNonTerminalPair
+        ],
+    ) -> Trajectory:
+        """Shift the trajectory in time and transpose it"""
+
+        return type(self)(
+            self.start_time_array + start_time,
+            self.stop_time_array + start_time,
+            self.exponent_array
+            + np.array(
+                dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                    initial_non_terminal_pair
+                ).exponent_tuple
+            ),
+        )
+
+    def wrap(self, duration: float) -> Trajectory:
+        """Fold the trajectory into the cycle from 0 to ``duration``"""
+
+        cycle_index_array = np.floor_divide(self.start_time_array, duration)
+        start_time_array = self.start_time_array - (cycle_index_array * duration)
+        stop_time_array = self.stop_time_array - (cycle_index_array * duration)
+        is_split_array = stop_time_array > duration
+        if not (np.any(cycle_index_array) or np.any(is_split_array)):
+            return self
+        return self.concatenate(
+            (
+                type(self)(
+                    start_time_array,
+                    np.minimum(stop_time_array, duration),
+                    self.exponent_array,
+                ),
+                type(self)(
+                    np.zeros(np.count_nonzero(is_split_array)),
+                    stop_time_array[is_split_array] - duration,
+                    self.exponent_array[is_split_array],
+                ),
+            )
+        )
+
+
+class PageToTrajectory(core_converters.abc.Converter):
+    """Convert a page to a trajectory which starts at 0 with the exponents 0.
+
+    Like in :class:`NestedLanguageStructureToSequentialEvent` each
+    phoneme group has the pitch and pulse of the initial non terminal
+    pair plus the movements of all previous phoneme groups. The
+    durations are the durations of the phoneme groups (in the same way
+    as the duration of the page is calculated). The trajectories of
+    pages are cached by their content digest.
+    """
+
+    def __init__(self):
+        self._content_digest_to_trajectory = {}
+
+    def convert(self, page_to_convert: dfc22_events.Page) -> Trajectory:
+        content_digest = page_to_convert.content_digest
+        try:
+            return self._content_digest_to_trajectory[content_digest]
+        except KeyError:
+            pass
+        duration_list, exponent_tuple_list = [], []
+        for paragraph in page_to_convert:
+            for sentence in paragraph:
+                for word in sentence:
+                    for phoneme_group in word:
+                        duration_list.append(float(phoneme_group.duration))
+                        exponent_tuple_list.append(
+                            dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                                phoneme_group.non_terminal_pair
+                            ).exponent_tuple
+                        )
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        movement_array = np.array(exponent_tuple_list, dtype=int).reshape(
+            len(exponent_tuple_list), exponent_count * 2
+        )
+        stop_time_array = np.cumsum(duration_list, dtype=float)
+        start_time_array = stop_time_array - np.array(duration_list, dtype=float)
+        # The movement of a phoneme group only applies to the next
+        # phoneme groups.
+        exponent_array = np.cumsum(movement_array, axis=0) - movement_array
+        trajectory = self._content_digest_to_trajectory[content_digest] = Trajectory(
+            start_time_array, stop_time_array, exponent_array
+        )
+        return trajectory
+
+
+class TrajectoryPairToHarmonicity(core_converters.abc.Converter):
+    """Rate how harmonic two simultaneous trajectories are (higher = better).
+
+    :param pulse_weight: How important the harmonicity between pulses is
+        compared to the harmonicity between pitches.
+
+    The harmonicity is the negative Tenney height of the vertical intervals
+    (pitch and pulse), weighted by the duration in which both trajectories
+    overlap. Both trajectories need to be wrapped into the same cycle.
+    """
+
+    def __init__(self, pulse_weight: float = 0.5):
+        self._pulse_weight = pulse_weight
+
+    @staticmethod
+    def _get_active_row_index_array(
+        trajectory: Trajectory, time_array: np.ndarray
+    ) -> np.ndarray:
+        """Row which sounds at each time (or -1)"""
+
+        row_index_array = (
+            np.searchsorted(trajectory.start_time_array, time_array, side="right") - 1
+        )
+        is_valid_array = row_index_array >= 0
+        is_valid_array[is_valid_array] = (
+            time_array[is_valid_array]
+            < trajectory.stop_time_array[row_index_array[is_valid_array]]
+        )
+        return np.where(is_valid_array, row_index_array, -1)
+
+    def convert(self, trajectory0: Trajectory, trajectory1: Trajectory) -> float:
+        if not (len(trajectory0.start_time_array) and len(trajectory1.start_time_array)):
+            return 0
+        # Merge the time grids of both trajectories
+        time_array = np.unique(
+            np.concatenate(
+                (
+                    trajectory0.start_time_array,
+                    trajectory0.stop_time_array,
+                    trajectory1.start_time_array,
+                    trajectory1.stop_time_array,
+                )
+            )
+        )
+        center_time_array = (time_array[:-1] + time_array[1:]) / 2
+        duration_array = np.diff(time_array)
+        row_index_array0, row_index_array1 = (
+            self._get_active_row_index_array(trajectory, center_time_array)
+            for trajectory in (trajectory0, trajectory1)
+        )
+        is_overlapping_array = (row_index_array0 >= 0) & (row_index_array1 >= 0)
+        if not np.any(is_overlapping_array):
+            return 0
+        interval_array = np.abs(
+            trajectory0.exponent_array[row_index_array0[is_overlapping_array]]
+            - trajectory1.exponent_array[row_index_array1[is_overlapping_array]]
+        )
+        exponent_count = interval_array.shape[1] // 2
+        tenney_weight_array = _get_tenney_weight_array(exponent_count)
+        tenney_height_array = (
+            interval_array[:, exponent_count:] @ tenney_weight_array
+        ) + self._pulse_weight * (
+            interval_array[:, :exponent_count] @ tenney_weight_array
+        )
+        return -float(
+            tenney_height_array @ duration_array[is_overlapping_array]
+        )
+
+
+class SimultaneousEventToHarmonicity(core_converters.abc.Converter):
+    """Rate how harmonic all readers of a simultaneous event are.
+
+    The simultaneous event needs to contain one sequential event for
+    each reader and each sequential event contains pages and rests (as
+    returned by :class:`SequentialUnisonoEventToSimultaneousEvent`).
+    The result is the sum of the harmonicity of all reader pairs.
+    """
+
+    def __init__(
+        self,
+        page_to_trajectory: typing.Optional[PageToTrajectory] = None,
+        trajectory_pair_to_harmonicity: typing.Optional[
+            TrajectoryPairToHarmonicity
+        ] = None,
+    ):
+        if page_to_trajectory is None:
+            page_to_trajectory = PageToTrajectory()
+        if trajectory_pair_to_harmonicity is None:
+            trajectory_pair_to_harmonicity = TrajectoryPairToHarmonicity()
+        self._page_to_trajectory = page_to_trajectory
+        self._trajectory_pair_to_harmonicity = trajectory_pair_to_harmonicity
+
+    def _placement_tuple_to_trajectory(
+        self, placement_tuple: tuple[tuple[float, dfc22_events.Page], ...]
+    ) -> Trajectory:
+        return Trajectory.concatenate(
+            [
+                self._page_to_trajectory(page).move(
+                    start_time, page.initial_non_terminal_pair
+                )
+                for start_time, page in placement_tuple
+            ]
+        )
+
+    def convert(self, simultaneous_event_to_convert: core_events.SimultaneousEvent) -> float:
+        reader_timeline_index = dfc22_converters.ReaderTimelineIndex(
+            simultaneous_event_to_convert, dfc22_events.Page
+        )
+        trajectory_tuple = tuple(
+            self._placement_tuple_to_trajectory(
+                reader_timeline_index.get_placement_tuple(reader_index)
+            )
+            for reader_index in range(reader_timeline_index.reader_count)
+        )
+        return sum(
+            self._trajectory_pair_to_harmonicity(trajectory0, trajectory1)
+            for trajectory0, trajectory1 in itertools.combinations(trajectory_tuple, 2)
+        )
@@ -1,11 +1,14 @@
 import collections
+import copy
 import functools
 import itertools
+import json
 import operator
 import typing
 
 import numpy as np
 import progressbar
+import quicktions as fractions
 
 from mutwo import core_converters
 from mutwo import core_constants
@@ -25,6 +28,8 @@ __all__ = (
     "NonTerminalPairToNotFinitePairResolutionTuple",
     "NonTerminalPairToPageTuple",
     "PageCountAndWordCountToPageCatalog",
+    "PageCatalogToFile",
+    "DurationQuantizer",
     "WordToSequentialEvent",
     "SentenceToSequentialEvent",
     "NestedLanguageStructureToSequentialEvent",
@@ -739,40 +744,128 @@ class PageCountAndWordCountToPageCatalog(core_converters.abc.Converter):
         return non_terminal_pair_to_page_tuple_dict
 
 
-def find_duration(
-    initial_pulse: music_parameters.JustIntonationPitch,
-    uncertain_duration: dfc22_parameters.UncertainRange,
-    random: np.random.Generator,
-) -> core_constants.DurationType:
-    pulse_list = []
-    ratio = float(initial_pulse.ratio)
-    current_pulse = float(ratio)
-    while True:
-        if current_pulse > uncertain_duration.end:
-            break
-        elif current_pulse >= uncertain_duration.start:
-            pulse_list.append(current_pulse)
-        current_pulse += ratio
+class DurationQuantizer(object):
+    """Find durations which are multiples of a pulse.
 
-    if not pulse_list:
-        pulse_list = [ratio]
+    :param cache_size: How many durations are remembered (they are
+        looked up by the pulse and the range).
 
-    # return float(random.choice(pulse_list, 1)[0])
-    return float(pulse_list[int(len(pulse_list) // 2)])
+    The duration is the middle one of all multiples of the pulse which
+    are inside a range. If no multiple is inside the range, the duration
+    is the pulse itself. The multiples are calculated by adding the pulse
+    again and again (and not by multiplying it), so that they have the
+    same floating point errors as the multiples which were found by
+    the original loop. The multiples of each pulse are only accumulated
+    once and the multiples inside a range are found with a binary search.
+    """
 
+    def __init__(self, cache_size: typing.Optional[int] = 2**12):
+        self._pulse_to_multiple_array = {}
+        self.get_duration = functools.lru_cache(maxsize=cache_size)(
+            self._get_duration
+        )
 
-def make_rest(
-    event_class: typing.Type,
+    def _get_multiple_array(self, pulse: float, end: float) -> np.ndarray:
+        """Accumulated multiples of the pulse which exceed ``end``"""
+
+        try:
+            multiple_array = self._pulse_to_multiple_array[pulse]
+        except KeyError:
+            multiple_array = None
+        if multiple_array is None or multiple_array[-1] <= end:
+            multiple_count = int(end // pulse) + 2
+            if multiple_array is not None:
+                multiple_count = max(multiple_count, len(multiple_array) * 2)
+            # 'cumsum' adds the values one after another (like the
+            # original loop).
+            multiple_array = self._pulse_to_multiple_array[pulse] = np.cumsum(
+                np.full(multiple_count, pulse)
+            )
+            # Don't rely on the estimated count (the accumulated multiples
+            # can be slightly smaller than the exact multiples).
+            while multiple_array[-1] <= end:
+                multiple_array = self._pulse_to_multiple_array[pulse] = np.cumsum(
+                    np.full(len(multiple_array) * 2, pulse)
+                )
+        return multiple_array
+
+    def _get_duration(
+        self, pulse_ratio: fractions.Fraction, start: float, end: float
+    ) -> float:
+        return float(
+            self.get_duration_array(
+                np.array([float(pulse_ratio)]), np.array([start]), np.array([end])
+            )[0]
+        )
+
+    def get_duration_array(
+        self,
+        pulse_array: np.ndarray,
+        start_array: np.ndarray,
+        end_array: np.ndarray,
+    ) -> np.ndarray:
+        """Find the durations for arrays of pulses and ranges"""
+
+        pulse_array, start_array, end_array = (
+            np.asarray(array, dtype=float)
+            for array in (pulse_array, start_array, end_array)
+        )
+        duration_array = pulse_array.copy()
+        unique_pulse_array, pulse_index_array = np.unique(
+            pulse_array, return_inverse=True
+        )
+        pulse_index_array = pulse_index_array.reshape(-1)
+        for pulse_index, pulse in enumerate(unique_pulse_array.tolist()):
+            is_pulse_array = pulse_index_array == pulse_index
+            pulse_start_array = start_array[is_pulse_array]
+            pulse_end_array = end_array[is_pulse_array]
+            multiple_array = self._get_multiple_array(pulse, pulse_end_array.max())
+            minimal_index_array = np.searchsorted(
+                multiple_array, pulse_start_array, side="left"
+            )
+            multiple_count_array = (
+                np.searchsorted(multiple_array, pulse_end_array, side="right")
+                - minimal_index_array
+            )
+            duration_array[is_pulse_array] = np.where(
+                multiple_count_array > 0,
+                multiple_array[
+                    np.minimum(
+                        minimal_index_array + (multiple_count_array // 2),
+                        len(multiple_array) - 1,
+                    )
+                ],
+                pulse,
+            )
+        return duration_array
+
+    def __call__(
+        self,
+        pulse: music_parameters.JustIntonationPitch,
+        uncertain_duration: dfc22_parameters.UncertainRange,
+    ) -> core_constants.DurationType:
+        return self.get_duration(
+            pulse.ratio, float(uncertain_duration.start), float(uncertain_duration.end)
+        )
+
+
+_DEFAULT_DURATION_QUANTIZER = DurationQuantizer()
+
+
+def find_duration(
     initial_pulse: music_parameters.JustIntonationPitch,
     uncertain_duration: dfc22_parameters.UncertainRange,
-    random: np.random.Generator,
+) -> core_constants.DurationType:
+    return _DEFAULT_DURATION_QUANTIZER(initial_pulse, uncertain_duration)
+
+
+def _make_rest(
+    event_class: typing.Type, duration: core_constants.DurationType
 ) -> typing.Union[
     dfc22_events.NoteLikeWithPhoneme,
     dfc22_events.NoteLikeWithVowelAndConsonantTuple,
 ]:
-    keyword_argument_dict = {
-        "duration": find_duration(initial_pulse, uncertain_duration, random),
-    }
+    keyword_argument_dict = {"duration": duration}
     if event_class == dfc22_events.NoteLikeWithPhoneme:
         keyword_argument_dict.update({"phoneme": "_", "pitch_list": []})
     elif event_class == dfc22_events.NoteLikeWithVowelAndConsonantTuple:
@@ -786,6 +879,22 @@ def make_rest(
     return event_class(**keyword_argument_dict)
 
 
+def make_rest(
+    event_class: typing.Type,
+    initial_pulse: music_parameters.JustIntonationPitch,
+    uncertain_duration: dfc22_parameters.UncertainRange,
+    duration_quantizer: typing.Optional[DurationQuantizer] = None,
+) -> typing.Union[
+    dfc22_events.NoteLikeWithPhoneme,
+    dfc22_events.NoteLikeWithVowelAndConsonantTuple,
+]:
+    if duration_quantizer is None:
+        duration_quantizer = _DEFAULT_DURATION_QUANTIZER
+    return _make_rest(
+        event_class, duration_quantizer(initial_pulse, uncertain_duration)
+    )
+
+
 class NestedLanguageStructureToISiSSafeNestedLanguageStructure(
     core_converters.abc.Converter
 ):
@@ -868,18 +977,44 @@ class NestedLanguageStructureToISiSSafeNestedLanguageStructure(
         return converted_event
 
 
+def _is_compact(non_terminal_pair: dfc22_parameters.NonTerminalPair) -> bool:
+    """Check if the pitches of the pair fit into a compact pair"""
+
+    exponent_count = (
+        dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+    )
+    return isinstance(non_terminal_pair, dfc22_parameters.CompactNonTerminalPair) or (
+        len(non_terminal_pair.consonant.exponent_tuple) <= exponent_count
+        and len(non_terminal_pair.vowel.exponent_tuple) <= exponent_count
+    )
+
+
 class WordToSequentialEvent(core_converters.abc.Converter):
     def __init__(
         self,
         event_class: typing.Type = dfc22_events.NoteLikeWithPhoneme,
         seed: int = 100,
+        duration_quantizer: typing.Optional[DurationQuantizer] = None,
     ):
+        if duration_quantizer is None:
+            duration_quantizer = _DEFAULT_DURATION_QUANTIZER
+        # 'seed' is unused (see NestedLanguageStructureToSequentialEvent)
         self._event_class = event_class
-        self._random = np.random.default_rng(seed)
+        self._duration_quantizer = duration_quantizer
+
+    @property
+    def event_class(self) -> typing.Type:
+        return self._event_class
+
+    @property
+    def duration_quantizer(self) -> DurationQuantizer:
+        return self._duration_quantizer
 
-    def _phoneme_group_to_event_specific_keyword_argument_dict(
+    def phoneme_group_to_event_specific_keyword_argument_dict(
         self, phoneme_group_to_convert: dfc22_events.PhonemeGroup
     ) -> dict[str, typing.Any]:
+        """Keyword arguments of the note which depend on the event class"""
+
         keyword_argument_dict = {}
         if self._event_class == dfc22_events.NoteLikeWithPhoneme:
             keyword_argument_dict.update(
@@ -910,8 +1045,8 @@ class WordToSequentialEvent(core_converters.abc.Converter):
         phoneme_group_to_convert: dfc22_events.PhonemeGroup,
         initial_pulse: music_parameters.JustIntonationPitch,
     ) -> core_constants.DurationType:
-        return find_duration(
-            initial_pulse, phoneme_group_to_convert.uncertain_duration, self._random
+        return self._duration_quantizer(
+            initial_pulse, phoneme_group_to_convert.uncertain_duration
         )
 
     def _phoneme_group_to_note_like(
@@ -928,7 +1063,7 @@ class WordToSequentialEvent(core_converters.abc.Converter):
         music_parameters.JustIntonationPitch,
     ]:
         keyword_argument_dict = (
-            self._phoneme_group_to_event_specific_keyword_argument_dict(
+            self.phoneme_group_to_event_specific_keyword_argument_dict(
                 phoneme_group_to_convert
             )
         )
@@ -983,9 +1118,9 @@ class SentenceToSequentialEvent(core_converters.abc.Converter):
         word_to_sequential_event: WordToSequentialEvent = WordToSequentialEvent(),
         seed: int = 1000,
     ):
+        # 'seed' is unused (see NestedLanguageStructureToSequentialEvent)
         self._word_to_sequential_event = word_to_sequential_event
         self._uncertain_duration_rest = dfc22_parameters.UncertainRange(0.28, 0.3)
-        self._random = np.random.default_rng(seed)
 
     def convert(
         self,
@@ -1016,23 +1151,74 @@ class SentenceToSequentialEvent(core_converters.abc.Converter):
             sequential_event.extend(word_sequential_event)
             sequential_event.append(
                 make_rest(
-                    self._word_to_sequential_event._event_class,
+                    self._word_to_sequential_event.event_class,
                     initial_pulse,
                     self._uncertain_duration_rest,
-                    self._random,
+                    self._word_to_sequential_event.duration_quantizer,
                 )
             )
         return sequential_event, initial_pitch, initial_pulse
 
 
 class NestedLanguageStructureToSequentialEvent(core_converters.abc.Converter):
+    """Convert a language structure to notes (and rests).
+
+    :param seed: Unused, because the durations are deterministic (only
+        kept for backwards compatibility).
+    :param batch: If ``True`` the language structure is flattened and the
+        pitches, pulses and durations of all notes are calculated with
+        array operations. Otherwise each word is converted separately by
+        ``word_to_sequential_event``. The batch conversion only knows
+        :class:`WordToSequentialEvent` itself, therefore subclasses (which
+        may convert phoneme groups differently) and structures whose
+        pitches don't fit into a
+        :class:`mutwo.dfc22_parameters.CompactNonTerminalPair` are always
+        converted word by word.
+    :param conversion_cache: Dict in which converted structures are
+        stored. It can be shared by multiple converters. Set to ``None``
+        to create a new cache for this converter.
+    :param use_cache: Set to ``False`` to convert each structure again.
+    :param cache_size: How many converted structures are kept in the
+        cache (the least recently used ones are removed first). Set to
+        ``None`` to keep all converted structures.
+
+    The conversion only depends on the content of the structure, the
+    initial pitch and pulse and the configuration of the converter,
+    therefore repeated structures (for instance the same page on
+    different readers) are only converted once. The content is
+    identified by the content digest of the structure (which also
+    covers the pitch dicts of its phoneme groups). The returned notes
+    are copies of the cached notes, so they can be mutated.
+    """
+
     def __init__(
         self,
         word_to_sequential_event: WordToSequentialEvent = WordToSequentialEvent(),
         seed: int = 100,
+        batch: bool = True,
+        conversion_cache: typing.Optional[
+            dict[tuple, core_events.SequentialEvent]
+        ] = None,
+        use_cache: bool = True,
+        cache_size: typing.Optional[int] = 2**8,
     ):
+        if conversion_cache is None:
+            conversion_cache = {}
         self._word_to_sequential_event = word_to_sequential_event
-        self._random = np.random.default_rng(seed)
+        self._batch = batch and type(word_to_sequential_event) is WordToSequentialEvent
+        self._conversion_cache = conversion_cache
+        self._use_cache = use_cache
+        self._cache_size = cache_size
+        # The quantizer itself is part of the key (quantizers are
+        # compared by identity): converters with other quantizers make
+        # other durations.
+        self._configuration_key = (
+            type(self),
+            type(word_to_sequential_event),
+            word_to_sequential_event.event_class,
+            word_to_sequential_event.duration_quantizer,
+            self._batch,
+        )
 
     def _append_word_to_sequential_event(
         self,
@@ -1054,10 +1240,10 @@ class NestedLanguageStructureToSequentialEvent(core_converters.abc.Converter):
     ):
         sequential_event_to_append_to.append(
             make_rest(
-                self._word_to_sequential_event._event_class,
+                self._word_to_sequential_event.event_class,
                 initial_pulse,
                 nested_language_structure.uncertain_rest_duration,
-                self._random,
+                self._word_to_sequential_event.duration_quantizer,
             )
         )
 
@@ -1110,15 +1296,352 @@ class NestedLanguageStructureToSequentialEvent(core_converters.abc.Converter):
                 )
             )
 
-    def convert(
+    @staticmethod
+    def _flatten(
+        nested_language_structure: dfc22_events.NestedLanguageStructure,
+        language_structure_list: list[dfc22_events.LanguageStructure],
+    ):
+        """Add phoneme groups (notes) and nested structures (rests) in order"""
+
+        if isinstance(nested_language_structure, dfc22_events.Word):
+            language_structure_list.extend(nested_language_structure)
+        elif isinstance(
+            nested_language_structure, dfc22_events.NestedLanguageStructure
+        ):
+            for language_structure in nested_language_structure:
+                NestedLanguageStructureToSequentialEvent._flatten(
+                    language_structure, language_structure_list
+                )
+            language_structure_list.append(nested_language_structure)
+        else:
+            raise NotImplementedError(
+                (
+                    f"Found unexpected object '{nested_language_structure}'"
+                    f"of type '{type(nested_language_structure)}'!"
+                )
+            )
+
+    @staticmethod
+    def _exponent_array_to_pitch(
+        pitch_class: typing.Type[music_parameters.JustIntonationPitch],
+        exponent_array: np.ndarray,
+    ) -> music_parameters.JustIntonationPitch:
+        exponent_list = exponent_array.tolist()
+        # Pitches don't save trailing zeros
+        while exponent_list and exponent_list[-1] == 0:
+            del exponent_list[-1]
+        return pitch_class(tuple(exponent_list))
+
+    def _make_batch_array_tuple(
+        self,
+        language_structure_list: list[dfc22_events.LanguageStructure],
+        initial_pitch: music_parameters.JustIntonationPitch,
+        initial_pulse: music_parameters.JustIntonationPitch,
+    ) -> typing.Optional[
+        tuple[np.ndarray, np.ndarray, list[fractions.Fraction], np.ndarray]
+    ]:
+        """Find exponents, pulses and durations of flattened structures.
+
+        Returns the exponent array (pulse exponents followed by pitch
+        exponents of each event), the pulse index of each event, the
+        pulse ratios and the durations of all events. Returns ``None``
+        if a pitch doesn't fit into the exponent array.
+        """
+
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        movement_array = np.zeros(
+            (len(language_structure_list), exponent_count * 2), dtype=int
+        )
+        uncertain_duration_array = np.zeros((len(language_structure_list), 2))
+        for index, language_structure in enumerate(language_structure_list):
+            if isinstance(language_structure, dfc22_events.PhonemeGroup):
+                non_terminal_pair = language_structure.non_terminal_pair
+                if not _is_compact(non_terminal_pair):
+                    return None
+                movement_array[index] = (
+                    dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                        non_terminal_pair
+                    ).exponent_tuple
+                )
+                uncertain_duration = language_structure.uncertain_duration
+            else:
+                uncertain_duration = language_structure.uncertain_rest_duration
+            uncertain_duration_array[index] = (
+                uncertain_duration.start,
+                uncertain_duration.end,
+            )
+
+        initial_non_terminal_pair = dfc22_parameters.NonTerminalPair(
+            consonant=initial_pulse, vowel=initial_pitch
+        )
+        if not _is_compact(initial_non_terminal_pair):
+            return None
+        # Each event has the initial pitch and pulse plus the movements
+        # of all previous phoneme groups.
+        initial_exponent_array = np.array(
+            dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                initial_non_terminal_pair
+            ).exponent_tuple
+        )
+        exponent_array = (
+            initial_exponent_array + np.cumsum(movement_array, axis=0) - movement_array
+        )
+
+        word_to_sequential_event = self._word_to_sequential_event
+        # There are only a few different pulses
+        pulse_exponent_array, pulse_index_array = np.unique(
+            exponent_array[:, :exponent_count], axis=0, return_inverse=True
+        )
+        pulse_ratio_list = [
+            self._exponent_array_to_pitch(type(initial_pulse), pulse_exponents).ratio
+            for pulse_exponents in pulse_exponent_array
+        ]
+        pulse_index_array = pulse_index_array.reshape(-1)
+        duration_array = word_to_sequential_event.duration_quantizer.get_duration_array(
+            np.array([float(pulse_ratio) for pulse_ratio in pulse_ratio_list])[
+                pulse_index_array
+            ],
+            uncertain_duration_array[:, 0],
+            uncertain_duration_array[:, 1],
+        )
+        return exponent_array, pulse_index_array, pulse_ratio_list, duration_array
+
+    def _convert_in_batch(
         self,
         nested_language_structure: dfc22_events.NestedLanguageStructure,
-        initial_pitch: typing.Optional[music_parameters.JustIntonationPitch] = None,
-        initial_pulse: typing.Optional[music_parameters.JustIntonationPitch] = None,
+        initial_pitch: music_parameters.JustIntonationPitch,
+        initial_pulse: music_parameters.JustIntonationPitch,
+    ) -> typing.Optional[core_events.SequentialEvent]:
+        language_structure_list = []
+        self._flatten(nested_language_structure, language_structure_list)
+        if not language_structure_list:
+            return core_events.SequentialEvent([])
+
+        batch_array_tuple = self._make_batch_array_tuple(
+            language_structure_list, initial_pitch, initial_pulse
+        )
+        if batch_array_tuple is None:
+            return None
+        (
+            exponent_array,
+            pulse_index_array,
+            pulse_ratio_list,
+            duration_array,
+        ) = batch_array_tuple
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        word_to_sequential_event = self._word_to_sequential_event
+        event_class = word_to_sequential_event.event_class
+        event_list = []
+        for language_structure, pitch_exponent_array, pulse_index, duration in zip(
+            language_structure_list,
+            exponent_array[:, exponent_count:],
+            pulse_index_array.tolist(),
+            duration_array.tolist(),
+        ):
+            if isinstance(language_structure, dfc22_events.PhonemeGroup):
+                keyword_argument_dict = word_to_sequential_event.phoneme_group_to_event_specific_keyword_argument_dict(
+                    language_structure
+                )
+                keyword_argument_dict.update(
+                    {
+                        "pitch_list": [
+                            self._exponent_array_to_pitch(
+                                type(initial_pitch), pitch_exponent_array
+                            )
+                        ],
+                        "duration": duration,
+                        "pulse": pulse_ratio_list[pulse_index],
+                    }
+                )
+                event_list.append(event_class(**keyword_argument_dict))
+            else:
+                event_list.append(_make_rest(event_class, duration))
+        return core_events.SequentialEvent(event_list)
+
+    def _convert_without_cache(
+        self,
+        nested_language_structure: dfc22_events.NestedLanguageStructure,
+        initial_pitch: music_parameters.JustIntonationPitch,
+        initial_pulse: music_parameters.JustIntonationPitch,
     ) -> core_events.SequentialEvent:
+        if self._batch:
+            sequential_event = self._convert_in_batch(
+                nested_language_structure, initial_pitch, initial_pulse
+            )
+            if sequential_event is not None:
+                return sequential_event
 
         sequential_event = core_events.SequentialEvent([])
         self._convert(
             sequential_event, nested_language_structure, initial_pitch, initial_pulse
         )
         return sequential_event
+
+    def get_duration(
+        self,
+        nested_language_structure: dfc22_events.NestedLanguageStructure,
+        initial_pitch: typing.Optional[music_parameters.JustIntonationPitch] = None,
+        initial_pulse: typing.Optional[music_parameters.JustIntonationPitch] = None,
+    ) -> float:
+        """Duration of the converted structure.
+
+        If the structure can be converted in batch, the durations of all
+        notes and rests are quantized like in :meth:`convert` and summed
+        up (without making any notes). Otherwise the structure is
+        converted.
+        """
+
+        if initial_pitch is None:
+            initial_pitch = nested_language_structure.initial_non_terminal_pair.vowel
+        if initial_pulse is None:
+            initial_pulse = (
+                nested_language_structure.initial_non_terminal_pair.consonant
+            )
+
+        if self._batch:
+            language_structure_list = []
+            self._flatten(nested_language_structure, language_structure_list)
+            if not language_structure_list:
+                return 0
+            batch_array_tuple = self._make_batch_array_tuple(
+                language_structure_list, initial_pitch, initial_pulse
+            )
+            if batch_array_tuple is not None:
+                *_, duration_array = batch_array_tuple
+                return sum(duration_array.tolist())
+        return float(
+            self.convert(
+                nested_language_structure, initial_pitch, initial_pulse
+            ).duration
+        )
+
+    def convert(
+        self,
+        nested_language_structure: dfc22_events.NestedLanguageStructure,
+        initial_pitch: typing.Optional[music_parameters.JustIntonationPitch] = None,
+        initial_pulse: typing.Optional[music_parameters.JustIntonationPitch] = None,
+    ) -> core_events.SequentialEvent:
+        if initial_pitch is None:
+            initial_pitch = nested_language_structure.initial_non_terminal_pair.vowel
+        if initial_pulse is None:
+            initial_pulse = nested_language_structure.initial_non_terminal_pair.consonant
+
+        if not self._use_cache:
+            return self._convert_without_cache(
+                nested_language_structure, initial_pitch, initial_pulse
+            )
+
+        initial_non_terminal_pair = dfc22_parameters.NonTerminalPair(
+            consonant=initial_pulse, vowel=initial_pitch
+        )
+        if _is_compact(initial_non_terminal_pair):
+            # Compact pairs have a cached hash
+            initial_non_terminal_pair = (
+                dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                    initial_non_terminal_pair
+                )
+            )
+        key = (
+            nested_language_structure.content_digest,
+            initial_non_terminal_pair,
+            self._configuration_key,
+        )
+        conversion_cache = self._conversion_cache
+        try:
+            # Dicts keep their insertion order, therefore the most
+            # recently used structure is moved to the end.
+            cached_sequential_event = conversion_cache.pop(key)
+            conversion_cache[key] = cached_sequential_event
+        except KeyError:
+            cached_sequential_event = self._convert_without_cache(
+                nested_language_structure, initial_pitch, initial_pulse
+            )
+            conversion_cache[key] = cached_sequential_event
+            if self._cache_size is not None:
+                while len(conversion_cache) > self._cache_size:
+                    del conversion_cache[next(iter(conversion_cache))]
+        # The cache keeps the converted notes and only returns copies,
+        # because the returned notes may be mutated (each conversion
+        # copies the notes only once).
+        return copy.deepcopy(cached_sequential_event)
+
+
+class PageCatalogToFile(core_converters.abc.Converter):
+    """Write a page catalog incrementally to an open file.
+
+    :param file_format: Either ``"text"`` (readable overview with the
+        XSAMPA text of each page) or ``"jsonl"`` (one JSON object per
+        page and line).
+
+    Pages are written one after another, so the complete output never
+    needs to be kept in memory.
+    """
+
+    _file_format_tuple = ("text", "jsonl")
+
+    def __init__(self, file_format: str = "text"):
+        if file_format not in self._file_format_tuple:
+            raise Exception(
+                f"Found unknown file format '{file_format}'. "
+                f"Supported file formats are: {self._file_format_tuple}."
+            )
+        self._file_format = file_format
+
+    @staticmethod
+    def _get_sentence_count(page: dfc22_events.Page) -> int:
+        return sum(len(paragraph) for paragraph in page)
+
+    @staticmethod
+    def _get_word_count(page: dfc22_events.Page) -> int:
+        return sum(len(sentence) for paragraph in page for sentence in paragraph)
+
+    def _write_text(
+        self,
+        non_terminal_pair: dfc22_parameters.NonTerminalPair,
+        page_tuple: tuple[dfc22_events.Page, ...],
+        file: typing.TextIO,
+    ):
+        file.write(f"{non_terminal_pair}\n")
+        file.write(f"{[page.duration for page in page_tuple]}\n")
+        file.write(f"{[len(page) for page in page_tuple]}\n")
+        for page in page_tuple:
+            file.write(
+                f"NEW PAGE. It has: {len(page)} paragraphs, "
+                f"{self._get_sentence_count(page)} sentences, "
+                f"{self._get_word_count(page)} words.\n\n"
+            )
+            file.writelines(page.iterate_xsampa_text())
+            file.write("\n\n")
+        file.write("\n")
+
+    def _write_jsonl(
+        self,
+        non_terminal_pair: dfc22_parameters.NonTerminalPair,
+        page_tuple: tuple[dfc22_events.Page, ...],
+        file: typing.TextIO,
+    ):
+        for page_index, page in enumerate(page_tuple):
+            file.write(
+                json.dumps(
+                    {
+                        "consonant": list(non_terminal_pair.consonant.exponent_tuple),
+                        "vowel": list(non_terminal_pair.vowel.exponent_tuple),
+                        "page_index": page_index,
+                        "duration": float(page.duration),
+                        "paragraph_count": len(page),
+                        "sentence_count": self._get_sentence_count(page),
+                        "word_count": self._get_word_count(page),
+                        "xsampa_text": page.as_xsampa_text,
+                    }
+                )
+            )
+            file.write("\n")
+
+    def convert(self, page_catalog_to_convert: PageCatalog, file: typing.TextIO):
+        write = getattr(self, f"_write_{self._file_format}")
+        for non_terminal_pair, page_tuple in page_catalog_to_convert.items():
+            write(non_terminal_pair, page_tuple, file)
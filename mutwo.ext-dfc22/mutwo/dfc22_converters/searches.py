@@ -0,0 +1,600 @@
+"""Search page combinations for the movements of a sequential unisono event"""
+
+import abc
+import concurrent.futures
+import itertools
+import math
+import os
+import random
+import time
+import typing
+
+import numpy as np
+
+from mutwo import core_converters
+from mutwo import dfc22_converters
+from mutwo import dfc22_events
+
+
+__all__ = (
+    "PageCombinationScore",
+    "PageRepetitionScore",
+    "HarmonicityScore",
+    "PageCombinationTuplePerMovementToPageCombinationIndexTuple",
+)
+
+
+PageCombinationTuplePerMovement = tuple[
+    tuple[tuple[dfc22_events.Page, ...], ...], ...
+]
+
+
+class PageCombinationScore(abc.ABC):
+    """Rate the chosen page combinations of all movements (higher = better).
+
+    The score is the sum of the local scores of each movement and
+    the pair scores of all interacting movements. Because of this
+    structure the score of a neighbour solution (where only the page
+    combination of one movement changed) can be calculated by only
+    re-evaluating the terms of the changed movement.
+    """
+
+    def prepare(
+        self,
+        sequential_unisono_event: dfc22_events.SequentialUnisonoEvent,
+        movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
+        page_combination_tuple_per_movement: PageCombinationTuplePerMovement,
+        unisono_event_duration_tuple: tuple[float, ...],
+    ):
+        """Called once before the search starts (precalculate data here).
+
+        ``unisono_event_duration_tuple`` contains the expected durations
+        of the unisono events (they still change after the page
+        combinations have been picked).
+        """
+
+        self._sequential_unisono_event = sequential_unisono_event
+        self._movement_tuple = movement_tuple
+        self._page_combination_tuple_per_movement = (
+            page_combination_tuple_per_movement
+        )
+        self._unisono_event_duration_tuple = unisono_event_duration_tuple
+
+    def get_local_score(
+        self, movement_index: int, page_combination_index: int
+    ) -> float:
+        return 0
+
+    def get_movement_index_pair_tuple(self) -> tuple[tuple[int, int], ...]:
+        """All pairs of movements which have a pair score"""
+
+        return tuple([])
+
+    def get_pair_score(
+        self,
+        movement_index0: int,
+        page_combination_index0: int,
+        movement_index1: int,
+        page_combination_index1: int,
+    ) -> float:
+        return 0
+
+
+class PageRepetitionScore(PageCombinationScore):
+    """Penalize equal pages in different movements"""
+
+    def prepare(self, *args, **kwargs):
+        super().prepare(*args, **kwargs)
+        self._page_digest_set_tuple_per_movement = tuple(
+            tuple(
+                frozenset(page.content_digest for page in page_combination)
+                for page_combination in page_combination_tuple
+            )
+            for page_combination_tuple in self._page_combination_tuple_per_movement
+        )
+
+    def get_movement_index_pair_tuple(self) -> tuple[tuple[int, int], ...]:
+        return tuple(itertools.combinations(range(len(self._movement_tuple)), 2))
+
+    def get_pair_score(
+        self,
+        movement_index0: int,
+        page_combination_index0: int,
+        movement_index1: int,
+        page_combination_index1: int,
+    ) -> float:
+        return -len(
+            self._page_digest_set_tuple_per_movement[movement_index0][
+                page_combination_index0
+            ]
+            & self._page_digest_set_tuple_per_movement[movement_index1][
+                page_combination_index1
+            ]
+        )
+
+
+class HarmonicityScore(PageCombinationScore):
+    """Rate how harmonic the pitches and pulses of simultaneous readers are.
+
+    The pages are placed in the same way as in
+    :class:`SequentialUnisonoEventToSimultaneousEvent`, but with the
+    expected durations of the unisono events. The local score of a
+    movement is its harmonicity with all unisono pages of other readers
+    and the pair score is the harmonicity between two movements of
+    different readers which overlap in time.
+    """
+
+    def __init__(
+        self,
+        page_to_trajectory: typing.Optional[
+            dfc22_converters.PageToTrajectory
+        ] = None,
+        trajectory_pair_to_harmonicity: typing.Optional[
+            dfc22_converters.TrajectoryPairToHarmonicity
+        ] = None,
+    ):
+        if page_to_trajectory is None:
+            page_to_trajectory = dfc22_converters.PageToTrajectory()
+        if trajectory_pair_to_harmonicity is None:
+            trajectory_pair_to_harmonicity = (
+                dfc22_converters.TrajectoryPairToHarmonicity()
+            )
+        self._page_to_trajectory = page_to_trajectory
+        self._trajectory_pair_to_harmonicity = trajectory_pair_to_harmonicity
+
+    def prepare(self, *args, **kwargs):
+        super().prepare(*args, **kwargs)
+        self._duration = float(sum(self._unisono_event_duration_tuple))
+        unisono_start_time_array = np.concatenate(
+            ([0], np.cumsum(self._unisono_event_duration_tuple, dtype=float)[:-1])
+        )
+        unisono_stop_time_array = unisono_start_time_array + np.array(
+            [
+                float(unisono_event.page.duration)
+                for unisono_event in self._sequential_unisono_event
+            ]
+        )
+        self._unisono_trajectory_tuple = tuple(
+            self._page_to_trajectory(unisono_event.page)
+            .move(start_time, unisono_event.page.initial_non_terminal_pair)
+            .wrap(self._duration)
+            for start_time, unisono_event in zip(
+                unisono_start_time_array.tolist(), self._sequential_unisono_event
+            )
+        )
+        # Time range of each movement (start time, duration)
+        self._movement_start_time_list, self._movement_duration_list = [], []
+        for movement, page_combination_tuple in zip(
+            self._movement_tuple, self._page_combination_tuple_per_movement
+        ):
+            start_time = unisono_stop_time_array[movement.unisono_event_left_index]
+            self._movement_start_time_list.append(float(start_time))
+            self._movement_duration_list.append(
+                max(
+                    (
+                        unisono_start_time_array[movement.unisono_event_right_index]
+                        - start_time
+                    )
+                    % self._duration,
+                    max(
+                        sum(float(page.duration) for page in page_combination)
+                        for page_combination in page_combination_tuple
+                    ),
+                )
+            )
+        self._movement_index_and_page_combination_index_to_trajectory = {}
+
+    def _is_overlapping(
+        self, start_time0: float, duration0: float, start_time1: float, duration1: float
+    ) -> bool:
+        return ((start_time1 - start_time0) % self._duration) < duration0 or (
+            (start_time0 - start_time1) % self._duration
+        ) < duration1
+
+    def _get_trajectory(
+        self, movement_index: int, page_combination_index: int
+    ) -> dfc22_converters.Trajectory:
+        key = (movement_index, page_combination_index)
+        try:
+            return self._movement_index_and_page_combination_index_to_trajectory[key]
+        except KeyError:
+            pass
+        movement = self._movement_tuple[movement_index]
+        page_combination = self._page_combination_tuple_per_movement[movement_index][
+            page_combination_index
+        ]
+        # Distribute the rests between the pages in the same way as
+        # 'SequentialUnisonoEventToSimultaneousEvent'.
+        rest_duration = max(
+            self._movement_duration_list[movement_index]
+            - sum(float(page.duration) for page in page_combination),
+            0,
+        )
+        rest_part_duration = rest_duration / (len(page_combination) + 1)
+        start_time = self._movement_start_time_list[movement_index] + rest_part_duration
+        initial_non_terminal_pair = movement.unisono_event_left.right_non_terminal_pair
+        trajectory_list = []
+        for page in page_combination:
+            trajectory_list.append(
+                self._page_to_trajectory(page).move(
+                    start_time, initial_non_terminal_pair
+                )
+            )
+            initial_non_terminal_pair = (
+                initial_non_terminal_pair + page.non_terminal_pair
+            )
+            start_time += float(page.duration) + rest_part_duration
+        trajectory = self._movement_index_and_page_combination_index_to_trajectory[
+            key
+        ] = dfc22_converters.Trajectory.concatenate(trajectory_list).wrap(
+            self._duration
+        )
+        return trajectory
+
+    def get_local_score(
+        self, movement_index: int, page_combination_index: int
+    ) -> float:
+        movement = self._movement_tuple[movement_index]
+        trajectory = self._get_trajectory(movement_index, page_combination_index)
+        local_score = 0
+        for unisono_event, unisono_trajectory in zip(
+            self._sequential_unisono_event, self._unisono_trajectory_tuple
+        ):
+            if movement.reader not in unisono_event.reader_tuple:
+                # Each reader of the unisono event builds its own pair
+                # with the moving reader.
+                local_score += len(
+                    unisono_event.reader_tuple
+                ) * self._trajectory_pair_to_harmonicity(trajectory, unisono_trajectory)
+        return local_score
+
+    def get_movement_index_pair_tuple(self) -> tuple[tuple[int, int], ...]:
+        return tuple(
+            (movement_index0, movement_index1)
+            for movement_index0, movement_index1 in itertools.combinations(
+                range(len(self._movement_tuple)), 2
+            )
+            if self._movement_tuple[movement_index0].reader
+            != self._movement_tuple[movement_index1].reader
+            and self._is_overlapping(
+                self._movement_start_time_list[movement_index0],
+                self._movement_duration_list[movement_index0],
+                self._movement_start_time_list[movement_index1],
+                self._movement_duration_list[movement_index1],
+            )
+        )
+
+    def get_pair_score(
+        self,
+        movement_index0: int,
+        page_combination_index0: int,
+        movement_index1: int,
+        page_combination_index1: int,
+    ) -> float:
+        return self._trajectory_pair_to_harmonicity(
+            self._get_trajectory(movement_index0, page_combination_index0),
+            self._get_trajectory(movement_index1, page_combination_index1),
+        )
+
+
+class _MemoizedPageCombinationScore(object):
+    """Reuse local and pair scores which have already been calculated"""
+
+    def __init__(self, page_combination_score: PageCombinationScore, movement_count):
+        self._page_combination_score = page_combination_score
+        self._local_score_dict = {}
+        self._pair_score_dict = {}
+        neighbour_list_per_movement = tuple([] for _ in range(movement_count))
+        for (
+            movement_index0,
+            movement_index1,
+        ) in page_combination_score.get_movement_index_pair_tuple():
+            neighbour_list_per_movement[movement_index0].append(movement_index1)
+            neighbour_list_per_movement[movement_index1].append(movement_index0)
+        self._neighbour_tuple_per_movement = tuple(
+            tuple(sorted(neighbour_list)) for neighbour_list in neighbour_list_per_movement
+        )
+
+    def get_local_score(self, movement_index: int, page_combination_index: int) -> float:
+        key = (movement_index, page_combination_index)
+        try:
+            return self._local_score_dict[key]
+        except KeyError:
+            local_score = self._local_score_dict[
+                key
+            ] = self._page_combination_score.get_local_score(*key)
+            return local_score
+
+    def get_pair_score(
+        self,
+        movement_index0: int,
+        page_combination_index0: int,
+        movement_index1: int,
+        page_combination_index1: int,
+    ) -> float:
+        if movement_index0 > movement_index1:
+            movement_index0, movement_index1 = movement_index1, movement_index0
+            page_combination_index0, page_combination_index1 = (
+                page_combination_index1,
+                page_combination_index0,
+            )
+        key = (
+            movement_index0,
+            page_combination_index0,
+            movement_index1,
+            page_combination_index1,
+        )
+        try:
+            return self._pair_score_dict[key]
+        except KeyError:
+            pair_score = self._pair_score_dict[
+                key
+            ] = self._page_combination_score.get_pair_score(*key)
+            return pair_score
+
+    def get_score(self, page_combination_index_list: list[int]) -> float:
+        score = 0
+        for movement_index, page_combination_index in enumerate(
+            page_combination_index_list
+        ):
+            score += self.get_local_score(movement_index, page_combination_index)
+            for neighbour_movement_index in self._neighbour_tuple_per_movement[
+                movement_index
+            ]:
+                if neighbour_movement_index > movement_index:
+                    score += self.get_pair_score(
+                        movement_index,
+                        page_combination_index,
+                        neighbour_movement_index,
+                        page_combination_index_list[neighbour_movement_index],
+                    )
+        return score
+
+    def get_delta(
+        self,
+        page_combination_index_list: list[int],
+        movement_index: int,
+        new_page_combination_index: int,
+    ) -> float:
+        """Score difference if one movement gets a new page combination"""
+
+        old_page_combination_index = page_combination_index_list[movement_index]
+        delta = self.get_local_score(
+            movement_index, new_page_combination_index
+        ) - self.get_local_score(movement_index, old_page_combination_index)
+        for neighbour_movement_index in self._neighbour_tuple_per_movement[
+            movement_index
+        ]:
+            neighbour_page_combination_index = page_combination_index_list[
+                neighbour_movement_index
+            ]
+            delta += self.get_pair_score(
+                movement_index,
+                new_page_combination_index,
+                neighbour_movement_index,
+                neighbour_page_combination_index,
+            ) - self.get_pair_score(
+                movement_index,
+                old_page_combination_index,
+                neighbour_movement_index,
+                neighbour_page_combination_index,
+            )
+        return delta
+
+
+def _anneal(
+    page_combination_score: PageCombinationScore,
+    sequential_unisono_event: dfc22_events.SequentialUnisonoEvent,
+    movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
+    page_combination_tuple_per_movement: PageCombinationTuplePerMovement,
+    unisono_event_duration_tuple: tuple[float, ...],
+    seed: int,
+    chain_index: int,
+    iteration_count: int,
+    time_budget: typing.Optional[float],
+    patience: typing.Optional[int],
+    initial_temperature: float,
+    final_temperature: float,
+) -> tuple[float, tuple[int, ...]]:
+    """Run one simulated annealing chain (also called in worker processes).
+
+    The first chain starts with the first page combination of each
+    movement, all others with random page combinations. The random
+    numbers of each chain only depend on ``seed`` and ``chain_index``.
+    """
+
+    start_time = time.monotonic()
+    # String seeds are hashed in a stable way
+    random_generator = random.Random(f"{seed}:{chain_index}")
+    page_combination_score.prepare(
+        sequential_unisono_event,
+        movement_tuple,
+        page_combination_tuple_per_movement,
+        unisono_event_duration_tuple,
+    )
+    memoized_page_combination_score = _MemoizedPageCombinationScore(
+        page_combination_score, len(movement_tuple)
+    )
+    page_combination_count_tuple = tuple(
+        len(page_combination_tuple)
+        for page_combination_tuple in page_combination_tuple_per_movement
+    )
+    if chain_index > 0:
+        page_combination_index_list = [
+            random_generator.randrange(page_combination_count)
+            for page_combination_count in page_combination_count_tuple
+        ]
+    else:
+        page_combination_index_list = [0 for _ in page_combination_count_tuple]
+    # Only movements with more than one page combination can change
+    variable_movement_index_tuple = tuple(
+        movement_index
+        for movement_index, page_combination_count in enumerate(
+            page_combination_count_tuple
+        )
+        if page_combination_count > 1
+    )
+
+    score = memoized_page_combination_score.get_score(page_combination_index_list)
+    best_score, best_page_combination_index_tuple = score, tuple(
+        page_combination_index_list
+    )
+    if not variable_movement_index_tuple:
+        return best_score, best_page_combination_index_tuple
+
+    temperature_factor = (final_temperature / initial_temperature) ** (
+        1 / max(iteration_count, 1)
+    )
+    temperature = initial_temperature
+    last_improvement_iteration = 0
+    for iteration in range(iteration_count):
+        if (
+            time_budget is not None
+            and iteration % 256 == 0
+            and time.monotonic() - start_time > time_budget
+        ):
+            break
+        if patience is not None and iteration - last_improvement_iteration > patience:
+            break
+        movement_index = random_generator.choice(variable_movement_index_tuple)
+        new_page_combination_index = random_generator.randrange(
+            page_combination_count_tuple[movement_index] - 1
+        )
+        if new_page_combination_index >= page_combination_index_list[movement_index]:
+            new_page_combination_index += 1
+        delta = memoized_page_combination_score.get_delta(
+            page_combination_index_list, movement_index, new_page_combination_index
+        )
+        if delta >= 0 or random_generator.random() < math.exp(delta / temperature):
+            page_combination_index_list[movement_index] = new_page_combination_index
+            score += delta
+            if score > best_score:
+                best_score, best_page_combination_index_tuple = score, tuple(
+                    page_combination_index_list
+                )
+                last_improvement_iteration = iteration
+        temperature *= temperature_factor
+    return best_score, best_page_combination_index_tuple
+
+
+class PageCombinationTuplePerMovementToPageCombinationIndexTuple(
+    core_converters.abc.Converter
+):
+    """Pick one page combination for each movement (simulated annealing).
+
+    :param page_combination_score: Rates solutions. Default to
+        :class:`HarmonicityScore`.
+    :param iteration_count: How many neighbours are evaluated per chain.
+    :param time_budget: Maximum duration in seconds for each chain. If
+        set the result can depend on the speed of the machine.
+    :param chain_count: How many chains are run.
+    :param process_count: How many chains run in parallel. The process
+        count doesn't change the result.
+    :param seed: The random numbers of each chain depend on the seed
+        and the index of the chain. The first chain starts with the
+        first page combination of each movement, all others with random
+        page combinations.
+    :param patience: Stop a chain if it didn't find a better solution
+        after this many iterations.
+
+    The best solution of all chains is returned (if multiple chains
+    found equally good solutions the one with the smallest chain index
+    wins).
+    """
+
+    def __init__(
+        self,
+        page_combination_score: typing.Optional[PageCombinationScore] = None,
+        iteration_count: typing.Optional[int] = None,
+        time_budget: typing.Optional[float] = None,
+        chain_count: typing.Optional[int] = None,
+        process_count: typing.Optional[int] = None,
+        seed: typing.Optional[int] = None,
+        patience: typing.Optional[int] = None,
+        initial_temperature: float = 1,
+        final_temperature: float = 0.001,
+    ):
+        if page_combination_score is None:
+            page_combination_score = HarmonicityScore()
+        if iteration_count is None:
+            iteration_count = (
+                dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_SEARCH_ITERATION_COUNT
+            )
+        if time_budget is None:
+            time_budget = (
+                dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_SEARCH_TIME_BUDGET
+            )
+        if chain_count is None:
+            chain_count = (
+                dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_SEARCH_CHAIN_COUNT
+            )
+        if process_count is None:
+            process_count = (
+                dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_SEARCH_PROCESS_COUNT
+            )
+        if process_count is None:
+            process_count = os.cpu_count() or 1
+        if seed is None:
+            seed = dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_SEARCH_SEED
+        if patience is None:
+            patience = (
+                dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_SEARCH_PATIENCE
+            )
+        self._page_combination_score = page_combination_score
+        self._iteration_count = iteration_count
+        self._time_budget = time_budget
+        self._chain_count = chain_count
+        self._process_count = min(process_count, chain_count)
+        self._seed = seed
+        self._patience = patience
+        self._initial_temperature = initial_temperature
+        self._final_temperature = final_temperature
+
+    def convert(
+        self,
+        sequential_unisono_event: dfc22_events.SequentialUnisonoEvent,
+        movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
+        page_combination_tuple_per_movement: PageCombinationTuplePerMovement,
+        unisono_event_duration_tuple: typing.Optional[tuple[float, ...]] = None,
+    ) -> tuple[int, ...]:
+        if unisono_event_duration_tuple is None:
+            unisono_event_duration_tuple = tuple(
+                unisono_event.duration for unisono_event in sequential_unisono_event
+            )
+        argument_tuple_per_chain = tuple(
+            (
+                self._page_combination_score,
+                sequential_unisono_event,
+                movement_tuple,
+                page_combination_tuple_per_movement,
+                unisono_event_duration_tuple,
+                self._seed,
+                chain_index,
+                self._iteration_count,
+                self._time_budget,
+                self._patience,
+                self._initial_temperature,
+                self._final_temperature,
+            )
+            for chain_index in range(self._chain_count)
+        )
+        if self._process_count > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                self._process_count
+            ) as executor:
+                result_list = [
+                    future.result()
+                    for future in [
+                        executor.submit(_anneal, *argument_tuple)
+                        for argument_tuple in argument_tuple_per_chain
+                    ]
+                ]
+        else:
+            result_list = [
+                _anneal(*argument_tuple) for argument_tuple in argument_tuple_per_chain
+            ]
+        # 'max' returns the first of equally good solutions
+        _, page_combination_index_tuple = max(
+            result_list, key=lambda score_and_solution: score_and_solution[0]
+        )
+        return page_combination_index_tuple
@@ -0,0 +1,441 @@
+"""Build and query the timelines of readers"""
+
+import concurrent.futures
+import copy
+import typing
+
+import numpy as np
+import progressbar
+
+from mutwo import core_constants
+from mutwo import core_converters
+from mutwo import core_events
+from mutwo import dfc22_converters
+from mutwo import dfc22_events
+
+
+__all__ = (
+    "ReaderTimelineBuilder",
+    "ReaderTimelineIndex",
+    "SimultaneousEventWithPagesToWindowedSimultaneousEventWithNotes",
+    "SimultaneousEventWithPagesToSimultaneousEventWithNotes",
+)
+
+
+class ReaderTimelineBuilder(object):
+    """Collect events with their start times and build all timelines at once.
+
+    :param reader_count: How many readers (and timelines) exist.
+    :param duration: The minimal duration of each timeline. The space
+        between the placed events is filled with rests.
+
+    This replaces consecutive calls of ``SequentialEvent.squash_in``
+    (each of them has to split and re-index the complete sequential
+    event). Placed events must not overlap.
+    """
+
+    def __init__(self, reader_count: int, duration: core_constants.DurationType):
+        self._duration = duration
+        self._placement_list_per_reader = tuple([] for _ in range(reader_count))
+
+    def add_event(
+        self,
+        reader_index: int,
+        start_time: core_constants.DurationType,
+        event: core_events.abc.Event,
+    ):
+        placement_list = self._placement_list_per_reader[reader_index]
+        placement_list.append((start_time, len(placement_list), event))
+
+    def _build_sequential_event(
+        self,
+        reader_index: int,
+        placement_list: list[
+            tuple[core_constants.DurationType, int, core_events.abc.Event]
+        ],
+    ) -> core_events.SequentialEvent:
+        event_list = []
+        stop_time = 0
+        for start_time, _, event in sorted(
+            placement_list, key=lambda placement: placement[:2]
+        ):
+            # Ignore rounding errors of float start times
+            if stop_time - start_time > 1e-9:
+                raise Exception(
+                    f"Found overlapping events for reader '{reader_index}': event "
+                    f"which starts at '{start_time}' begins before the previous "
+                    f"event stops at '{stop_time}'."
+                )
+            if start_time > stop_time:
+                event_list.append(core_events.SimpleEvent(start_time - stop_time))
+            event_list.append(event)
+            stop_time = start_time + event.duration
+        if stop_time < self._duration:
+            event_list.append(core_events.SimpleEvent(self._duration - stop_time))
+        return core_events.SequentialEvent(event_list)
+
+    def build(self) -> core_events.SimultaneousEvent:
+        return core_events.SimultaneousEvent(
+            [
+                self._build_sequential_event(reader_index, placement_list)
+                for reader_index, placement_list in enumerate(
+                    self._placement_list_per_reader
+                )
+            ]
+        )
+
+
+class ReaderTimelineIndex(object):
+    """Find the events of readers at given times.
+
+    :param simultaneous_event: One sequential event for each reader.
+    :param event_type: If set, only events of this type are indexed
+        (for instance :class:`mutwo.dfc22_events.Page`). Default to
+        ``None`` (all events).
+
+    The start and stop times of each timeline are stored in sorted
+    arrays, so that point and range queries only need a binary search.
+    The index doesn't notice later changes of the simultaneous event.
+    """
+
+    def __init__(
+        self,
+        simultaneous_event: core_events.SimultaneousEvent,
+        event_type: typing.Optional[typing.Type] = None,
+    ):
+        self._start_time_array_list = []
+        self._stop_time_array_list = []
+        self._event_tuple_list = []
+        for sequential_event in simultaneous_event:
+            start_time_list, stop_time_list, event_list = [], [], []
+            for absolute_time, event in zip(
+                sequential_event.absolute_time_tuple, sequential_event
+            ):
+                if event_type is None or isinstance(event, event_type):
+                    start_time_list.append(float(absolute_time))
+                    stop_time_list.append(float(absolute_time + event.duration))
+                    event_list.append(event)
+            self._start_time_array_list.append(np.array(start_time_list, dtype=float))
+            self._stop_time_array_list.append(np.array(stop_time_list, dtype=float))
+            self._event_tuple_list.append(tuple(event_list))
+
+    @property
+    def reader_count(self) -> int:
+        return len(self._event_tuple_list)
+
+    def get_placement_tuple(
+        self, reader_index: int
+    ) -> tuple[tuple[float, core_events.abc.Event], ...]:
+        """All indexed (start time, event) pairs of a reader"""
+
+        return tuple(
+            zip(
+                self._start_time_array_list[reader_index].tolist(),
+                self._event_tuple_list[reader_index],
+            )
+        )
+
+    def get_event_at(
+        self, reader_index: int, time: float
+    ) -> typing.Optional[core_events.abc.Event]:
+        """Event of a reader which sounds at ``time`` (or ``None``)"""
+
+        event_index = (
+            int(
+                np.searchsorted(
+                    self._start_time_array_list[reader_index], time, side="right"
+                )
+            )
+            - 1
+        )
+        if (
+            event_index >= 0
+            and time < self._stop_time_array_list[reader_index][event_index]
+        ):
+            return self._event_tuple_list[reader_index][event_index]
+        return None
+
+    def get_event_tuple_at(
+        self, time: float
+    ) -> tuple[typing.Optional[core_events.abc.Event], ...]:
+        """Event of each reader which sounds at ``time``"""
+
+        return tuple(
+            self.get_event_at(reader_index, time)
+            for reader_index in range(self.reader_count)
+        )
+
+    def get_overlapping_placement_tuple(
+        self, reader_index: int, start_time: float, stop_time: float
+    ) -> tuple[tuple[float, core_events.abc.Event], ...]:
+        """All (start time, event) pairs of a reader which overlap with the
+        range from ``start_time`` to ``stop_time``"""
+
+        # Events in a sequential event don't overlap, therefore the stop
+        # times are sorted, too.
+        first_event_index = np.searchsorted(
+            self._stop_time_array_list[reader_index], start_time, side="right"
+        )
+        last_event_index = np.searchsorted(
+            self._start_time_array_list[reader_index], stop_time, side="left"
+        )
+        return tuple(
+            zip(
+                self._start_time_array_list[reader_index][
+                    first_event_index:last_event_index
+                ].tolist(),
+                self._event_tuple_list[reader_index][
+                    first_event_index:last_event_index
+                ],
+            )
+        )
+
+
+class SimultaneousEventWithPagesToWindowedSimultaneousEventWithNotes(
+    core_converters.abc.Converter
+):
+    """Convert only the pages whose notes overlap with a time window.
+
+    :param page_to_sequential_event: Converts one page to a sequential
+        event with notes. Default to
+        :class:`NestedLanguageStructureToSequentialEvent`.
+    :param page_to_duration: Returns the duration of the converted page
+        (the duration of its notes). Default to
+        :meth:`NestedLanguageStructureToSequentialEvent.get_duration` if
+        ``page_to_sequential_event`` is an instance of this class and
+        otherwise to the duration of the converted page.
+
+    The window refers to the time of the notes (like in the result of
+    :class:`SimultaneousEventWithPagesToSimultaneousEventWithNotes`):
+    the notes of a page usually don't have the same duration as the
+    page, therefore each timeline is indexed by the durations of the
+    converted pages before the window. Only the pages whose notes
+    overlap with the window are converted (with their own initial
+    pitch and pulse) and cut at the borders of the window. All
+    timelines of the result have exactly the duration of the window.
+    """
+
+    def __init__(
+        self,
+        page_to_sequential_event: typing.Optional[
+            typing.Callable[[dfc22_events.Page], core_events.SequentialEvent]
+        ] = None,
+        page_to_duration: typing.Optional[
+            typing.Callable[[dfc22_events.Page], core_constants.DurationType]
+        ] = None,
+    ):
+        if page_to_sequential_event is None:
+            page_to_sequential_event = (
+                dfc22_converters.NestedLanguageStructureToSequentialEvent()
+            )
+        if page_to_duration is None:
+            if isinstance(
+                page_to_sequential_event,
+                dfc22_converters.NestedLanguageStructureToSequentialEvent,
+            ):
+                page_to_duration = page_to_sequential_event.get_duration
+            else:
+
+                def page_to_duration(page: dfc22_events.Page) -> float:
+                    return page_to_sequential_event(page).duration
+
+        self._page_to_sequential_event = page_to_sequential_event
+        self._page_to_duration = page_to_duration
+
+    def _add_sequential_event(
+        self,
+        reader_timeline_builder: ReaderTimelineBuilder,
+        reader_index: int,
+        sequential_event_with_pages: core_events.SequentialEvent,
+        start_time: float,
+        stop_time: float,
+    ):
+        event_start_time = 0
+        for event in sequential_event_with_pages:
+            if event_start_time >= stop_time:
+                break
+            if isinstance(event, dfc22_events.Page):
+                event_duration = float(self._page_to_duration(event))
+                event_stop_time = event_start_time + event_duration
+                if event_stop_time > start_time:
+                    sequential_event_with_notes = self._page_to_sequential_event(event)
+                    sequential_event_with_notes.cut_out(
+                        max(start_time - event_start_time, 0),
+                        min(stop_time - event_start_time, event_duration),
+                    )
+                    reader_timeline_builder.add_event(
+                        reader_index,
+                        max(event_start_time - start_time, 0),
+                        sequential_event_with_notes,
+                    )
+            else:
+                # Other events (rests) are filled in by the builder.
+                event_stop_time = event_start_time + float(event.duration)
+            event_start_time = event_stop_time
+
+    def convert(
+        self,
+        simultaneous_event_with_pages_to_convert: core_events.SimultaneousEvent,
+        start_time: float,
+        stop_time: float,
+    ) -> core_events.SimultaneousEvent:
+        if stop_time <= start_time:
+            raise Exception(
+                f"Invalid window from '{start_time}' to '{stop_time}': the stop "
+                "time has to be bigger than the start time."
+            )
+        reader_timeline_builder = ReaderTimelineBuilder(
+            len(simultaneous_event_with_pages_to_convert), stop_time - start_time
+        )
+        for reader_index, sequential_event_with_pages in enumerate(
+            simultaneous_event_with_pages_to_convert
+        ):
+            self._add_sequential_event(
+                reader_timeline_builder,
+                reader_index,
+                sequential_event_with_pages,
+                start_time,
+                stop_time,
+            )
+        return reader_timeline_builder.build()
+
+
+# The page converter of a worker process (see
+# SimultaneousEventWithPagesToSimultaneousEventWithNotes).
+_page_to_sequential_event = None
+
+
+def _initialize_page_conversion_process(
+    make_page_to_sequential_event: typing.Callable[
+        [], typing.Callable[[dfc22_events.Page], core_events.SequentialEvent]
+    ]
+):
+    global _page_to_sequential_event
+    _page_to_sequential_event = make_page_to_sequential_event()
+
+
+def _convert_page(
+    page: typing.Union[dfc22_events.Page, dfc22_events.PageArray],
+) -> core_events.SequentialEvent:
+    if isinstance(page, dfc22_events.PageArray):
+        page = page.to_page()
+    return _page_to_sequential_event(page)
+
+
+class SimultaneousEventWithPagesToSimultaneousEventWithNotes(
+    core_converters.abc.Converter
+):
+    """Convert all pages of a simultaneous event to notes.
+
+    :param make_page_to_sequential_event: Function without arguments which
+        returns the function that converts one page to a sequential event
+        with notes. If more than one process is used it has to be
+        picklable (for instance a class or a module level function).
+        Default to :class:`NestedLanguageStructureToSequentialEvent`.
+    :param process_count: How many processes convert pages at the same
+        time. With 1 all pages are converted in the current process.
+
+    The other events (rests) are copied. Each process creates its own
+    page converter. Pages are sent to the processes as
+    :class:`mutwo.dfc22_events.PageArray` (pages with the same content
+    only need to be converted to an array once) and the converted pages
+    are put back at their original positions, so that the result doesn't
+    depend on the process count. Pages which can't be saved as an array
+    (for instance pages with different pitch dicts or subclasses of
+    :class:`mutwo.dfc22_events.Page`) are sent (and pickled) as they are.
+    """
+
+    def __init__(
+        self,
+        make_page_to_sequential_event: typing.Optional[
+            typing.Callable[
+                [], typing.Callable[[dfc22_events.Page], core_events.SequentialEvent]
+            ]
+        ] = None,
+        process_count: int = 1,
+    ):
+        if make_page_to_sequential_event is None:
+            make_page_to_sequential_event = (
+                dfc22_converters.NestedLanguageStructureToSequentialEvent
+            )
+        self._make_page_to_sequential_event = make_page_to_sequential_event
+        self._process_count = process_count
+
+    def _convert_page_tuple(
+        self, page_tuple: tuple[dfc22_events.Page, ...]
+    ) -> list[core_events.SequentialEvent]:
+        if self._process_count <= 1:
+            page_to_sequential_event = self._make_page_to_sequential_event()
+            return [
+                page_to_sequential_event(page)
+                for page in progressbar.progressbar(page_tuple)
+            ]
+
+        content_digest_to_page_array = {}
+        page_or_page_array_list = []
+        for page in page_tuple:
+            if type(page) is not dfc22_events.Page:
+                page_or_page_array_list.append(page)
+                continue
+            content_digest = page.content_digest
+            try:
+                page_array = content_digest_to_page_array[content_digest]
+            except KeyError:
+                try:
+                    page_array = dfc22_events.PageArray.from_page(page)
+                # The page can't be saved as an array
+                except Exception:
+                    page_array = None
+                content_digest_to_page_array[content_digest] = page_array
+            if page_array is None:
+                page_or_page_array_list.append(page)
+            else:
+                page_or_page_array_list.append(
+                    page_array.make_placement(page.initial_non_terminal_pair)
+                )
+
+        with concurrent.futures.ProcessPoolExecutor(
+            self._process_count,
+            initializer=_initialize_page_conversion_process,
+            initargs=(self._make_page_to_sequential_event,),
+        ) as executor:
+            return list(
+                progressbar.progressbar(
+                    executor.map(
+                        _convert_page,
+                        page_or_page_array_list,
+                        chunksize=max(
+                            len(page_or_page_array_list) // (self._process_count * 4), 1
+                        ),
+                    ),
+                    max_value=len(page_or_page_array_list),
+                )
+            )
+
+    def convert(
+        self, simultaneous_event_with_pages_to_convert: core_events.SimultaneousEvent
+    ) -> core_events.SimultaneousEvent:
+        page_list, event_list_per_reader = [], []
+        for sequential_event in simultaneous_event_with_pages_to_convert:
+            event_list = []
+            for event in sequential_event:
+                if isinstance(event, dfc22_events.Page):
+                    page_list.append(event)
+                    # Placeholder for the converted page
+                    event_list.append(None)
+                else:
+                    event_list.append(copy.copy(event))
+            event_list_per_reader.append(event_list)
+
+        converted_page_iterator = iter(self._convert_page_tuple(tuple(page_list)))
+        return core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        next(converted_page_iterator) if event is None else event
+                        for event in event_list
+                    ]
+                )
+                for event_list in event_list_per_reader
+            ]
+        )
@@ -1,9 +1,14 @@
-import copy
-import functools
-import operator
+import collections
+import concurrent.futures
+import hashlib
 import itertools
+import math
+import os
+import pickle
+import random
 import typing
 
+import numpy as np
 import progressbar
 
 from mutwo import core_converters
@@ -17,9 +22,11 @@ from mutwo import zimmermann_generators
 
 __all__ = (
     "ReaderCountToSequentialUnisonoEvent",
+    "ReaderCountToUnisonoEventIterator",
     "PageCatalogToPageCombinationCatalog",
     "SequentialUnisonoEventToPageTuple",
     "SequentialUnisonoEventToNonTerminalPairTuple",
+    "SequentialUnisonoEventToMovementNonTerminalPairTuple",
     "SequentialUnisonoEventToSimultaneousEvent",
 )
 
@@ -28,6 +35,300 @@ PageCombinationCatalog = dict[
 ]
 
 
+def _make_combination_with_replacement_index_array(
+    item_count: int, combination_count: int
+) -> np.ndarray:
+    """Vectorized equivalent of `itertools.combinations_with_replacement`.
+
+    Returns an integer array with one row for each combination of the
+    indices ``0 ... item_count - 1``. The rows have the same order as
+    the tuples returned by `itertools.combinations_with_replacement`.
+    """
+
+    combination_index_array = np.arange(item_count, dtype=np.intp).reshape(-1, 1)
+    for _ in range(combination_count - 1):
+        last_index_array = combination_index_array[:, -1]
+        # Each combination is continued with all indices which
+        # are equal or bigger than its last index.
+        continuation_count_array = item_count - last_index_array
+        continuation_start_array = np.repeat(
+            np.cumsum(continuation_count_array) - continuation_count_array,
+            continuation_count_array,
+        )
+        new_index_array = np.repeat(
+            last_index_array, continuation_count_array
+        ) + (
+            np.arange(continuation_count_array.sum(), dtype=np.intp)
+            - continuation_start_array
+        )
+        combination_index_array = np.column_stack(
+            (
+                np.repeat(combination_index_array, continuation_count_array, axis=0),
+                new_index_array,
+            )
+        )
+    return combination_index_array
+
+
+def _non_terminal_pair_tuple_to_exponent_array(
+    non_terminal_pair_tuple: tuple[dfc22_parameters.NonTerminalPair, ...],
+) -> np.ndarray:
+    """Put the exponents of non terminal pairs into one integer array.
+
+    Each row contains the exponent vector of the
+    :class:`dfc22_parameters.CompactNonTerminalPair` of the
+    non terminal pair.
+    """
+
+    return np.array(
+        [
+            dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                non_terminal_pair
+            ).exponent_tuple
+            for non_terminal_pair in non_terminal_pair_tuple
+        ],
+        dtype=np.int64,
+    ).reshape(
+        len(non_terminal_pair_tuple),
+        dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT * 2,
+    )
+
+
+def _exponent_array_to_non_terminal_pair(
+    exponent_array: np.ndarray,
+) -> dfc22_parameters.CompactNonTerminalPair:
+    return dfc22_parameters.CompactNonTerminalPair(tuple(exponent_array.tolist()))
+
+
+def _make_shard_combination_index_array(
+    item_count: int, combination_count: int, first_index: int
+) -> np.ndarray:
+    """All combinations with replacement which start with ``first_index``.
+
+    The rows have the same order as the rows of
+    :func:`_make_combination_with_replacement_index_array` which
+    start with ``first_index``.
+    """
+
+    if combination_count == 1:
+        return np.array([[first_index]], dtype=np.intp)
+    continuation_index_array = (
+        _make_combination_with_replacement_index_array(
+            item_count - first_index, combination_count - 1
+        )
+        + first_index
+    )
+    return np.column_stack(
+        (
+            np.full(len(continuation_index_array), first_index, dtype=np.intp),
+            continuation_index_array,
+        )
+    )
+
+
+def _find_row_index_array(
+    row_array: np.ndarray, row_to_find_array: np.ndarray
+) -> np.ndarray:
+    """Find the index of each row in ``row_to_find_array`` (or -1).
+
+    The rows of ``row_to_find_array`` need to be unique.
+    """
+
+    row_to_find_count = len(row_to_find_array)
+    unique_row_array, inverse_array = np.unique(
+        np.concatenate((row_to_find_array, row_array)), axis=0, return_inverse=True
+    )
+    inverse_array = inverse_array.reshape(-1)
+    unique_row_index_to_row_to_find_index_array = np.full(
+        len(unique_row_array), -1, dtype=np.intp
+    )
+    unique_row_index_to_row_to_find_index_array[inverse_array[:row_to_find_count]] = (
+        np.arange(row_to_find_count)
+    )
+    return unique_row_index_to_row_to_find_index_array[
+        inverse_array[row_to_find_count:]
+    ]
+
+
+def _find_page_index_tuple_list_per_reduced_non_terminal_pair_index(
+    shard_key: tuple[int, int],
+    exponent_array: np.ndarray,
+    reduced_exponent_array: np.ndarray,
+    page_index_tuple_per_non_terminal_pair: tuple[tuple[int, ...], ...],
+) -> dict[int, list[tuple[int, ...]]]:
+    """Find all page index tuples of one shard.
+
+    This function is called in worker processes of
+    :class:`PageCatalogToPageCombinationCatalog`. The combinations of
+    the shard are only made here: ``shard_key`` is the size and the
+    first index of the combinations. Only combinations which sum up to
+    one of the rows of ``reduced_exponent_array`` are used and each
+    result is saved with the index of this row.
+    """
+
+    combination_count, first_index = shard_key
+    combination_index_array = _make_shard_combination_index_array(
+        len(exponent_array), combination_count, first_index
+    )
+    reduced_non_terminal_pair_index_array = _find_row_index_array(
+        exponent_array[combination_index_array].sum(axis=1), reduced_exponent_array
+    )
+    is_requested_array = reduced_non_terminal_pair_index_array >= 0
+    reduced_non_terminal_pair_index_to_page_index_tuple_set = {}
+    for reduced_non_terminal_pair_index, combination_index_tuple in zip(
+        reduced_non_terminal_pair_index_array[is_requested_array].tolist(),
+        combination_index_array[is_requested_array].tolist(),
+    ):
+        page_index_tuple_set = (
+            reduced_non_terminal_pair_index_to_page_index_tuple_set.setdefault(
+                reduced_non_terminal_pair_index, set([])
+            )
+        )
+        for page_index_tuple in itertools.product(
+            *[
+                page_index_tuple_per_non_terminal_pair[index]
+                for index in combination_index_tuple
+            ]
+        ):
+            page_index_tuple_set.update(itertools.permutations(page_index_tuple))
+    return {
+        reduced_non_terminal_pair_index: sorted(page_index_tuple_set)
+        for reduced_non_terminal_pair_index, page_index_tuple_set in reduced_non_terminal_pair_index_to_page_index_tuple_set.items()
+    }
+
+
+def _get_predecessor_edge_index(predecessor_array: np.ndarray, node_index: int) -> int:
+    edge_index = predecessor_array[node_index]
+    if edge_index == -1:
+        raise Exception(
+            f"Found improved node {node_index} without predecessor while "
+            "searching a positive cycle."
+        )
+    return edge_index
+
+
+def _find_minimal_cyclic_increment_array(
+    position_count: int,
+    range_start_index_array: np.ndarray,
+    range_length_array: np.ndarray,
+    range_demand_array: np.ndarray,
+) -> np.ndarray:
+    """Find the smallest non negative increments of a cyclic sequence.
+
+    The sum of the increments inside each cyclic range (which starts at
+    ``range_start_index_array[i]`` and contains ``range_length_array[i]``
+    positions) has to be at least ``range_demand_array[i]`` and the sum of
+    all increments has to be minimal.
+
+    With the prefix sums S of the increments each range is a difference
+    constraint S[end] - S[start] >= demand (where S[end] is shifted by the
+    total sum T if the range wraps around the end of the sequence). The
+    minimal T is therefore the maximum ratio of demand per wrap of all
+    cycles of the constraint graph, which is found by Dinkelbach's method:
+    with a tentative T the longest paths are calculated by a vectorized
+    Bellman-Ford. If they don't converge, T is raised to the ratio of the
+    found positive cycle. Otherwise the longest paths are a valid solution.
+    Ranges without any position and with a positive demand can't be
+    satisfied and raise an exception.
+
+    The runtime is *not* linear in the number of movements: each
+    Dinkelbach iteration runs a complete Bellman-Ford, which is O(V·E)
+    with V positions and E ranges plus positions, and the number of
+    Dinkelbach iterations is bounded by the number of cycles of the
+    graph (in practice it is small). A linear algorithm would only be
+    possible if the ranges didn't wrap around the end of the sequence.
+    """
+
+    # Constraint graph: one node per position, edges for ranges and
+    # for the order of the positions (each increment >= 0).
+    position_index_array = np.arange(position_count, dtype=np.intp)
+    range_stop_index_array = range_start_index_array + range_length_array
+    source_array = np.concatenate((position_index_array, range_start_index_array))
+    destination_array = np.concatenate(
+        (position_index_array + 1, range_stop_index_array)
+    )
+    demand_array = np.concatenate(
+        (np.zeros(position_count), np.asarray(range_demand_array, dtype=float))
+    )
+    wrap_count_array = destination_array // position_count
+    destination_array = destination_array % position_count
+
+    tolerance = 1e-9 * max(1, float(np.abs(demand_array).max(initial=0)))
+    total = 0
+    while True:
+        weight_array = demand_array - (wrap_count_array * total)
+        potential_array = np.zeros(position_count)
+        predecessor_array = np.full(position_count, -1, dtype=np.intp)
+        for _ in range(position_count + 1):
+            candidate_array = potential_array[source_array] + weight_array
+            new_potential_array = potential_array.copy()
+            np.maximum.at(new_potential_array, destination_array, candidate_array)
+            is_improved_array = new_potential_array > potential_array + tolerance
+            if not np.any(is_improved_array):
+                break
+            is_improving_edge_array = (
+                candidate_array == new_potential_array[destination_array]
+            ) & is_improved_array[destination_array]
+            predecessor_array[destination_array[is_improving_edge_array]] = np.flatnonzero(
+                is_improving_edge_array
+            )
+            potential_array = np.where(
+                is_improved_array, new_potential_array, potential_array
+            )
+        else:
+            # Still improving after all simple paths have been
+            # visited: the predecessor graph contains a positive cycle.
+            node_index = int(np.flatnonzero(is_improved_array)[0])
+            for _ in range(position_count):
+                node_index = source_array[
+                    _get_predecessor_edge_index(predecessor_array, node_index)
+                ]
+            cycle_edge_index_list = []
+            cycle_node_index = node_index
+            while True:
+                edge_index = _get_predecessor_edge_index(
+                    predecessor_array, cycle_node_index
+                )
+                cycle_edge_index_list.append(edge_index)
+                cycle_node_index = source_array[edge_index]
+                if cycle_node_index == node_index:
+                    break
+            cycle_wrap_count = wrap_count_array[cycle_edge_index_list].sum()
+            if cycle_wrap_count == 0:
+                raise Exception(
+                    "Found ranges without any position which need a positive "
+                    "sum of increments. The ranges can't be satisfied."
+                )
+            total = float(demand_array[cycle_edge_index_list].sum() / cycle_wrap_count)
+            continue
+        break
+
+    increment_array = np.diff(np.append(potential_array, potential_array[0] + total))
+    return np.maximum(increment_array, 0)
+
+
+def _unrank_combination(
+    item_count: int, combination_size: int, rank: int
+) -> tuple[int, ...]:
+    """Find the combination at position ``rank`` of
+    ``itertools.combinations(range(item_count), combination_size)``
+    without iterating through all previous combinations."""
+
+    combination_list = []
+    item = 0
+    for remaining_size in range(combination_size, 0, -1):
+        # Skip all combinations which start with a smaller item
+        while True:
+            combination_count = math.comb(item_count - item - 1, remaining_size - 1)
+            if rank < combination_count:
+                break
+            rank -= combination_count
+            item += 1
+        combination_list.append(item)
+        item += 1
+    return tuple(combination_list)
+
+
 class ReaderCountToSequentialUnisonoEvent(core_converters.abc.Converter):
     def __init__(
         self,
@@ -71,11 +372,132 @@ class ReaderCountToSequentialUnisonoEvent(core_converters.abc.Converter):
         return sequential_unisono_event
 
 
+class ReaderCountToUnisonoEventIterator(core_converters.abc.Converter):
+    """Lazy variant of :class:`ReaderCountToSequentialUnisonoEvent`.
+
+    :param min_reader_combination_count: Minimal size of reader groups.
+    :param max_reader_combination_count: Maximal size of reader groups.
+    :param sample_count: If set, only this amount of randomly picked
+        reader combinations is used for each group size (so that each
+        size is equally often present). Default to ``None``
+        (all combinations).
+    :param seed: Seed for picking the sampled combinations.
+
+    The reader combinations aren't stored: only their indices are
+    interlocked (in the same way and therefore in the same order as in
+    :class:`ReaderCountToSequentialUnisonoEvent`) and each combination
+    is calculated from its index when it is needed.
+    """
+
+    def __init__(
+        self,
+        min_reader_combination_count: int = 1,
+        max_reader_combination_count: int = 3,
+        sample_count: typing.Optional[int] = None,
+        seed: int = 100,
+    ):
+        self._min_reader_combination_count = min_reader_combination_count
+        self._max_reader_combination_count = max_reader_combination_count
+        self._sample_count = sample_count
+        self._seed = seed
+        self._reader_count_to_interlocking = {}
+
+    def _make_rank_sequence(
+        self, reader_count: int, reader_to_combine_count: int
+    ) -> typing.Sequence[int]:
+        combination_count = math.comb(reader_count, reader_to_combine_count)
+        if self._sample_count is None or self._sample_count >= combination_count:
+            rank_sequence = range(combination_count)
+        else:
+            # 'random.sample' doesn't need to build the range
+            rank_sequence = sorted(
+                random.Random(self._seed + reader_to_combine_count).sample(
+                    range(combination_count), self._sample_count
+                )
+            )
+        # Like in 'ReaderCountToSequentialUnisonoEvent' combinations
+        # of odd sizes are reversed.
+        if reader_to_combine_count % 2 != 0:
+            rank_sequence = rank_sequence[::-1]
+        return rank_sequence
+
+    def _get_interlocking(
+        self, reader_count: int
+    ) -> tuple[np.ndarray, np.ndarray, tuple[int, ...]]:
+        """Interlocked indices, first index and size of each reader group.
+
+        The index of a combination is the first index of its group
+        plus its rank.
+        """
+
+        try:
+            return self._reader_count_to_interlocking[reader_count]
+        except KeyError:
+            pass
+        reader_to_combine_count_list = []
+        for reader_to_combine_count in range(
+            self._min_reader_combination_count,
+            min((self._max_reader_combination_count + 1, reader_count + 1)),
+        ):
+            if reader_to_combine_count % 2 == 0:
+                reader_to_combine_count_list.append(reader_to_combine_count)
+            else:
+                reader_to_combine_count_list.insert(0, reader_to_combine_count)
+        start_index_list, index_tuple_list, start_index = [], [], 0
+        for reader_to_combine_count in reader_to_combine_count_list:
+            start_index_list.append(start_index)
+            index_tuple_list.append(
+                tuple(
+                    start_index + rank
+                    for rank in self._make_rank_sequence(
+                        reader_count, reader_to_combine_count
+                    )
+                )
+            )
+            start_index += math.comb(reader_count, reader_to_combine_count)
+        interlocking = self._reader_count_to_interlocking[reader_count] = (
+            np.array(
+                zimmermann_generators.euclidean_interlocking(*index_tuple_list),
+                dtype=np.int64,
+            ),
+            np.array(start_index_list, dtype=np.int64),
+            tuple(reader_to_combine_count_list),
+        )
+        return interlocking
+
+    def convert(
+        self,
+        reader_count: int,
+        start: int = 0,
+        stop: typing.Optional[int] = None,
+    ) -> typing.Iterator[dfc22_events.UnisonoEvent]:
+        """Iterate over the unisono events from index ``start`` to ``stop``"""
+
+        (
+            index_array,
+            start_index_array,
+            reader_to_combine_count_tuple,
+        ) = self._get_interlocking(reader_count)
+        for index in index_array[start:stop]:
+            group_index = (
+                int(np.searchsorted(start_index_array, index, side="right")) - 1
+            )
+            yield dfc22_events.UnisonoEvent(
+                _unrank_combination(
+                    reader_count,
+                    reader_to_combine_count_tuple[group_index],
+                    int(index - start_index_array[group_index]),
+                )
+            )
+
+
 class PageCatalogToPageCombinationCatalog(core_converters.abc.Converter):
     def __init__(
         self,
         maximum_page_combination_count: typing.Optional[int] = None,
         minimal_page_combination_count: typing.Optional[int] = None,
+        process_count: typing.Optional[int] = None,
+        cache_directory_path: typing.Optional[str] = None,
     ):
         if not maximum_page_combination_count:
             maximum_page_combination_count = (
@@ -85,56 +507,602 @@ class PageCatalogToPageCombinationCatalog(core_converters.abc.Converter):
             minimal_page_combination_count = (
                 dfc22_converters.configurations.DEFAULT_MINIMAL_PAGE_COMBINATION_COUNT
             )
+        if process_count is None:
+            process_count = (
+                dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_PROCESS_COUNT
+            )
+        if process_count is None:
+            process_count = os.cpu_count() or 1
+        if cache_directory_path is None:
+            cache_directory_path = (
+                dfc22_converters.configurations.DEFAULT_PAGE_COMBINATION_CACHE_DIRECTORY_PATH
+            )
         self._maximum_page_combination_count = maximum_page_combination_count
         self._minimal_page_combination_count = minimal_page_combination_count
+        self._process_count = process_count
+        self._cache_directory_path = cache_directory_path
+
+    @staticmethod
+    def _count_page_combinations(
+        page_count_array: np.ndarray, combination_index_array: np.ndarray
+    ) -> np.ndarray:
+        """Count how many page tuples can be made from each combination.
+
+        Equal to the number of (distinct) page tuple variants which are
+        added in :func:`_find_page_index_tuple_list_per_reduced_non_terminal_pair_index`
+        for each combination (as long as all pages are distinct):
+        the number of distinct orderings of the combination multiplied
+        with the product of the page counts.
+        """
+
+        combination_count = combination_index_array.shape[1]
+        page_combination_count_array = np.prod(
+            page_count_array[combination_index_array], axis=1, dtype=np.int64
+        ) * math.factorial(combination_count)
+        # Combinations are sorted, so equal non terminal pairs are
+        # direct neighbours. We divide by the factorial of each repetition.
+        repetition_count_array = np.ones(
+            combination_index_array.shape[0], dtype=np.int64
+        )
+        for column_index in range(1, combination_count):
+            is_repetition_array = (
+                combination_index_array[:, column_index]
+                == combination_index_array[:, column_index - 1]
+            )
+            repetition_count_array = np.where(
+                is_repetition_array, repetition_count_array + 1, 1
+            )
+            page_combination_count_array //= repetition_count_array
+        return page_combination_count_array
 
-    def _make_non_terminal_pair_to_page_combination_list(
+    def _make_non_terminal_pair_to_shard_key_tuple(
         self,
         page_catalog_to_convert: dfc22_converters.PageCatalog,
-    ) -> dict[dfc22_parameters.NonTerminalPair, list[tuple[dfc22_events.Page, ...]]]:
+        non_terminal_pair_to_find_tuple: typing.Optional[
+            tuple[dfc22_parameters.NonTerminalPair, ...]
+        ] = None,
+    ) -> tuple[
+        dict[dfc22_parameters.NonTerminalPair, tuple[tuple[int, int], ...]],
+        dict[dfc22_parameters.NonTerminalPair, int],
+    ]:
+        """Find all combinations of non terminal pairs and their sums.
+
+        All sums are calculated as integer exponent arrays, so that
+        no pitch objects have to be created for each combination.
+
+        Returns two dicts: the first maps each reduced non terminal
+        pair to the keys of all shards which contain combinations
+        which sum up to it (each shard key is the size and the first
+        index of the combinations of the shard), the second maps
+        each reduced non terminal pair to the number of page tuples
+        which can be made from these combinations. If
+        ``non_terminal_pair_to_find_tuple`` is set, the first dict only
+        contains the requested non terminal pairs.
+        """
+
         non_terminal_pair_tuple = tuple(page_catalog_to_convert.keys())
-        non_terminal_pair_to_page_combination_list = {}
+        exponent_array = _non_terminal_pair_tuple_to_exponent_array(
+            non_terminal_pair_tuple
+        )
+        page_count_array = np.array(
+            [
+                len(page_catalog_to_convert[non_terminal_pair])
+                for non_terminal_pair in non_terminal_pair_tuple
+            ],
+            dtype=np.int64,
+        )
+
+        # Each size is reduced to its unique sums first, so that only
+        # these (and not all rows) need to be merged across sizes.
+        first_index_array_list = []
+        size_inverse_array_list = []
+        size_unique_reduced_exponent_array_list = []
+        size_page_combination_count_array_list = []
         for combination_count in range(1, self._maximum_page_combination_count + 1):
-            for non_terminal_pair_combination in progressbar.progressbar(
-                itertools.combinations_with_replacement(
-                    non_terminal_pair_tuple, combination_count
+            combination_index_array = _make_combination_with_replacement_index_array(
+                len(non_terminal_pair_tuple), combination_count
+            )
+            size_unique_reduced_exponent_array, size_inverse_array = np.unique(
+                exponent_array[combination_index_array].sum(axis=1),
+                axis=0,
+                return_inverse=True,
+            )
+            size_inverse_array = size_inverse_array.reshape(-1)
+            size_page_combination_count_array = np.zeros(
+                len(size_unique_reduced_exponent_array), dtype=np.int64
+            )
+            np.add.at(
+                size_page_combination_count_array,
+                size_inverse_array,
+                self._count_page_combinations(
+                    page_count_array, combination_index_array
+                ),
+            )
+            first_index_array_list.append(combination_index_array[:, 0].copy())
+            del combination_index_array
+            size_inverse_array_list.append(size_inverse_array)
+            size_unique_reduced_exponent_array_list.append(
+                size_unique_reduced_exponent_array
+            )
+            size_page_combination_count_array_list.append(
+                size_page_combination_count_array
+            )
+
+        (
+            unique_reduced_exponent_array,
+            reduced_non_terminal_pair_index_array,
+        ) = np.unique(
+            np.concatenate(size_unique_reduced_exponent_array_list),
+            axis=0,
+            return_inverse=True,
+        )
+        reduced_non_terminal_pair_index_array = (
+            reduced_non_terminal_pair_index_array.reshape(-1)
+        )
+        page_combination_count_array = np.zeros(
+            len(unique_reduced_exponent_array), dtype=np.int64
+        )
+        np.add.at(
+            page_combination_count_array,
+            reduced_non_terminal_pair_index_array,
+            np.concatenate(size_page_combination_count_array_list),
+        )
+        reduced_non_terminal_pair_tuple = tuple(
+            _exponent_array_to_non_terminal_pair(reduced_exponent)
+            for reduced_exponent in unique_reduced_exponent_array
+        )
+        non_terminal_pair_to_page_combination_count = {
+            non_terminal_pair: int(page_combination_count)
+            for non_terminal_pair, page_combination_count in zip(
+                reduced_non_terminal_pair_tuple, page_combination_count_array
+            )
+        }
+
+        if non_terminal_pair_to_find_tuple is None:
+            reduced_non_terminal_pair_index_to_find_array = np.arange(
+                len(reduced_non_terminal_pair_tuple)
+            )
+        else:
+            non_terminal_pair_to_reduced_non_terminal_pair_index = {
+                non_terminal_pair: reduced_non_terminal_pair_index
+                for reduced_non_terminal_pair_index, non_terminal_pair in enumerate(
+                    reduced_non_terminal_pair_tuple
+                )
+            }
+            reduced_non_terminal_pair_index_to_find_array = np.array(
+                sorted(
+                    set(
+                        non_terminal_pair_to_reduced_non_terminal_pair_index[
+                            non_terminal_pair
+                        ]
+                        for non_terminal_pair in non_terminal_pair_to_find_tuple
+                        if non_terminal_pair
+                        in non_terminal_pair_to_reduced_non_terminal_pair_index
+                    )
+                ),
+                dtype=np.intp,
+            )
+
+        non_terminal_pair_to_shard_key_list = {
+            reduced_non_terminal_pair_tuple[reduced_non_terminal_pair_index]: []
+            for reduced_non_terminal_pair_index in (
+                reduced_non_terminal_pair_index_to_find_array.tolist()
+            )
+        }
+        size_start_index = 0
+        for combination_count, (
+            first_index_array,
+            size_inverse_array,
+            size_unique_reduced_exponent_array,
+        ) in enumerate(
+            zip(
+                first_index_array_list,
+                size_inverse_array_list,
+                size_unique_reduced_exponent_array_list,
+            ),
+            1,
+        ):
+            size_inverse_array_list,
+            size_stop_index = size_start_index + len(size_unique_reduced_exponent_array)
+            row_reduced_non_terminal_pair_index_array = (
+                reduced_non_terminal_pair_index_array[size_start_index:size_stop_index][
+                    size_inverse_array
+                ]
+            )
+            size_start_index = size_stop_index
+            selected_row_index_array = np.flatnonzero(
+                np.isin(
+                    row_reduced_non_terminal_pair_index_array,
+                    reduced_non_terminal_pair_index_to_find_array,
+                )
+            )
+            selected_row_index_array = selected_row_index_array[
+                np.argsort(
+                    row_reduced_non_terminal_pair_index_array[selected_row_index_array],
+                    kind="stable",
+                )
+            ]
+            (
+                selected_reduced_non_terminal_pair_index_array,
+                group_start_index_array,
+            ) = np.unique(
+                row_reduced_non_terminal_pair_index_array[selected_row_index_array],
+                return_index=True,
+            )
+            for reduced_non_terminal_pair_index, group_first_index_array in zip(
+                selected_reduced_non_terminal_pair_index_array.tolist(),
+                np.split(
+                    first_index_array[selected_row_index_array],
+                    group_start_index_array[1:],
                 ),
-                prefix="Find non_terminal_pair_to_page_combination_list",
             ):
-                reduced_non_terminal_pair = functools.reduce(
-                    operator.add, non_terminal_pair_combination
+                non_terminal_pair_to_shard_key_list[
+                    reduced_non_terminal_pair_tuple[reduced_non_terminal_pair_index]
+                ].extend(
+                    (combination_count, first_index)
+                    for first_index in np.unique(group_first_index_array).tolist()
+                )
+
+        return (
+            {
+                non_terminal_pair: tuple(shard_key_list)
+                for non_terminal_pair, shard_key_list in non_terminal_pair_to_shard_key_list.items()
+            },
+            non_terminal_pair_to_page_combination_count,
+        )
+
+    def _raise_missing_non_terminal_pair_exception(
+        self,
+        missing_non_terminal_pair_to_page_combination_count: dict[
+            dfc22_parameters.NonTerminalPair, int
+        ],
+    ):
+        missing_non_terminal_pair_string = "\n".join(
+            f"\t{non_terminal_pair}: {page_combination_count} page combinations"
+            for non_terminal_pair, page_combination_count in missing_non_terminal_pair_to_page_combination_count.items()
+        )
+        raise Exception(
+            f"Can't find enough page combinations for "
+            f"{len(missing_non_terminal_pair_to_page_combination_count)} "
+            "of the requested non terminal pairs (each non terminal pair needs "
+            f"more than {self._minimal_page_combination_count} page "
+            "combinations):\n\n"
+            f"{missing_non_terminal_pair_string}\n\n"
+            "Decrease 'minimal_page_combination_count', increase "
+            "'maximum_page_combination_count' or increase the amount "
+            "of pages per non terminal pair."
+        )
+
+    def _find_shard_key_tuple_per_non_terminal_pair_to_find(
+        self,
+        page_catalog_to_convert: dfc22_converters.PageCatalog,
+        non_terminal_pair_to_find_tuple: tuple[dfc22_parameters.NonTerminalPair, ...],
+    ) -> dict[dfc22_parameters.NonTerminalPair, tuple[tuple[int, int], ...]]:
+        """Find the shards of the requested non terminal pairs.
+
+        Raises an exception before any page combination has been
+        made if any of the requested non terminal pairs can't be
+        reached with enough page combinations.
+        """
+
+        (
+            non_terminal_pair_to_shard_key_tuple,
+            non_terminal_pair_to_page_combination_count,
+        ) = self._make_non_terminal_pair_to_shard_key_tuple(
+            page_catalog_to_convert, non_terminal_pair_to_find_tuple
+        )
+        missing_non_terminal_pair_to_page_combination_count = {}
+        for non_terminal_pair in non_terminal_pair_to_find_tuple:
+            page_combination_count = non_terminal_pair_to_page_combination_count.get(
+                non_terminal_pair, 0
+            )
+            if page_combination_count <= self._minimal_page_combination_count:
+                missing_non_terminal_pair_to_page_combination_count.update(
+                    {non_terminal_pair: page_combination_count}
                 )
-                if (
-                    reduced_non_terminal_pair
-                    not in non_terminal_pair_to_page_combination_list
-                ):
-                    non_terminal_pair_to_page_combination_list.update(
-                        {reduced_non_terminal_pair: []}
+        if missing_non_terminal_pair_to_page_combination_count:
+            self._raise_missing_non_terminal_pair_exception(
+                missing_non_terminal_pair_to_page_combination_count
+            )
+        return {
+            non_terminal_pair: non_terminal_pair_to_shard_key_tuple[non_terminal_pair]
+            for non_terminal_pair in non_terminal_pair_to_find_tuple
+        }
+
+    @staticmethod
+    def _make_page_index_tuple_per_non_terminal_pair(
+        page_catalog_to_convert: dfc22_converters.PageCatalog,
+    ) -> tuple[list[dfc22_events.Page], tuple[tuple[int, ...], ...]]:
+        """Replace pages by indices, so that shards only have to handle integers.
+
+        Pages with equal content get the same index (as they would collapse
+        to one page combination otherwise). Their initial non terminal pair
+        doesn't matter, because pages are placed again when they are used.
+        """
+
+        page_list = []
+        content_digest_to_page_index = {}
+        page_index_tuple_per_non_terminal_pair = []
+        for page_tuple in page_catalog_to_convert.values():
+            page_index_list = []
+            for page in page_tuple:
+                content_digest = page.content_digest
+                if content_digest not in content_digest_to_page_index:
+                    content_digest_to_page_index.update(
+                        {content_digest: len(page_list)}
+                    )
+                    page_list.append(page)
+                page_index_list.append(content_digest_to_page_index[content_digest])
+            page_index_tuple_per_non_terminal_pair.append(tuple(page_index_list))
+        return page_list, tuple(page_index_tuple_per_non_terminal_pair)
+
+    @staticmethod
+    def _make_shard_key_tuple(
+        non_terminal_pair_to_shard_key_tuple: dict[
+            dfc22_parameters.NonTerminalPair, tuple[tuple[int, int], ...]
+        ],
+    ) -> tuple[tuple[int, int], ...]:
+        """Collect the keys of all shards which need to be computed.
+
+        Each shard contains all combinations with the same size and the
+        same first non terminal pair. The combinations of a shard are
+        only made inside the worker process which computes the shard.
+        Because all permutations of one combination are inside the same
+        shard, shards never share page combinations.
+        """
+
+        return tuple(
+            sorted(
+                set(
+                    itertools.chain.from_iterable(
+                        non_terminal_pair_to_shard_key_tuple.values()
                     )
-                for page_tuple in itertools.product(
-                    *[
-                        page_catalog_to_convert[non_terminal_pair]
-                        for non_terminal_pair in non_terminal_pair_combination
-                    ]
-                ):
-                    for page_tuple_variant in itertools.permutations(page_tuple):
-                        non_terminal_pair_to_page_combination_list[
-                            reduced_non_terminal_pair
-                        ].append(page_tuple_variant)
-        return non_terminal_pair_to_page_combination_list
+                )
+            )
+        )
+
+    @staticmethod
+    def _get_page_catalog_digest(
+        page_catalog_to_convert: dfc22_converters.PageCatalog,
+    ) -> str:
+        page_catalog_hash = hashlib.sha256()
+        for non_terminal_pair, page_tuple in page_catalog_to_convert.items():
+            page_catalog_hash.update(repr(non_terminal_pair).encode())
+            for page in page_tuple:
+                page_catalog_hash.update(page.content_digest.encode())
+        return page_catalog_hash.hexdigest()
+
+    def _get_shard_path(self, shard_key: tuple[int, int]) -> str:
+        return os.path.join(self._cache_directory_path, "{}-{}.pickle".format(*shard_key))
+
+    @staticmethod
+    def _get_shard_signature(
+        shard_key: tuple[int, int],
+        exponent_array: np.ndarray,
+        reduced_exponent_array: np.ndarray,
+        page_index_tuple_per_non_terminal_pair: tuple[tuple[int, ...], ...],
+        page_catalog_digest: str,
+    ) -> str:
+        """Short digest of everything the result of a shard depends on"""
+
+        shard_hash = hashlib.sha256()
+        shard_hash.update(page_catalog_digest.encode())
+        shard_hash.update(repr(shard_key).encode())
+        shard_hash.update(repr(page_index_tuple_per_non_terminal_pair).encode())
+        for array in (exponent_array, reduced_exponent_array):
+            shard_hash.update(repr(array.shape).encode())
+            shard_hash.update(np.ascontiguousarray(array, dtype=np.int64).tobytes())
+        return shard_hash.hexdigest()
+
+    def _load_shard(
+        self, shard_key: tuple[int, int], shard_signature: str
+    ) -> typing.Optional[dict[int, list[tuple[int, ...]]]]:
+        if self._cache_directory_path is None:
+            return None
+        try:
+            with open(self._get_shard_path(shard_key), "rb") as shard_file:
+                # The signature is saved in front of the result, so that
+                # outdated results never need to be loaded.
+                if pickle.load(shard_file) != shard_signature:
+                    return None
+                return pickle.load(shard_file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _store_shard(
+        self,
+        shard_key: tuple[int, int],
+        shard_signature: str,
+        shard_result: dict[int, list[tuple[int, ...]]],
+    ):
+        if self._cache_directory_path is None:
+            return
+        if not os.path.isdir(self._cache_directory_path):
+            os.makedirs(self._cache_directory_path)
+        shard_path = self._get_shard_path(shard_key)
+        # The shard is only moved to its final path once it is complete,
+        # so that an interrupted run never leaves a truncated shard.
+        temporary_shard_path = f"{shard_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_shard_path, "wb") as shard_file:
+                pickle.dump(shard_signature, shard_file)
+                pickle.dump(shard_result, shard_file)
+            os.replace(temporary_shard_path, shard_path)
+        finally:
+            if os.path.exists(temporary_shard_path):
+                os.remove(temporary_shard_path)
+
+    def _iterate_shard_result(
+        self,
+        shard_key_tuple: tuple[tuple[int, int], ...],
+        exponent_array: np.ndarray,
+        reduced_exponent_array: np.ndarray,
+        page_index_tuple_per_non_terminal_pair: tuple[tuple[int, ...], ...],
+        page_catalog_digest: str,
+    ) -> typing.Iterator[dict[int, list[tuple[int, ...]]]]:
+        """Yield the result of each shard in the order of `shard_key_tuple`.
+
+        Shards are computed in a process pool. To keep the memory usage
+        bounded only a few shards are computed at the same time and each
+        result is stored in the cache directory as soon as it is
+        available.
+        """
+
+        def get_shard_signature(shard_key) -> str:
+            return self._get_shard_signature(
+                shard_key,
+                exponent_array,
+                reduced_exponent_array,
+                page_index_tuple_per_non_terminal_pair,
+                page_catalog_digest,
+            )
+
+        shard_argument_tuple = (
+            exponent_array,
+            reduced_exponent_array,
+            page_index_tuple_per_non_terminal_pair,
+        )
+
+        if self._process_count > 1:
+            executor = concurrent.futures.ProcessPoolExecutor(self._process_count)
+        else:
+            executor = None
+
+        def submit(shard_key):
+            shard_result = self._load_shard(shard_key, get_shard_signature(shard_key))
+            if shard_result is not None or executor is None:
+                return shard_result
+            return executor.submit(
+                _find_page_index_tuple_list_per_reduced_non_terminal_pair_index,
+                shard_key,
+                *shard_argument_tuple,
+            )
+
+        shard_key_iterator = iter(shard_key_tuple)
+        shard_deque = collections.deque([])
+        try:
+            for shard_key in itertools.islice(
+                shard_key_iterator, self._process_count * 2
+            ):
+                shard_deque.append((shard_key, submit(shard_key)))
+            while shard_deque:
+                shard_key, shard_result = shard_deque.popleft()
+                for next_shard_key in itertools.islice(shard_key_iterator, 1):
+                    shard_deque.append((next_shard_key, submit(next_shard_key)))
+                if isinstance(shard_result, concurrent.futures.Future):
+                    shard_result = shard_result.result()
+                elif shard_result is None:
+                    shard_result = (
+                        _find_page_index_tuple_list_per_reduced_non_terminal_pair_index(
+                            shard_key, *shard_argument_tuple
+                        )
+                    )
+                else:
+                    yield shard_result
+                    continue
+                self._store_shard(
+                    shard_key, get_shard_signature(shard_key), shard_result
+                )
+                yield shard_result
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _make_non_terminal_pair_to_page_combination_tuple(
+        self,
+        page_catalog_to_convert: dfc22_converters.PageCatalog,
+        non_terminal_pair_to_find_tuple: typing.Optional[
+            tuple[dfc22_parameters.NonTerminalPair, ...]
+        ] = None,
+    ) -> dict[dfc22_parameters.NonTerminalPair, tuple[tuple[dfc22_events.Page, ...], ...]]:
+        if non_terminal_pair_to_find_tuple is None:
+            (
+                non_terminal_pair_to_shard_key_tuple,
+                _,
+            ) = self._make_non_terminal_pair_to_shard_key_tuple(page_catalog_to_convert)
+        else:
+            non_terminal_pair_to_shard_key_tuple = (
+                self._find_shard_key_tuple_per_non_terminal_pair_to_find(
+                    page_catalog_to_convert, non_terminal_pair_to_find_tuple
+                )
+            )
+        (
+            page_list,
+            page_index_tuple_per_non_terminal_pair,
+        ) = self._make_page_index_tuple_per_non_terminal_pair(page_catalog_to_convert)
+        shard_key_tuple = self._make_shard_key_tuple(
+            non_terminal_pair_to_shard_key_tuple
+        )
+        page_tuple_list_per_reduced_non_terminal_pair = tuple(
+            [] for _ in non_terminal_pair_to_shard_key_tuple
+        )
+        # Shards are merged in a deterministic order (sorted by shard key).
+        # Each shard is converted to page tuples as soon as it is available
+        # and dropped afterwards, so that only the page tuples (which
+        # share their pages) and the shards which are computed at the
+        # moment are kept in memory.
+        for shard_result in progressbar.progressbar(
+            self._iterate_shard_result(
+                shard_key_tuple,
+                _non_terminal_pair_tuple_to_exponent_array(
+                    tuple(page_catalog_to_convert.keys())
+                ),
+                _non_terminal_pair_tuple_to_exponent_array(
+                    tuple(non_terminal_pair_to_shard_key_tuple.keys())
+                ),
+                page_index_tuple_per_non_terminal_pair,
+                self._get_page_catalog_digest(page_catalog_to_convert),
+            ),
+            max_value=len(shard_key_tuple),
+            prefix="Find non_terminal_pair_to_page_combination_tuple",
+        ):
+            for (
+                reduced_non_terminal_pair_index,
+                page_index_tuple_list,
+            ) in shard_result.items():
+                page_tuple_list_per_reduced_non_terminal_pair[
+                    reduced_non_terminal_pair_index
+                ].extend(
+                    tuple(page_list[page_index] for page_index in page_index_tuple)
+                    for page_index_tuple in page_index_tuple_list
+                )
+            del shard_result
+        return {
+            non_terminal_pair: tuple(page_tuple_list)
+            for non_terminal_pair, page_tuple_list in zip(
+                non_terminal_pair_to_shard_key_tuple,
+                page_tuple_list_per_reduced_non_terminal_pair,
+            )
+        }
 
     def convert(
-        self, page_catalog_to_convert: dfc22_converters.PageCatalog
+        self,
+        page_catalog_to_convert: dfc22_converters.PageCatalog,
+        non_terminal_pair_to_find_tuple: typing.Optional[
+            typing.Sequence[dfc22_parameters.NonTerminalPair]
+        ] = None,
     ) -> PageCombinationCatalog:
-        non_terminal_pair_to_page_combination_list = (
-            self._make_non_terminal_pair_to_page_combination_list(
-                page_catalog_to_convert
+        """Find page combinations for non terminal pairs.
+
+        :param page_catalog_to_convert: The pages which shall be combined.
+        :param non_terminal_pair_to_find_tuple: If set, page combinations
+            are only searched for the given non terminal pairs (for instance
+            the result of :class:`SequentialUnisonoEventToMovementNonTerminalPairTuple`).
+            If any of them can't be resolved with enough page combinations an
+            exception is raised before the expensive part of the
+            calculation starts. If ``None`` page combinations are searched
+            for all reachable non terminal pairs.
+        """
+
+        if non_terminal_pair_to_find_tuple is not None:
+            non_terminal_pair_to_find_tuple = tuple(
+                dict.fromkeys(non_terminal_pair_to_find_tuple)
+            )
+        non_terminal_pair_to_page_combination_tuple = (
+            self._make_non_terminal_pair_to_page_combination_tuple(
+                page_catalog_to_convert, non_terminal_pair_to_find_tuple
             )
         )
-        non_terminal_pair_to_page_combination_tuple = {
-            non_terminal_pair: tuple(set(page_tuple_list))
-            for non_terminal_pair, page_tuple_list in non_terminal_pair_to_page_combination_list.items()
-        }
         # Only use those which are more flexible and which offer various
         # solutions (so that we can better pick more harmonic results)
         filtered_non_terminal_pair_to_page_combination_tuple = {
@@ -142,11 +1110,28 @@ class PageCatalogToPageCombinationCatalog(core_converters.abc.Converter):
             for non_terminal_pair, page_tuple_list in non_terminal_pair_to_page_combination_tuple.items()
             if len(page_tuple_list) > self._minimal_page_combination_count
         }
+        if non_terminal_pair_to_find_tuple is not None:
+            # Equal pages in the page catalog can reduce the amount of
+            # found page combinations.
+            missing_non_terminal_pair_to_page_combination_count = {
+                non_terminal_pair: len(
+                    non_terminal_pair_to_page_combination_tuple[non_terminal_pair]
+                )
+                for non_terminal_pair in non_terminal_pair_to_find_tuple
+                if non_terminal_pair
+                not in filtered_non_terminal_pair_to_page_combination_tuple
+            }
+            if missing_non_terminal_pair_to_page_combination_count:
+                self._raise_missing_non_terminal_pair_exception(
+                    missing_non_terminal_pair_to_page_combination_count
+                )
         return filtered_non_terminal_pair_to_page_combination_tuple
 
 
 class SequentialUnisonoEventConverter(core_converters.abc.Converter):
-    def __init__(self, page_combination_catalog: PageCombinationCatalog):
+    def __init__(
+        self, page_combination_catalog: typing.Optional[PageCombinationCatalog] = None
+    ):
         self._page_combination_catalog = page_combination_catalog
 
 
@@ -231,17 +1216,67 @@ class SequentialUnisonoEventToNonTerminalPairTuple(SequentialUnisonoEventConvert
         return tuple(non_terminal_pair_list)
 
 
+class SequentialUnisonoEventToMovementNonTerminalPairTuple(
+    core_converters.abc.Converter
+):
+    """Find all non terminal pairs which need to be resolved by page combinations.
+
+    The returned non terminal pairs can be passed to
+    :class:`PageCatalogToPageCombinationCatalog` so that page combinations
+    are only searched for the movements which actually appear in the
+    :class:`~mutwo.dfc22_events.SequentialUnisonoEvent`. The 'page' and
+    'non_terminal_pair' of all unisono events need to be set already.
+    """
+
+    def convert(
+        self, sequential_unisono_event_to_convert: dfc22_events.SequentialUnisonoEvent
+    ) -> tuple[dfc22_parameters.NonTerminalPair, ...]:
+        non_terminal_pair_set = set([])
+        for movement in sequential_unisono_event_to_convert.get_movement_tuple():
+            if (
+                movement.unisono_event_left.non_terminal_pair is None
+                or movement.unisono_event_right.non_terminal_pair is None
+            ):
+                raise Exception(
+                    f"Found movement '{movement}' without non terminal pair. "
+                    "Please set the 'page' and the 'non_terminal_pair' of all "
+                    "unisono events before searching the required non terminal pairs."
+                )
+            non_terminal_pair_set.add(movement.as_non_terminal_pair)
+        # Sort non terminal pairs so that the result is deterministic
+        # (and can therefore be used as an argument for lazy computations).
+        return tuple(
+            sorted(
+                non_terminal_pair_set,
+                key=lambda non_terminal_pair: (
+                    non_terminal_pair.consonant.exponent_tuple,
+                    non_terminal_pair.vowel.exponent_tuple,
+                ),
+            )
+        )
+
+
 class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter):
     def __init__(
         self,
         *args,
         reader_count: int,
         page_buffer_duration: typing.Optional[float] = None,
+        page_combination_tuple_per_movement_to_page_combination_index_tuple: typing.Optional[
+            dfc22_converters.PageCombinationTuplePerMovementToPageCombinationIndexTuple
+        ] = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if page_combination_tuple_per_movement_to_page_combination_index_tuple is None:
+            page_combination_tuple_per_movement_to_page_combination_index_tuple = (
+                dfc22_converters.PageCombinationTuplePerMovementToPageCombinationIndexTuple()
+            )
         self._reader_count = reader_count
         self._page_buffer_duration = page_buffer_duration
+        self._page_combination_tuple_per_movement_to_page_combination_index_tuple = (
+            page_combination_tuple_per_movement_to_page_combination_index_tuple
+        )
 
     # jede valide verbindung muss eine konkrete interpolation aussuchen
     # (also eine range von 0 bis len(solution_tuple))
@@ -275,6 +1310,122 @@ class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter)
             self._page_buffer_duration = page_buffer_duration
             self._reader_count = reader_count
 
+        def _get_minimal_duration(
+            self, page_combination: tuple[dfc22_events.Page, ...]
+        ) -> float:
+            """Minimal duration of a movement with the given page combination"""
+
+            return sum(page.duration for page in page_combination) + (
+                len(page_combination) * self._page_buffer_duration
+            )
+
+        def _get_unisono_event_duration_tuple(
+            self,
+            sequential_unisono_event_to_convert: dfc22_events.SequentialUnisonoEvent,
+            movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
+            minimal_duration_array: np.ndarray,
+        ) -> tuple[float, ...]:
+            """Find the shortest durations of the unisono events, so that each
+            movement has at least its minimal duration.
+
+            A movement starts after the page of its left unisono event and
+            stops at the beginning of its right unisono event. All movements
+            are solved at once (see
+            :func:`_find_minimal_cyclic_increment_array`), so that the
+            result doesn't depend on the order of the movements and the
+            duration of the complete sequence is as short as possible. The
+            runtime isn't linear in the number of movements (see there).
+            """
+
+            unisono_event_count = len(sequential_unisono_event_to_convert)
+            page_duration_array = np.array(
+                [
+                    unisono_event.page.duration
+                    for unisono_event in sequential_unisono_event_to_convert
+                ],
+                dtype=float,
+            )
+            # Unisono events can't be shorter than their page
+            minimal_unisono_event_duration_array = np.maximum(
+                np.array(
+                    [
+                        unisono_event.duration
+                        for unisono_event in sequential_unisono_event_to_convert
+                    ],
+                    dtype=float,
+                ),
+                page_duration_array,
+            )
+            if not movement_tuple:
+                return tuple(minimal_unisono_event_duration_array.tolist())
+            left_index_array, right_index_array = (
+                np.array(
+                    [getattr(movement, attribute_name) for movement in movement_tuple],
+                    dtype=np.intp,
+                )
+                for attribute_name in (
+                    "unisono_event_left_index",
+                    "unisono_event_right_index",
+                )
+            )
+            # The unisono events from the left unisono event until the
+            # unisono event before the right unisono event (if both are
+            # equal the movement fills the complete cycle).
+            unisono_event_range_length_array = (
+                right_index_array - left_index_array - 1
+            ) % unisono_event_count + 1
+            cumulative_duration_array = np.concatenate(
+                ([0], np.cumsum(np.tile(minimal_unisono_event_duration_array, 2)))
+            )
+            available_duration_array = (
+                cumulative_duration_array[
+                    left_index_array + unisono_event_range_length_array
+                ]
+                - cumulative_duration_array[left_index_array]
+                - page_duration_array[left_index_array]
+            )
+            increment_array = _find_minimal_cyclic_increment_array(
+                unisono_event_count,
+                left_index_array,
+                unisono_event_range_length_array,
+                np.asarray(minimal_duration_array, dtype=float)
+                - available_duration_array,
+            )
+            return tuple(
+                (minimal_unisono_event_duration_array + increment_array).tolist()
+            )
+
+        def get_reference_unisono_event_duration_tuple(
+            self,
+            sequential_unisono_event_to_convert: dfc22_events.SequentialUnisonoEvent,
+            movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
+            page_combination_tuple_per_movement: tuple[
+                tuple[tuple[dfc22_events.Page, ...], ...], ...
+            ],
+        ) -> tuple[float, ...]:
+            """Durations of the unisono events before page combinations are picked.
+
+            Each movement is expected to have the average minimal duration of
+            its page combinations.
+            """
+
+            return self._get_unisono_event_duration_tuple(
+                sequential_unisono_event_to_convert,
+                movement_tuple,
+                np.array(
+                    [
+                        np.mean(
+                            [
+                                self._get_minimal_duration(page_combination)
+                                for page_combination in page_combination_tuple
+                            ]
+                        )
+                        for page_combination_tuple in page_combination_tuple_per_movement
+                    ],
+                    dtype=float,
+                ),
+            )
+
         def _set_unisono_events_duration(
             self,
             page_combination_tuple: tuple[tuple[dfc22_events.Page, ...], ...],
@@ -284,60 +1435,27 @@ class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter)
             """Adjust the duration of the unisono events according to
             the interpolations"""
 
-            unisono_event_count = len(sequential_unisono_event_to_convert)
-            for page_combination, movement in zip(
-                page_combination_tuple, movement_tuple
+            for unisono_event, duration in zip(
+                sequential_unisono_event_to_convert,
+                self._get_unisono_event_duration_tuple(
+                    sequential_unisono_event_to_convert,
+                    movement_tuple,
+                    np.array(
+                        [
+                            self._get_minimal_duration(page_combination)
+                            for page_combination in page_combination_tuple
+                        ],
+                        dtype=float,
+                    ),
+                ),
             ):
-                minimal_duration = sum(page.duration for page in page_combination) + (
-                    len(page_combination) * self._page_buffer_duration
-                )
-                left_index, right_index = (
-                    movement.unisono_event_left_index,
-                    movement.unisono_event_right_index,
-                )
-                is_short_interpolation = True
-                if right_index - left_index > 1:
-                    is_short_interpolation = False
-                    left_index += 1
-                local_unisono_event_count = (
-                    right_index - left_index
-                ) % unisono_event_count
-                minimal_duration_for_one_unisono_event = (
-                    minimal_duration / local_unisono_event_count
-                )
-                if left_index < right_index:
-                    unisono_event_index_list = list(range(left_index, right_index))
-                else:
-                    unisono_event_index_list = list(
-                        range(left_index, unisono_event_count)
-                    )
-                    unisono_event_index_list.extend(list(range(0, right_index)))
-                for unisono_event_index in unisono_event_index_list:
-                    unisono_event = sequential_unisono_event_to_convert[
-                        unisono_event_index
-                    ]
-
-                    if is_short_interpolation:
-                        local_minimal_duration_for_one_unisono_event = (
-                            unisono_event.page.duration
-                            + minimal_duration_for_one_unisono_event
-                        )
-                    else:
-                        local_minimal_duration_for_one_unisono_event = (
-                            minimal_duration_for_one_unisono_event
-                        )
-                    if (
-                        unisono_event.duration
-                        < local_minimal_duration_for_one_unisono_event
-                    ):
-                        unisono_event.duration = (
-                            local_minimal_duration_for_one_unisono_event
-                        )
+                if unisono_event.duration != duration:
+                    unisono_event.duration = duration
 
         def _insert_unisono_events(
             self,
             sequential_unisono_event_to_convert: dfc22_events.SequentialUnisonoEvent,
-            simultaneous_event: core_events.SimultaneousEvent,
+            reader_timeline_builder: dfc22_converters.ReaderTimelineBuilder,
         ) -> tuple[tuple[float, ...], tuple[float, ...]]:
             unisono_start_time_list = []
             unisono_stop_time_list = []
@@ -376,8 +1494,8 @@ class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter)
                 unisono_stop_time_list.append(unisono_stop_time)
 
                 for reader_index in unisono_event.reader_tuple:
-                    simultaneous_event[reader_index].squash_in(
-                        unisono_start_time, unisono_event.page
+                    reader_timeline_builder.add_event(
+                        reader_index, unisono_start_time, unisono_event.page
                     )
 
             return tuple(unisono_start_time_list), tuple(unisono_stop_time_list)
@@ -385,7 +1503,7 @@ class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter)
         def _insert_movement_events(
             self,
             duration: float,
-            simultaneous_event: core_events.SimultaneousEvent,
+            reader_timeline_builder: dfc22_converters.ReaderTimelineBuilder,
             page_combination_tuple: tuple[tuple[dfc22_events.Page, ...], ...],
             movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
             unisono_start_time: tuple[float, ...],
@@ -406,19 +1524,19 @@ class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter)
                 rest_duration = local_duration - movement_duration
                 assert rest_duration >= 0
                 rest_part_duration = rest_duration / (len(page_combination) + 1)
-                sequential_event = simultaneous_event[movement.reader]
                 insert_time = start_time + rest_part_duration
                 initial_non_terminal_pair = (
                     movement.unisono_event_left.right_non_terminal_pair
                 )
                 for page in page_combination:
-                    page = copy.deepcopy(page)
-                    page.initial_non_terminal_pair = initial_non_terminal_pair
+                    page = page.make_placement(initial_non_terminal_pair)
                     initial_non_terminal_pair = (
                         initial_non_terminal_pair + page.non_terminal_pair
                     )
                     insert_time = insert_time % duration
-                    sequential_event.squash_in(insert_time, page)
+                    reader_timeline_builder.add_event(
+                        movement.reader, insert_time, page
+                    )
                     insert_time += page.duration + rest_part_duration
 
         def _make_unprecise_simultaneous_event(
@@ -428,25 +1546,22 @@ class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter)
             movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
         ):
             duration = sequential_unisono_event_to_convert.duration
-            simultaneous_event = core_events.SimultaneousEvent(
-                [
-                    core_events.SequentialEvent([core_events.SimpleEvent(duration)])
-                    for _ in range(self._reader_count)
-                ]
+            reader_timeline_builder = dfc22_converters.ReaderTimelineBuilder(
+                self._reader_count, duration
             )
             unisono_start_time, unisono_stop_time = self._insert_unisono_events(
-                sequential_unisono_event_to_convert, simultaneous_event
+                sequential_unisono_event_to_convert, reader_timeline_builder
             )
             self._insert_movement_events(
                 duration,
-                simultaneous_event,
+                reader_timeline_builder,
                 page_combination_tuple,
                 movement_tuple,
                 unisono_start_time,
                 unisono_stop_time,
             )
 
-            return simultaneous_event
+            return reader_timeline_builder.build()
 
         def convert(
             self,
@@ -476,35 +1591,87 @@ class SequentialUnisonoEventToSimultaneousEvent(SequentialUnisonoEventConverter)
 
     def _find_page_combination_index_tuple(
         self,
+        sequential_unisono_event_to_convert: dfc22_events.SequentialUnisonoEvent,
         movement_tuple: tuple[dfc22_events.SequentialUnisonoEvent.Movement, ...],
         page_combination_tuple_per_movement: tuple[
             tuple[tuple[dfc22_events.Page, ...], ...], ...
         ],
         max_page_combination_index_tuple: tuple[int, ...],
     ) -> tuple[int, ...]:
-        return tuple(0 for _ in max_page_combination_index_tuple)
+        page_combination_index_tuple = self._page_combination_tuple_per_movement_to_page_combination_index_tuple.convert(
+            sequential_unisono_event_to_convert,
+            movement_tuple,
+            page_combination_tuple_per_movement,
+            self._make_data_to_simultaneous_event().get_reference_unisono_event_duration_tuple(
+                sequential_unisono_event_to_convert,
+                movement_tuple,
+                page_combination_tuple_per_movement,
+            ),
+        )
+        assert all(
+            0 <= page_combination_index < max_page_combination_index
+            for page_combination_index, max_page_combination_index in zip(
+                page_combination_index_tuple, max_page_combination_index_tuple
+            )
+        )
+        return page_combination_index_tuple
+
+    def _assert_page_combination_catalog_contains_non_terminal_pair_tuple(
+        self,
+        non_terminal_pair_tuple: tuple[dfc22_parameters.NonTerminalPair, ...],
+    ):
+        missing_non_terminal_pair_tuple = tuple(
+            dict.fromkeys(
+                non_terminal_pair
+                for non_terminal_pair in non_terminal_pair_tuple
+                if non_terminal_pair not in self._page_combination_catalog
+            )
+        )
+        if missing_non_terminal_pair_tuple:
+            missing_non_terminal_pair_string = "\n".join(
+                f"\t{non_terminal_pair}"
+                for non_terminal_pair in missing_non_terminal_pair_tuple
+            )
+            raise KeyError(
+                f"The page combination catalog misses {len(missing_non_terminal_pair_tuple)} "
+                "non terminal pairs of the movements of the sequential unisono "
+                f"event:\n\n{missing_non_terminal_pair_string}\n\n"
+                "Use 'SequentialUnisonoEventToMovementNonTerminalPairTuple' to "
+                "find all required non terminal pairs before creating the "
+                "page combination catalog."
+            )
+
+    def _make_data_to_simultaneous_event(self) -> DataToSimultaneousEvent:
+        return self.DataToSimultaneousEvent(
+            self._reader_count, self._page_buffer_duration
+        )
 
     def _convert_to_simultaneous_event(
         self,
         *args,
         **kwargs,
     ) -> core_events.SimultaneousEvent:
-        return self.DataToSimultaneousEvent(
-            self._reader_count, self._page_buffer_duration
-        ).convert(*args, **kwargs)
+        return self._make_data_to_simultaneous_event().convert(*args, **kwargs)
 
     def convert(
         self, sequential_unisono_event_to_convert: dfc22_events.SequentialUnisonoEvent
     ) -> core_events.SimultaneousEvent:
-        movement_tuple = tuple(sequential_unisono_event_to_convert.get_movement_set())
+        movement_tuple = sequential_unisono_event_to_convert.get_movement_tuple()
+        non_terminal_pair_tuple = tuple(
+            movement.as_non_terminal_pair for movement in movement_tuple
+        )
+        self._assert_page_combination_catalog_contains_non_terminal_pair_tuple(
+            non_terminal_pair_tuple
+        )
         page_combination_tuple_per_movement = tuple(
-            self._page_combination_catalog[movement.as_non_terminal_pair]
-            for movement in movement_tuple
+            self._page_combination_catalog[non_terminal_pair]
+            for non_terminal_pair in non_terminal_pair_tuple
         )
         max_page_combination_index_tuple = tuple(
             len(page_tuple) for page_tuple in page_combination_tuple_per_movement
         )
         page_combination_index_tuple = self._find_page_combination_index_tuple(
+            sequential_unisono_event_to_convert,
             movement_tuple,
             page_combination_tuple_per_movement,
             max_page_combination_index_tuple,
@@ -1,6 +1,8 @@
 from . import configurations
 from . import constants
+from . import abc
 
 from .languages import *
+from .arrays import *
 from .music import *
 from .unisonos import *
@@ -0,0 +1,210 @@
+"""Mixins for events which cache values or share attributes with their copies"""
+
+import copy
+import typing
+import weakref
+
+__all__ = ("ObjectWithSharedAttributes", "ObjectWithCache", "ListWithCache")
+
+
+class ObjectWithSharedAttributes(object):
+    """Object which shares immutable attributes with its deep copies.
+
+    The attributes which are listed in ``_shared_attribute_name_tuple``
+    are never mutated in place (they are only replaced by new objects),
+    therefore a deep copy can use the same objects. All other attributes
+    are copied as usual.
+    """
+
+    _shared_attribute_name_tuple: tuple[str, ...] = tuple([])
+
+    def _get_state_to_copy(self) -> dict[str, typing.Any]:
+        return self.__dict__
+
+    def __copy__(self):
+        cls = type(self)
+        object_copy = cls.__new__(cls)
+        object_copy.__dict__.update(self._get_state_to_copy())
+        return object_copy
+
+    def __deepcopy__(self, memo: dict):
+        cls = type(self)
+        object_copy = cls.__new__(cls)
+        memo[id(self)] = object_copy
+        shared_attribute_name_tuple = self._shared_attribute_name_tuple
+        object_copy.__dict__.update(
+            {
+                attribute_name: value
+                if attribute_name in shared_attribute_name_tuple
+                else copy.deepcopy(value, memo)
+                for attribute_name, value in self._get_state_to_copy().items()
+            }
+        )
+        return object_copy
+
+
+class ObjectWithCache(ObjectWithSharedAttributes):
+    """Object which caches values derived from its (mutable) content.
+
+    Each mutation of the content needs to call :meth:`_invalidate_cache`.
+    Objects which cache values derived from other objects with a
+    cache (for instance a sentence which caches values derived from
+    its words) have to register themselves as a parent of those
+    objects (see :meth:`_register_parent`), so that a mutation of a
+    child also invalidates the cache of its parents.
+    """
+
+    _cache_attribute_name_tuple = ("_cache", "_parent_reference_dict")
+
+    @property
+    def _cache(self) -> dict[str, typing.Any]:
+        try:
+            return self.__dict__["_cache"]
+        except KeyError:
+            cache = self.__dict__["_cache"] = {}
+            return cache
+
+    @property
+    def _parent_reference_dict(self) -> dict[int, weakref.ReferenceType]:
+        try:
+            return self.__dict__["_parent_reference_dict"]
+        except KeyError:
+            parent_reference_dict = self.__dict__["_parent_reference_dict"] = {}
+            return parent_reference_dict
+
+    def _register_parent(self, parent: "ObjectWithCache"):
+        parent_id = id(parent)
+        if parent_id not in self._parent_reference_dict:
+            parent_reference_dict = self._parent_reference_dict
+            parent_reference_dict[parent_id] = weakref.ref(
+                parent, lambda _: parent_reference_dict.pop(parent_id, None)
+            )
+
+    def _get_child_with_cache_iterable(self) -> typing.Iterable["ObjectWithCache"]:
+        """Children whose mutations invalidate the cache of this object"""
+
+        return tuple([])
+
+    def _get_cached_value(
+        self, key: str, compute: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        cache = self._cache
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        if not cache:
+            # The cache has been empty, therefore the children don't
+            # know yet (or anymore) that they need to inform this
+            # object about their mutations.
+            for child in self._get_child_with_cache_iterable():
+                child._register_parent(self)
+        value = cache[key] = compute()
+        return value
+
+    def _invalidate_cache(self):
+        # During unpickling the list items of a list subclass are
+        # added before the state of the object is set, therefore
+        # the cache attributes don't necessarily exist yet.
+        cache = self.__dict__.get("_cache", None)
+        if cache:
+            cache.clear()
+        for parent_reference in tuple(
+            self.__dict__.get("_parent_reference_dict", {}).values()
+        ):
+            parent = parent_reference()
+            if parent is not None:
+                parent._invalidate_cache()
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Caches and weak references are neither picklable nor
+        # do they need to be copied.
+        return {
+            attribute_name: value
+            for attribute_name, value in self.__dict__.items()
+            if attribute_name not in self._cache_attribute_name_tuple
+        }
+
+    def _get_state_to_copy(self) -> dict[str, typing.Any]:
+        return self.__getstate__()
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        self.__dict__.update(state)
+        self._invalidate_cache()
+
+
+class ListWithCache(ObjectWithCache, list):
+    """List which invalidates its cache when it is mutated.
+
+    All list items which are instances of :class:`ObjectWithCache`
+    are treated as children of the list.
+    """
+
+    def _get_child_with_cache_iterable(self) -> typing.Iterable[ObjectWithCache]:
+        return (item for item in self if isinstance(item, ObjectWithCache))
+
+    def __copy__(self):
+        object_copy = super().__copy__()
+        # Bypass overridden methods (which may read the state or
+        # change the items).
+        list.extend(object_copy, list.__iter__(self))
+        return object_copy
+
+    def __deepcopy__(self, memo: dict):
+        object_copy = super().__deepcopy__(memo)
+        list.extend(
+            object_copy,
+            [copy.deepcopy(item, memo) for item in list.__iter__(self)],
+        )
+        return object_copy
+
+    def __setitem__(self, *args, **kwargs):
+        super().__setitem__(*args, **kwargs)
+        self._invalidate_cache()
+
+    def __delitem__(self, *args, **kwargs):
+        super().__delitem__(*args, **kwargs)
+        self._invalidate_cache()
+
+    def __iadd__(self, *args, **kwargs):
+        result = super().__iadd__(*args, **kwargs)
+        self._invalidate_cache()
+        return result
+
+    def __imul__(self, *args, **kwargs):
+        result = super().__imul__(*args, **kwargs)
+        self._invalidate_cache()
+        return result
+
+    def append(self, *args, **kwargs):
+        super().append(*args, **kwargs)
+        self._invalidate_cache()
+
+    def extend(self, *args, **kwargs):
+        super().extend(*args, **kwargs)
+        self._invalidate_cache()
+
+    def insert(self, *args, **kwargs):
+        super().insert(*args, **kwargs)
+        self._invalidate_cache()
+
+    def remove(self, *args, **kwargs):
+        super().remove(*args, **kwargs)
+        self._invalidate_cache()
+
+    def pop(self, *args, **kwargs):
+        item = super().pop(*args, **kwargs)
+        self._invalidate_cache()
+        return item
+
+    def clear(self, *args, **kwargs):
+        super().clear(*args, **kwargs)
+        self._invalidate_cache()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_cache()
+
+    def reverse(self, *args, **kwargs):
+        super().reverse(*args, **kwargs)
+        self._invalidate_cache()
@@ -0,0 +1,522 @@
+"""Compact array based form of pages.
+
+A :class:`dfc22_events.Page` consists of many small python objects
+(one object for each phoneme, phoneme group, range and pitch).
+:class:`PageArray` saves the same content in a few flat numpy arrays,
+so that catalogs with thousands of pages still fit into memory.
+"""
+
+from __future__ import annotations
+
+import abc
+import copy
+import typing
+
+import numpy as np
+
+from mutwo import core_constants
+from mutwo import dfc22_events
+from mutwo import dfc22_parameters
+from mutwo import music_parameters
+
+
+__all__ = (
+    "PageArray",
+    "PhonemeGroupView",
+    "WordView",
+    "SentenceView",
+    "ParagraphView",
+    "PageView",
+)
+
+
+class PageArray(object):
+    """Page which is saved as flat arrays.
+
+    :param phoneme_id_array: The phonemes of all phoneme groups (as ids of
+        :class:`mutwo.dfc22_parameters.XSAMPAPhoneme`).
+    :param phoneme_group_offset_array: The first phoneme of each phoneme
+        group (and the phoneme count as last item).
+    :param word_offset_array: The first phoneme group of each word.
+    :param sentence_offset_array: The first word of each sentence.
+    :param paragraph_offset_array: The first sentence of each paragraph.
+    :param uncertain_duration_array: Start and end of the uncertain
+        duration of each phoneme group.
+    :param uncertain_rest_duration_array_tuple: Start and end of the
+        uncertain rest durations of all phoneme groups, words, sentences
+        and paragraphs and of the page itself.
+    :param exponent_array: The movement of each phoneme group as an
+        exponent vector (see
+        :class:`mutwo.dfc22_parameters.CompactNonTerminalPair`).
+    :param initial_non_terminal_pair: The initial non terminal pair of
+        the page.
+    :param vowel_to_just_intonation_pitch_dict: The dict which is used
+        by all phoneme groups (``None`` for the default dict).
+    :param consonant_to_just_intonation_pitch_dict: The dict which is
+        used by all phoneme groups (``None`` for the default dict).
+
+    Use :meth:`from_page` and :meth:`to_page` to convert between both
+    forms. :attr:`view` offers read only access with the same API as
+    :class:`dfc22_events.Page`. The initial non terminal pairs of
+    paragraphs, sentences and words aren't saved (they are never used).
+    """
+
+    _level_count = 5
+
+    def __init__(
+        self,
+        phoneme_id_array: np.ndarray,
+        phoneme_group_offset_array: np.ndarray,
+        word_offset_array: np.ndarray,
+        sentence_offset_array: np.ndarray,
+        paragraph_offset_array: np.ndarray,
+        uncertain_duration_array: np.ndarray,
+        uncertain_rest_duration_array_tuple: tuple[np.ndarray, ...],
+        exponent_array: np.ndarray,
+        initial_non_terminal_pair: dfc22_parameters.CompactNonTerminalPair,
+        vowel_to_just_intonation_pitch_dict: typing.Optional[
+            dict[dfc22_parameters.XSAMPAPhoneme, music_parameters.JustIntonationPitch]
+        ] = None,
+        consonant_to_just_intonation_pitch_dict: typing.Optional[
+            dict[dfc22_parameters.XSAMPAPhoneme, music_parameters.JustIntonationPitch]
+        ] = None,
+    ):
+        self.phoneme_id_array = phoneme_id_array
+        # Offsets from the page to the phonemes.
+        self.offset_array_tuple = (
+            np.array([0, len(paragraph_offset_array) - 1], dtype=np.int32),
+            paragraph_offset_array,
+            sentence_offset_array,
+            word_offset_array,
+            phoneme_group_offset_array,
+        )
+        self.uncertain_duration_array = uncertain_duration_array
+        # From the page to the phoneme groups.
+        self.uncertain_rest_duration_array_tuple = uncertain_rest_duration_array_tuple
+        self.exponent_array = exponent_array
+        self.initial_non_terminal_pair = (
+            dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                initial_non_terminal_pair
+            )
+        )
+        self.vowel_to_just_intonation_pitch_dict = vowel_to_just_intonation_pitch_dict
+        self.consonant_to_just_intonation_pitch_dict = (
+            consonant_to_just_intonation_pitch_dict
+        )
+        self._stop_time_array = None
+
+    # ######################################################## #
+    #                    conversion methods                    #
+    # ######################################################## #
+
+    @staticmethod
+    def _uncertain_range_to_tuple(
+        uncertain_range: dfc22_parameters.UncertainRange,
+    ) -> tuple[float, float]:
+        return (float(uncertain_range.start), float(uncertain_range.end))
+
+    @staticmethod
+    def _get_pitch_dict(
+        phoneme_group_list: list[dfc22_events.PhonemeGroup],
+        attribute_name: str,
+        default_pitch_dict: dict,
+    ) -> typing.Optional[dict]:
+        pitch_dict_list = []
+        for phoneme_group in phoneme_group_list:
+            pitch_dict = getattr(phoneme_group, attribute_name)
+            if not any(pitch_dict is other for other in pitch_dict_list):
+                pitch_dict_list.append(pitch_dict)
+        if len(pitch_dict_list) > 1:
+            raise Exception(
+                f"Found {len(pitch_dict_list)} different '{attribute_name}' "
+                "in one page. A page array can only save pages in which all "
+                "phoneme groups use the same dict."
+            )
+        if not pitch_dict_list or pitch_dict_list[0] is default_pitch_dict:
+            return None
+        return pitch_dict_list[0]
+
+    @classmethod
+    def from_page(cls, page: dfc22_events.Page) -> PageArray:
+        offset_list_tuple = tuple([0] for _ in range(cls._level_count - 1))
+        uncertain_rest_duration_list_tuple = tuple(
+            [] for _ in range(cls._level_count)
+        )
+        phoneme_id_list, uncertain_duration_list, exponent_tuple_list = [], [], []
+        phoneme_group_list = []
+
+        def add_structure(structure, level_index: int):
+            # Read the saved rest and not the property: words
+            # override the property with a constant.
+            uncertain_rest_duration_list_tuple[level_index].append(
+                cls._uncertain_range_to_tuple(structure._uncertain_rest_duration)
+            )
+            if level_index == cls._level_count - 1:
+                phoneme_group_list.append(structure)
+                phoneme_id_list.extend(
+                    phoneme.phoneme_id for phoneme in structure.phoneme_list
+                )
+                uncertain_duration_list.append(
+                    cls._uncertain_range_to_tuple(structure.uncertain_duration)
+                )
+                exponent_tuple_list.append(
+                    dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                        structure.non_terminal_pair
+                    ).exponent_tuple
+                )
+                offset_list_tuple[-1].append(len(phoneme_id_list))
+            else:
+                for child in structure:
+                    add_structure(child, level_index + 1)
+                if level_index:
+                    offset_list_tuple[level_index - 1].append(
+                        len(uncertain_rest_duration_list_tuple[level_index + 1])
+                    )
+
+        add_structure(page, 0)
+
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        maximum_exponent = np.iinfo(np.int16).max
+        for exponent_tuple in exponent_tuple_list:
+            if any(abs(exponent) > maximum_exponent for exponent in exponent_tuple):
+                raise Exception(
+                    f"Found exponent tuple '{exponent_tuple}' with exponents which "
+                    f"are bigger than {maximum_exponent}. They can't be saved in a "
+                    "page array."
+                )
+        (
+            paragraph_offset_array,
+            sentence_offset_array,
+            word_offset_array,
+            phoneme_group_offset_array,
+        ) = (np.array(offset_list, dtype=np.int32) for offset_list in offset_list_tuple)
+        return cls(
+            np.array(phoneme_id_list, dtype=np.uint16),
+            phoneme_group_offset_array,
+            word_offset_array,
+            sentence_offset_array,
+            paragraph_offset_array,
+            np.array(uncertain_duration_list, dtype=float).reshape(-1, 2),
+            tuple(
+                np.array(uncertain_rest_duration_list, dtype=float).reshape(-1, 2)
+                for uncertain_rest_duration_list in uncertain_rest_duration_list_tuple
+            ),
+            np.array(exponent_tuple_list, dtype=np.int16).reshape(
+                -1, exponent_count * 2
+            ),
+            page.initial_non_terminal_pair,
+            cls._get_pitch_dict(
+                phoneme_group_list,
+                "vowel_to_just_intonation_pitch_dict",
+                dfc22_events.constants.DEFAULT_VOWEL_TO_JUST_INTONATION_PITCH_DICT,
+            ),
+            cls._get_pitch_dict(
+                phoneme_group_list,
+                "consonant_to_just_intonation_pitch_dict",
+                dfc22_events.constants.DEFAULT_CONSONANT_TO_JUST_INTONATION_PITCH_DICT,
+            ),
+        )
+
+    def make_placement(
+        self,
+        initial_non_terminal_pair: typing.Union[
+            dfc22_parameters.NonTerminalPair, dfc22_parameters.CompactNonTerminalPair
+        ],
+    ) -> PageArray:
+        """Page array which shares all arrays but starts with another pair"""
+
+        placement = object.__new__(type(self))
+        placement.__dict__.update(self.__dict__)
+        placement.initial_non_terminal_pair = (
+            dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                initial_non_terminal_pair
+            )
+        )
+        return placement
+
+    def to_page(self) -> dfc22_events.Page:
+        page = self.view.to_language_structure()
+        page.initial_non_terminal_pair = (
+            self.initial_non_terminal_pair.to_non_terminal_pair()
+        )
+        return page
+
+    # ######################################################## #
+    #                      public api                          #
+    # ######################################################## #
+
+    @property
+    def view(self) -> PageView:
+        """Read only view with the same API as :class:`dfc22_events.Page`"""
+
+        return PageView(self, 0)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory which is used by the arrays"""
+
+        return sum(
+            array.nbytes
+            for array in (
+                self.phoneme_id_array,
+                self.uncertain_duration_array,
+                self.exponent_array,
+            )
+            + self.offset_array_tuple
+            + self.uncertain_rest_duration_array_tuple
+        )
+
+    @property
+    def stop_time_array(self) -> np.ndarray:
+        """The summed durations of all phoneme groups up to each group"""
+
+        if self._stop_time_array is None:
+            self._stop_time_array = np.cumsum(
+                self.uncertain_duration_array.mean(axis=1)
+                + self.uncertain_rest_duration_array_tuple[-1].mean(axis=1)
+            )
+        return self._stop_time_array
+
+    def get_phoneme_group_range(self, level_index: int, index: int) -> range:
+        """The phoneme groups of the structure at the given level"""
+
+        start, stop = index, index + 1
+        for offset_array in self.offset_array_tuple[level_index:-1]:
+            start, stop = int(offset_array[start]), int(offset_array[stop])
+        return range(start, stop)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Phoneme ids are only valid within one process, therefore
+        # the used phonemes are saved with the state.
+        state = dict(self.__dict__)
+        del state["_stop_time_array"]
+        state["phoneme_tuple"] = tuple(
+            dfc22_parameters.XSAMPAPhoneme.from_phoneme_id(phoneme_id).phoneme
+            for phoneme_id in range(int(self.phoneme_id_array.max(initial=-1)) + 1)
+        )
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        state = dict(state)
+        phoneme_id_to_phoneme_id_array = np.array(
+            [
+                dfc22_parameters.XSAMPAPhoneme(phoneme).phoneme_id
+                for phoneme in state.pop("phoneme_tuple")
+            ],
+            dtype=np.uint16,
+        )
+        state["phoneme_id_array"] = phoneme_id_to_phoneme_id_array[
+            state["phoneme_id_array"]
+        ]
+        self.__dict__.update(state)
+        self._stop_time_array = None
+
+
+class LanguageStructureView(abc.ABC):
+    """Read only view of one language structure in a :class:`PageArray`"""
+
+    __slots__ = ("_page_array", "_index")
+
+    _level_index: int
+
+    def __init__(self, page_array: PageArray, index: int):
+        self._page_array = page_array
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_xsampa_text!r})"
+
+    @property
+    def _phoneme_group_range(self) -> range:
+        return self._page_array.get_phoneme_group_range(self._level_index, self._index)
+
+    @property
+    def uncertain_rest_duration(self) -> dfc22_parameters.UncertainRange:
+        return dfc22_parameters.UncertainRange(
+            *self._page_array.uncertain_rest_duration_array_tuple[self._level_index][
+                self._index
+            ]
+        )
+
+    @property
+    def uncertain_duration(self) -> dfc22_parameters.UncertainRange:
+        phoneme_group_range = self._phoneme_group_range
+        return dfc22_parameters.UncertainRange(
+            *self._page_array.uncertain_duration_array[
+                phoneme_group_range.start : phoneme_group_range.stop
+            ].sum(axis=0)
+        )
+
+    @property
+    def duration(self) -> core_constants.DurationType:
+        phoneme_group_range = self._phoneme_group_range
+        if not phoneme_group_range:
+            return 0
+        stop_time_array = self._page_array.stop_time_array
+        start = phoneme_group_range.start
+        return float(
+            stop_time_array[phoneme_group_range.stop - 1]
+            - (stop_time_array[start - 1] if start else 0)
+        )
+
+    @property
+    def non_terminal_pair(self) -> dfc22_parameters.CompactNonTerminalPair:
+        phoneme_group_range = self._phoneme_group_range
+        return dfc22_parameters.CompactNonTerminalPair(
+            self._page_array.exponent_array[
+                phoneme_group_range.start : phoneme_group_range.stop
+            ]
+            .sum(axis=0, dtype=int)
+            .tolist()
+        )
+
+    @property
+    def pitch_movement(self) -> music_parameters.JustIntonationPitch:
+        # Interned pitches shouldn't be mutated.
+        return copy.copy(self.non_terminal_pair.vowel)
+
+    @property
+    def time_movement(self) -> music_parameters.JustIntonationPitch:
+        return copy.copy(self.non_terminal_pair.consonant)
+
+    @property
+    @abc.abstractmethod
+    def as_xsampa_text(self) -> str:
+        raise NotImplementedError
+
+    @property
+    def content_digest(self) -> str:
+        return self.to_language_structure().content_digest
+
+    @abc.abstractmethod
+    def to_language_structure(self) -> dfc22_events.LanguageStructure:
+        raise NotImplementedError
+
+
+class PhonemeGroupView(LanguageStructureView):
+    _level_index = 4
+
+    @property
+    def phoneme_list(self) -> list[dfc22_parameters.XSAMPAPhoneme]:
+        offset_array = self._page_array.offset_array_tuple[-1]
+        return [
+            dfc22_parameters.XSAMPAPhoneme.from_phoneme_id(phoneme_id)
+            for phoneme_id in self._page_array.phoneme_id_array[
+                offset_array[self._index] : offset_array[self._index + 1]
+            ]
+        ]
+
+    @property
+    def uncertain_duration(self) -> dfc22_parameters.UncertainRange:
+        return dfc22_parameters.UncertainRange(
+            *self._page_array.uncertain_duration_array[self._index]
+        )
+
+    @property
+    def as_xsampa_text(self) -> str:
+        return "".join([phoneme.phoneme for phoneme in self.phoneme_list])
+
+    def to_language_structure(self) -> dfc22_events.PhonemeGroup:
+        return dfc22_events.PhonemeGroup(
+            uncertain_duration=self.uncertain_duration,
+            phoneme_list=self.phoneme_list,
+            vowel_to_just_intonation_pitch_dict=self._page_array.vowel_to_just_intonation_pitch_dict,
+            consonant_to_just_intonation_pitch_dict=self._page_array.consonant_to_just_intonation_pitch_dict,
+            uncertain_rest_duration=self.uncertain_rest_duration,
+        )
+
+
+class NestedLanguageStructureView(LanguageStructureView):
+    _language_structure_class: typing.Type[dfc22_events.NestedLanguageStructure]
+    _child_view_class: typing.Type[LanguageStructureView]
+
+    @property
+    def _child_range(self) -> range:
+        offset_array = self._page_array.offset_array_tuple[self._level_index]
+        return range(int(offset_array[self._index]), int(offset_array[self._index + 1]))
+
+    def __len__(self) -> int:
+        return len(self._child_range)
+
+    def __iter__(self) -> typing.Iterator[LanguageStructureView]:
+        return (
+            self._child_view_class(self._page_array, child_index)
+            for child_index in self._child_range
+        )
+
+    def __getitem__(
+        self, index_or_slice: typing.Union[int, slice]
+    ) -> typing.Union[LanguageStructureView, tuple[LanguageStructureView, ...]]:
+        child_index_or_range = self._child_range[index_or_slice]
+        if isinstance(child_index_or_range, range):
+            return tuple(
+                self._child_view_class(self._page_array, child_index)
+                for child_index in child_index_or_range
+            )
+        return self._child_view_class(self._page_array, child_index_or_range)
+
+    @property
+    def as_xsampa_text(self) -> str:
+        return self._language_structure_class.xsampa_text_separator.join(
+            [event.as_xsampa_text for event in self]
+        )
+
+    def to_language_structure(self) -> dfc22_events.NestedLanguageStructure:
+        return self._language_structure_class(
+            [child.to_language_structure() for child in self],
+            uncertain_rest_duration=self.uncertain_rest_duration,
+        )
+
+
+class WordView(NestedLanguageStructureView):
+    _level_index = 3
+    _language_structure_class = dfc22_events.Word
+    _child_view_class = PhonemeGroupView
+
+    @property
+    def uncertain_rest_duration(self) -> dfc22_parameters.UncertainRange:
+        return dfc22_events.Word.uncertain_rest_duration.fget(self)
+
+    def to_language_structure(self) -> dfc22_events.Word:
+        return self._language_structure_class(
+            [child.to_language_structure() for child in self],
+            uncertain_rest_duration=LanguageStructureView.uncertain_rest_duration.fget(
+                self
+            ),
+        )
+
+
+class SentenceView(NestedLanguageStructureView):
+    _level_index = 2
+    _language_structure_class = dfc22_events.Sentence
+    _child_view_class = WordView
+
+
+class ParagraphView(NestedLanguageStructureView):
+    _level_index = 1
+    _language_structure_class = dfc22_events.Paragraph
+    _child_view_class = SentenceView
+
+    @property
+    def as_xsampa_text(self) -> str:
+        return (
+            super().as_xsampa_text
+            + self._language_structure_class.xsampa_text_separator
+        )
+
+
+class PageView(NestedLanguageStructureView):
+    _level_index = 0
+    _language_structure_class = dfc22_events.Page
+    _child_view_class = ParagraphView
+
+    @property
+    def initial_non_terminal_pair(self) -> dfc22_parameters.CompactNonTerminalPair:
+        return self._page_array.initial_non_terminal_pair
+
+    @property
+    def as_xsampa_text(self) -> str:
+        xsampa_text = super().as_xsampa_text
+        return "".join(["\t" + line + "\n" for line in xsampa_text.split("\n")])
@@ -1,6 +1,11 @@
 import abc
+import copy
+import hashlib
 import typing
 import warnings
+import weakref
+
+import numpy as np
 
 from mutwo import core_constants
 from mutwo import core_events
@@ -31,6 +36,164 @@ def get_movement_sum(
     )[-1]
 
 
+class _PhonemeIdToPitchTable(object):
+    """Exponent vectors of the pitches of a phoneme to pitch dict.
+
+    The rows of the table are indexed by phoneme ids (see
+    :class:`mutwo.dfc22_parameters.XSAMPAPhoneme`). Only vowels
+    (or only consonants) are looked up, the rows of all other phonemes
+    are zero. The dicts shouldn't be mutated after their table has
+    been created. Tables are only kept as long as they are used (phoneme
+    groups keep their tables in their cache).
+    """
+
+    _key_to_phoneme_id_to_pitch_table: weakref.WeakValueDictionary[
+        tuple[int, bool], "_PhonemeIdToPitchTable"
+    ] = weakref.WeakValueDictionary()
+
+    def __init__(
+        self,
+        phoneme_to_just_intonation_pitch_dict: dict[
+            dfc22_parameters.XSAMPAPhoneme, music_parameters.JustIntonationPitch
+        ],
+        is_vowel: bool,
+    ):
+        self._phoneme_to_just_intonation_pitch_dict = (
+            phoneme_to_just_intonation_pitch_dict
+        )
+        self._is_vowel = is_vowel
+        self._content_bytes = None
+        self._update()
+
+    @classmethod
+    def get(
+        cls,
+        phoneme_to_just_intonation_pitch_dict: dict[
+            dfc22_parameters.XSAMPAPhoneme, music_parameters.JustIntonationPitch
+        ],
+        is_vowel: bool,
+    ) -> "_PhonemeIdToPitchTable":
+        # The table keeps its dict alive, therefore the id of the
+        # dict can't be reused by another dict as long as the table
+        # exists.
+        key = (id(phoneme_to_just_intonation_pitch_dict), is_vowel)
+        try:
+            return cls._key_to_phoneme_id_to_pitch_table[key]
+        except KeyError:
+            phoneme_id_to_pitch_table = cls._key_to_phoneme_id_to_pitch_table[
+                key
+            ] = cls(phoneme_to_just_intonation_pitch_dict, is_vowel)
+            return phoneme_id_to_pitch_table
+
+    def _update(self):
+        phoneme_count = dfc22_parameters.XSAMPAPhoneme.get_phoneme_count()
+        exponent_count = max(
+            (
+                len(pitch.exponent_tuple)
+                for pitch in self._phoneme_to_just_intonation_pitch_dict.values()
+            ),
+            default=0,
+        )
+        self._exponent_array = np.zeros((phoneme_count, exponent_count), dtype=int)
+        self._is_missing_array = np.zeros(phoneme_count, dtype=bool)
+        for phoneme_id in range(phoneme_count):
+            phoneme = dfc22_parameters.XSAMPAPhoneme.from_phoneme_id(phoneme_id)
+            if phoneme.is_vowel != self._is_vowel:
+                continue
+            try:
+                exponent_tuple = self._phoneme_to_just_intonation_pitch_dict[
+                    phoneme
+                ].exponent_tuple
+            except KeyError:
+                self._is_missing_array[phoneme_id] = True
+            else:
+                self._exponent_array[phoneme_id, : len(exponent_tuple)] = exponent_tuple
+
+    @property
+    def content_bytes(self) -> bytes:
+        """Stable representation of the dict (for content digests)"""
+
+        if self._content_bytes is None:
+            phoneme_and_exponent_tuple_list = []
+            for phoneme, pitch in self._phoneme_to_just_intonation_pitch_dict.items():
+                exponent_list = list(pitch.exponent_tuple)
+                # Pitches don't necessarily save trailing zeros
+                while exponent_list and exponent_list[-1] == 0:
+                    del exponent_list[-1]
+                phoneme_and_exponent_tuple_list.append(
+                    (str(phoneme), tuple(exponent_list))
+                )
+            self._content_bytes = repr(sorted(phoneme_and_exponent_tuple_list)).encode()
+        return self._content_bytes
+
+    def get_movement(
+        self, phoneme_sequence: typing.Sequence[dfc22_parameters.XSAMPAPhoneme]
+    ) -> music_parameters.JustIntonationPitch:
+        """Sum of the pitches of all vowels (or consonants)"""
+
+        phoneme_id_list = [phoneme.phoneme_id for phoneme in phoneme_sequence]
+        if phoneme_id_list and max(phoneme_id_list) >= len(self._is_missing_array):
+            # Phonemes which have been created after the table
+            self._update()
+        is_missing_array = self._is_missing_array[phoneme_id_list]
+        if np.any(is_missing_array):
+            raise KeyError(phoneme_sequence[int(np.argmax(is_missing_array))])
+        exponent_list = self._exponent_array[phoneme_id_list].sum(axis=0).tolist()
+        # Pitches don't save trailing zeros
+        while exponent_list and exponent_list[-1] == 0:
+            del exponent_list[-1]
+        if not exponent_list:
+            return music_parameters.JustIntonationPitch("1/1")
+        return music_parameters.JustIntonationPitch(tuple(exponent_list))
+
+
+class _PhonemeList(dfc22_events.abc.ListWithCache):
+    """List which converts all added strings to XSAMPA phonemes.
+
+    The movements and the content digest of a phoneme group read the
+    attributes of :class:`mutwo.dfc22_parameters.XSAMPAPhoneme`,
+    therefore the list never contains plain strings (also not after
+    in place mutations).
+    """
+
+    def __init__(
+        self,
+        phoneme_iterable: typing.Iterable[
+            typing.Union[dfc22_parameters.XSAMPAPhoneme, str]
+        ] = tuple([]),
+    ):
+        super().__init__(self._to_phoneme(phoneme) for phoneme in phoneme_iterable)
+
+    @staticmethod
+    def _to_phoneme(
+        phoneme: typing.Union[dfc22_parameters.XSAMPAPhoneme, str]
+    ) -> dfc22_parameters.XSAMPAPhoneme:
+        if isinstance(phoneme, dfc22_parameters.XSAMPAPhoneme):
+            return phoneme
+        return dfc22_parameters.XSAMPAPhoneme(phoneme)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = [self._to_phoneme(phoneme) for phoneme in value]
+        else:
+            value = self._to_phoneme(value)
+        super().__setitem__(key, value)
+
+    def __iadd__(self, phoneme_iterable):
+        return super().__iadd__(
+            [self._to_phoneme(phoneme) for phoneme in phoneme_iterable]
+        )
+
+    def append(self, phoneme):
+        super().append(self._to_phoneme(phoneme))
+
+    def extend(self, phoneme_iterable):
+        super().extend([self._to_phoneme(phoneme) for phoneme in phoneme_iterable])
+
+    def insert(self, index, phoneme):
+        super().insert(index, self._to_phoneme(phoneme))
+
+
 class LanguageStructure(object):
     def __init__(
         self,
@@ -59,6 +222,7 @@ class LanguageStructure(object):
         self, uncertain_rest_duration: dfc22_parameters.UncertainRange
     ):
         self._uncertain_rest_duration = uncertain_rest_duration
+        self._invalidate_cache()
 
     @property
     @abc.abstractmethod
@@ -79,14 +243,88 @@ class LanguageStructure(object):
     def as_xsampa_text(self) -> str:
         raise NotImplementedError
 
+    def iterate_xsampa_text(self) -> typing.Iterator[str]:
+        """Yield the XSAMPA text in parts (which join to :attr:`as_xsampa_text`)"""
+
+        yield self.as_xsampa_text
+
     @property
     def non_terminal_pair(self) -> dfc22_parameters.NonTerminalPair:
-        return dfc22_parameters.NonTerminalPair(
-            consonant=self.time_movement, vowel=self.pitch_movement
+        return self._get_cached_value(
+            "non_terminal_pair",
+            lambda: dfc22_parameters.NonTerminalPair(
+                consonant=self.time_movement, vowel=self.pitch_movement
+            ),
         )
 
+    def _get_cached_movement(
+        self,
+        key: str,
+        compute: typing.Callable[[], music_parameters.JustIntonationPitch],
+    ) -> music_parameters.JustIntonationPitch:
+        # Pitches can be mutated in place, therefore the cached
+        # pitch itself is never returned.
+        return copy.copy(self._get_cached_value(key, compute))
+
+    @abc.abstractmethod
+    def _update_content_hash(self, content_hash):
+        raise NotImplementedError
+
+    @property
+    def content_digest(self) -> str:
+        """Stable digest of the phonemes, pitches, structure and durations.
+
+        The digest is cached until the structure is mutated. Because it
+        is independent of the running process it can also be used as a
+        persistent key (for instance to cache results on the disk).
+        """
+
+        def get_content_digest() -> str:
+            content_hash = hashlib.blake2b(digest_size=16)
+            self._update_content_hash(content_hash)
+            return content_hash.hexdigest()
+
+        return self._get_cached_value("content_digest", get_content_digest)
+
+    @staticmethod
+    def _uncertain_range_to_bytes(
+        uncertain_range: dfc22_parameters.UncertainRange,
+    ) -> bytes:
+        return f"{float(uncertain_range.start)!r}:{float(uncertain_range.end)!r}".encode()
+
+    # Structures are equal if they have the same content and start with
+    # the same non terminal pair (placements of the same content result in
+    # different pitches and pulses). The content digest itself doesn't
+    # depend on the initial non terminal pair.
+    def _content_digest_hash(self) -> int:
+        return hash((self.content_digest, self.initial_non_terminal_pair))
+
+    def _content_digest_eq(self, other: typing.Any) -> bool:
+        try:
+            return (
+                self.content_digest == other.content_digest
+                and self.initial_non_terminal_pair == other.initial_non_terminal_pair
+            )
+        except AttributeError:
+            return False
+
+    def _content_digest_ne(self, other: typing.Any) -> bool:
+        return not self._content_digest_eq(other)
+
+
+class PhonemeGroup(
+    dfc22_events.abc.ObjectWithCache, core_events.SimpleEvent, LanguageStructure
+):
+    # Pairs and pitch dicts are only replaced and never mutated,
+    # therefore copies can share them. Ranges are mutable and are
+    # copied (the memo of deepcopy still copies a range which is used
+    # by many phoneme groups only once).
+    _shared_attribute_name_tuple = (
+        "initial_non_terminal_pair",
+        "_vowel_to_just_intonation_pitch_dict",
+        "_consonant_to_just_intonation_pitch_dict",
+    )
 
-class PhonemeGroup(core_events.SimpleEvent, LanguageStructure):
     def __init__(
         self,
         uncertain_duration: typing.Optional[dfc22_parameters.UncertainRange] = None,
@@ -123,12 +361,7 @@ class PhonemeGroup(core_events.SimpleEvent, LanguageStructure):
             consonant_to_just_intonation_pitch_dict
         )
         self.uncertain_duration = uncertain_duration
-        self.phoneme_list = [
-            phoneme
-            if isinstance(phoneme, dfc22_parameters.XSAMPAPhoneme)
-            else dfc22_parameters.XSAMPAPhoneme(phoneme)
-            for phoneme in phoneme_list
-        ]
+        self.phoneme_list = phoneme_list
 
     @property
     def _parameter_to_print_tuple(self) -> tuple[str, ...]:
@@ -156,6 +389,34 @@ class PhonemeGroup(core_events.SimpleEvent, LanguageStructure):
     ) -> dict[dfc22_parameters.XSAMPAPhoneme, music_parameters.JustIntonationPitch]:
         return self._vowel_to_just_intonation_pitch_dict
 
+    @property
+    def phoneme_list(self) -> list[dfc22_parameters.XSAMPAPhoneme]:
+        return self._phoneme_list
+
+    @phoneme_list.setter
+    def phoneme_list(
+        self, phoneme_list: list[typing.Union[dfc22_parameters.XSAMPAPhoneme, str]]
+    ):
+        # The list invalidates the cache of the phoneme group
+        # if it is mutated in place.
+        self._phoneme_list = _PhonemeList(phoneme_list)
+        self._invalidate_cache()
+
+    def _get_child_with_cache_iterable(
+        self,
+    ) -> typing.Iterable[dfc22_events.abc.ObjectWithCache]:
+        return (self.phoneme_list,)
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        # Phoneme groups which have been pickled before the phoneme
+        # list became a property or before it converted strings
+        state = dict(state)
+        if "phoneme_list" in state:
+            state["_phoneme_list"] = state.pop("phoneme_list")
+        if not isinstance(state["_phoneme_list"], _PhonemeList):
+            state["_phoneme_list"] = _PhonemeList(state["_phoneme_list"])
+        super().__setstate__(state)
+
     @property
     def uncertain_duration(self) -> dfc22_parameters.UncertainRange:
         return self._uncertain_duration
@@ -163,6 +424,7 @@ class PhonemeGroup(core_events.SimpleEvent, LanguageStructure):
     @uncertain_duration.setter
     def uncertain_duration(self, uncertain_duration: dfc22_parameters.UncertainRange):
         self._uncertain_duration = uncertain_duration
+        self._invalidate_cache()
 
     @staticmethod
     def _get_center(start: float, stop: float) -> float:
@@ -188,38 +450,88 @@ class PhonemeGroup(core_events.SimpleEvent, LanguageStructure):
             duration, duration * 1.0001
         )
 
+    def _get_phoneme_id_to_pitch_table(self, is_vowel: bool) -> _PhonemeIdToPitchTable:
+        # The cache keeps the table alive (tables are only weakly
+        # referenced by their registry).
+        if is_vowel:
+            key = "vowel_phoneme_id_to_pitch_table"
+            phoneme_to_just_intonation_pitch_dict = (
+                self.vowel_to_just_intonation_pitch_dict
+            )
+        else:
+            key = "consonant_phoneme_id_to_pitch_table"
+            phoneme_to_just_intonation_pitch_dict = (
+                self.consonant_to_just_intonation_pitch_dict
+            )
+        return self._get_cached_value(
+            key,
+            lambda: _PhonemeIdToPitchTable.get(
+                phoneme_to_just_intonation_pitch_dict, is_vowel
+            ),
+        )
+
     @property
     def pitch_movement(self) -> music_parameters.JustIntonationPitch:
-        return get_movement_sum(
-            [
-                self.vowel_to_just_intonation_pitch_dict[phoneme]
-                for phoneme in self.phoneme_list
-                if phoneme.is_vowel
-            ]
+        return self._get_cached_movement(
+            "pitch_movement",
+            lambda: self._get_phoneme_id_to_pitch_table(True).get_movement(
+                self.phoneme_list
+            ),
         )
 
     @property
     def time_movement(self) -> music_parameters.JustIntonationPitch:
-        return get_movement_sum(
-            [
-                self.consonant_to_just_intonation_pitch_dict[phoneme]
-                for phoneme in self.phoneme_list
-                if phoneme.is_consonant
-            ]
+        return self._get_cached_movement(
+            "time_movement",
+            lambda: self._get_phoneme_id_to_pitch_table(False).get_movement(
+                self.phoneme_list
+            ),
         )
 
     @property
     def as_xsampa_text(self) -> str:
-        return "".join([phoneme.phoneme for phoneme in self.phoneme_list])
+        return self._get_cached_value(
+            "as_xsampa_text",
+            lambda: "".join([phoneme.phoneme for phoneme in self.phoneme_list]),
+        )
+
+    # Events define their own comparison, therefore the
+    # methods need to be set explicitly.
+    __hash__ = LanguageStructure._content_digest_hash
+    __eq__ = LanguageStructure._content_digest_eq
+    __ne__ = LanguageStructure._content_digest_ne
+
+    def _update_content_hash(self, content_hash):
+        content_hash.update(type(self).__name__.encode())
+        content_hash.update(
+            # Separate phonemes, because a phoneme can have
+            # more than one character.
+            " ".join([phoneme.phoneme for phoneme in self.phoneme_list]).encode()
+        )
+        content_hash.update(self._uncertain_range_to_bytes(self.uncertain_duration))
+        content_hash.update(
+            self._uncertain_range_to_bytes(self.uncertain_rest_duration)
+        )
+        # The pitch dicts define the movements of the phoneme group.
+        for is_vowel in (True, False):
+            content_hash.update(
+                self._get_phoneme_id_to_pitch_table(is_vowel).content_bytes
+            )
 
 
 T = typing.TypeVar("T", bound=LanguageStructure)
 
 
 class NestedLanguageStructure(
-    core_events.SequentialEvent, typing.Generic[T], LanguageStructure
+    dfc22_events.abc.ListWithCache,
+    core_events.SequentialEvent,
+    typing.Generic[T],
+    LanguageStructure,
 ):
     xsampa_text_separator = " "
+    # Ranges are mutable, therefore only the pair is shared by copies
+    # (see PhonemeGroup).
+    _shared_attribute_name_tuple = ("initial_non_terminal_pair",)
 
     def __init__(
         self,
@@ -232,28 +544,85 @@ class NestedLanguageStructure(
 
     @property
     def uncertain_duration(self) -> dfc22_parameters.UncertainRange:
-        minima, maxima = 0, 0
-        for phoneme_group in self:
-            local_uncertain_duration = phoneme_group.uncertain_duration
-            local_minima, local_maxima = (
-                local_uncertain_duration.start,
-                local_uncertain_duration.end,
-            )
-            minima += local_minima
-            maxima += local_maxima
-        return dfc22_parameters.UncertainRange(minima, maxima)
+        def get_minima_and_maxima() -> tuple[float, float]:
+            minima, maxima = 0, 0
+            for phoneme_group in self:
+                local_uncertain_duration = phoneme_group.uncertain_duration
+                local_minima, local_maxima = (
+                    local_uncertain_duration.start,
+                    local_uncertain_duration.end,
+                )
+                minima += local_minima
+                maxima += local_maxima
+            return minima, maxima
+
+        # Ranges are mutable, therefore only the numbers are cached.
+        return dfc22_parameters.UncertainRange(
+            *self._get_cached_value("minima_and_maxima", get_minima_and_maxima)
+        )
+
+    @property
+    def duration(self) -> core_constants.DurationType:
+        return self._get_cached_value(
+            "duration", lambda: core_events.SequentialEvent.duration.fget(self)
+        )
+
+    @duration.setter
+    def duration(self, duration: core_constants.DurationType):
+        core_events.SequentialEvent.duration.fset(self, duration)
+        self._invalidate_cache()
 
     @property
     def pitch_movement(self) -> music_parameters.JustIntonationPitch:
-        return get_movement_sum([event.pitch_movement for event in self])
+        return self._get_cached_movement(
+            "pitch_movement",
+            lambda: get_movement_sum([event.pitch_movement for event in self]),
+        )
 
     @property
     def time_movement(self) -> music_parameters.JustIntonationPitch:
-        return get_movement_sum([event.time_movement for event in self])
+        return self._get_cached_movement(
+            "time_movement",
+            lambda: get_movement_sum([event.time_movement for event in self]),
+        )
 
     @property
     def as_xsampa_text(self) -> str:
-        return self.xsampa_text_separator.join([event.as_xsampa_text for event in self])
+        return self._get_cached_value(
+            "as_xsampa_text", lambda: "".join(self.iterate_xsampa_text())
+        )
+
+    def iterate_xsampa_text(self) -> typing.Iterator[str]:
+        for index, event in enumerate(self):
+            if index:
+                yield self.xsampa_text_separator
+            yield event.as_xsampa_text
+
+    def make_placement(
+        self, initial_non_terminal_pair: dfc22_parameters.NonTerminalPair
+    ) -> "NestedLanguageStructure":
+        """Copy of the structure which starts with another non terminal pair.
+
+        The copy is shallow: it shares its children with the original
+        structure, therefore neither the children of the placement nor
+        the children of the original should be mutated afterwards.
+        """
+
+        placement = copy.copy(self)
+        placement.initial_non_terminal_pair = initial_non_terminal_pair
+        return placement
+
+    __hash__ = LanguageStructure._content_digest_hash
+    __eq__ = LanguageStructure._content_digest_eq
+    __ne__ = LanguageStructure._content_digest_ne
+
+    def _update_content_hash(self, content_hash):
+        content_hash.update(f"{type(self).__name__}({len(self)})".encode())
+        for event in self:
+            content_hash.update(event.content_digest.encode())
+        content_hash.update(
+            self._uncertain_range_to_bytes(self.uncertain_rest_duration)
+        )
 
 
 class Word(NestedLanguageStructure[PhonemeGroup]):
@@ -327,12 +696,9 @@ class Paragraph(NestedLanguageStructure[Sentence]):
             *args, uncertain_rest_duration=uncertain_rest_duration, **kwargs
         )
 
-    @property
-    def as_xsampa_text(self) -> str:
-        return (
-            self.xsampa_text_separator.join([event.as_xsampa_text for event in self])
-            + self.xsampa_text_separator
-        )
+    def iterate_xsampa_text(self) -> typing.Iterator[str]:
+        yield from super().iterate_xsampa_text()
+        yield self.xsampa_text_separator
 
 
 class Page(NestedLanguageStructure[Paragraph]):
@@ -354,11 +720,15 @@ class Page(NestedLanguageStructure[Paragraph]):
             *args, uncertain_rest_duration=uncertain_rest_duration, **kwargs
         )
 
-    @property
-    def as_xsampa_text(self) -> str:
-        xsampa_text = super().as_xsampa_text
-        return "".join(["\t" + line + "\n" for line in xsampa_text.split("\n")])
-
-    def __hash__(self) -> int:
-        # UNSAFE HASH!
-        return hash(self.as_xsampa_text)
+    def iterate_xsampa_text(self) -> typing.Iterator[str]:
+        # Each line is indented and ends with a newline. Only the text of
+        # one paragraph is kept in memory at the same time.
+        line = ""
+        for index, paragraph in enumerate(self):
+            xsampa_text = paragraph.as_xsampa_text
+            if index:
+                xsampa_text = self.xsampa_text_separator + xsampa_text
+            *complete_line_list, line = (line + xsampa_text).split("\n")
+            for complete_line in complete_line_list:
+                yield "\t" + complete_line + "\n"
+        yield "\t" + line + "\n"
@@ -1,12 +1,17 @@
 import quicktions as fractions
 
+from mutwo import dfc22_events
 from mutwo import music_events
 
 
 __all__ = ("NoteLikeWithPhoneme", "NoteLikeWithVowelAndConsonantTuple")
 
 
-class NoteLikeWithPulse(music_events.NoteLike):
+class NoteLikeWithPulse(
+    dfc22_events.abc.ObjectWithSharedAttributes, music_events.NoteLike
+):
+    _shared_attribute_name_tuple = ("pulse",)
+
     def __init__(
         self, *args, pulse: fractions.Fraction = fractions.Fraction(1, 1), **kwargs
     ):
@@ -15,12 +20,21 @@ class NoteLikeWithPulse(music_events.NoteLike):
 
 
 class NoteLikeWithPhoneme(NoteLikeWithPulse):
+    _shared_attribute_name_tuple = NoteLikeWithPulse._shared_attribute_name_tuple + (
+        "phoneme",
+    )
+
     def __init__(self, *args, phoneme: str = "a", **kwargs):
         self.phoneme = phoneme
         super().__init__(*args, **kwargs)
 
 
 class NoteLikeWithVowelAndConsonantTuple(NoteLikeWithPulse):
+    _shared_attribute_name_tuple = NoteLikeWithPulse._shared_attribute_name_tuple + (
+        "vowel",
+        "consonant_tuple",
+    )
+
     def __init__(
         self,
         *args,
@@ -1,15 +1,21 @@
+import copy
 import dataclasses
+import itertools
 import typing
 
+import numpy as np
+
 from mutwo import core_constants
 from mutwo import core_events
 from mutwo import dfc22_events
 from mutwo import dfc22_parameters
 
-__all__ = ("UnisonoEvent", "SequentialUnisonoEvent")
+__all__ = ("UnisonoEvent", "SequentialUnisonoEvent", "RepeatedSequentialUnisonoEvent")
+
 
+class UnisonoEvent(dfc22_events.abc.ObjectWithCache, core_events.SimpleEvent):
+    _shared_attribute_name_tuple = ("_reader_tuple", "non_terminal_pair")
 
-class UnisonoEvent(core_events.SimpleEvent):
     def __init__(
         self,
         reader_tuple: tuple[int, ...],
@@ -35,6 +41,23 @@ class UnisonoEvent(core_events.SimpleEvent):
             not in ("page",)
         )
 
+    @property
+    def reader_tuple(self) -> tuple[int, ...]:
+        return self._reader_tuple
+
+    @reader_tuple.setter
+    def reader_tuple(self, reader_tuple: tuple[int, ...]):
+        self._reader_tuple = tuple(reader_tuple)
+        self._invalidate_cache()
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        # Unisono events which have been pickled before the
+        # reader tuple became a property
+        if "reader_tuple" in state:
+            state = dict(state)
+            state["_reader_tuple"] = tuple(state.pop("reader_tuple"))
+        super().__setstate__(state)
+
     @property
     def right_non_terminal_pair(
         self,
@@ -55,7 +78,23 @@ class UnisonoEvent(core_events.SimpleEvent):
             self.duration = page.duration
 
 
-class SequentialUnisonoEvent(core_events.SequentialEvent[UnisonoEvent]):
+class SequentialUnisonoEvent(
+    dfc22_events.abc.ListWithCache, core_events.SequentialEvent[UnisonoEvent]
+):
+    """Sequence of unisono events (a cyclic structure).
+
+    The distribution of readers on unisono events is also available as
+    (cached) numpy arrays with the shape (reader_count, unisono_event_count):
+
+        - :attr:`reader_incidence_matrix`
+        - :attr:`next_occurrence_index_matrix`
+        - :attr:`previous_occurrence_index_matrix`
+        - :attr:`gap_length_matrix`
+
+    The arrays are read-only and they are recalculated after the sequence
+    or the reader tuple of any of its unisono events has been changed.
+    """
+
     @dataclasses.dataclass(frozen=True)
     class Movement(object):
         reader: int
@@ -106,14 +145,219 @@ class SequentialUnisonoEvent(core_events.SequentialEvent[UnisonoEvent]):
                 f"right_index={self.unisono_event_right_index})"
             )
 
+    @staticmethod
+    def _make_read_only(array: np.ndarray) -> np.ndarray:
+        array.setflags(write=False)
+        return array
+
+    @property
+    def reader_count(self) -> int:
+        """Highest reader index + 1"""
+
+        def get_reader_count() -> int:
+            return (
+                max(
+                    [
+                        reader_index
+                        for unisono_event in self
+                        for reader_index in unisono_event.reader_tuple
+                    ]
+                    + [-1]
+                )
+                + 1
+            )
+
+        return self._get_cached_value("reader_count", get_reader_count)
+
+    @property
+    def reader_incidence_matrix(self) -> np.ndarray:
+        """Boolean matrix: is reader (row) part of unisono event (column)"""
+
+        def get_reader_incidence_matrix() -> np.ndarray:
+            reader_incidence_matrix = np.zeros(
+                (self.reader_count, len(self)), dtype=bool
+            )
+            for unisono_event_index, unisono_event in enumerate(self):
+                reader_incidence_matrix[
+                    list(unisono_event.reader_tuple), unisono_event_index
+                ] = True
+            return self._make_read_only(reader_incidence_matrix)
+
+        return self._get_cached_value(
+            "reader_incidence_matrix", get_reader_incidence_matrix
+        )
+
+    @property
+    def next_occurrence_index_matrix(self) -> np.ndarray:
+        """Index of the next unisono event of the reader (or -1).
+
+        Because the sequence is cyclic the next unisono event of the last
+        appearance of a reader is its first unisono event. If a reader only
+        appears once, its next unisono event is the unisono event itself.
+        If a reader doesn't appear at all the index is -1.
+        """
+
+        def get_next_occurrence_index_matrix() -> np.ndarray:
+            unisono_event_count = len(self)
+            doubled_reader_incidence_matrix = np.tile(
+                self.reader_incidence_matrix, 2
+            )
+            position_array = np.arange(unisono_event_count * 2)
+            # Index of the first appearance at or after each position.
+            next_position_matrix = np.minimum.accumulate(
+                np.where(
+                    doubled_reader_incidence_matrix,
+                    position_array,
+                    unisono_event_count * 2,
+                )[:, ::-1],
+                axis=1,
+            )[:, ::-1]
+            next_position_matrix = next_position_matrix[
+                :, 1 : unisono_event_count + 1
+            ]
+            return self._make_read_only(
+                np.where(
+                    next_position_matrix < unisono_event_count * 2,
+                    next_position_matrix % max(unisono_event_count, 1),
+                    -1,
+                )
+            )
+
+        return self._get_cached_value(
+            "next_occurrence_index_matrix", get_next_occurrence_index_matrix
+        )
+
+    @property
+    def previous_occurrence_index_matrix(self) -> np.ndarray:
+        """Index of the previous unisono event of the reader (or -1).
+
+        See :attr:`next_occurrence_index_matrix`.
+        """
+
+        def get_previous_occurrence_index_matrix() -> np.ndarray:
+            unisono_event_count = len(self)
+            doubled_reader_incidence_matrix = np.tile(
+                self.reader_incidence_matrix, 2
+            )
+            position_array = np.arange(unisono_event_count * 2)
+            # Index of the last appearance at or before each position.
+            previous_position_matrix = np.maximum.accumulate(
+                np.where(doubled_reader_incidence_matrix, position_array, -1),
+                axis=1,
+            )
+            previous_position_matrix = previous_position_matrix[
+                :, unisono_event_count - 1 : (unisono_event_count * 2) - 1
+            ]
+            return self._make_read_only(
+                np.where(
+                    previous_position_matrix >= 0,
+                    previous_position_matrix % max(unisono_event_count, 1),
+                    -1,
+                )
+            )
+
+        return self._get_cached_value(
+            "previous_occurrence_index_matrix", get_previous_occurrence_index_matrix
+        )
+
+    @property
+    def gap_length_matrix(self) -> np.ndarray:
+        """How many unisono events later the reader appears again (or 0).
+
+        If a reader only appears once, the gap length is the length of
+        the sequence. If a reader doesn't appear at all the gap length is 0.
+        """
+
+        def get_gap_length_matrix() -> np.ndarray:
+            next_occurrence_index_matrix = self.next_occurrence_index_matrix
+            unisono_event_count = len(self)
+            return self._make_read_only(
+                np.where(
+                    next_occurrence_index_matrix >= 0,
+                    (
+                        (
+                            next_occurrence_index_matrix
+                            - np.arange(unisono_event_count)
+                            - 1
+                        )
+                        % max(unisono_event_count, 1)
+                    )
+                    + 1,
+                    0,
+                )
+            )
+
+        return self._get_cached_value("gap_length_matrix", get_gap_length_matrix)
+
+    def get_gap_duration_matrix(self) -> np.ndarray:
+        """How long the reader waits between the unisono event and its next one.
+
+        The duration is the sum of the durations of all unisono events
+        between the unisono event (excluded) and the next unisono event of
+        the reader (excluded). Cells of unisono events where the reader
+        doesn't appear are 0.
+        """
+
+        unisono_event_count = len(self)
+        duration_array = np.array(
+            [float(unisono_event.duration) for unisono_event in self]
+        )
+        # Start time of each position in the doubled sequence
+        doubled_start_time_array = np.concatenate(
+            ([0], np.cumsum(np.tile(duration_array, 2)))
+        )
+        unisono_event_index_array = np.arange(unisono_event_count)
+        gap_stop_position_matrix = (
+            unisono_event_index_array + self.gap_length_matrix
+        )
+        gap_duration_matrix = (
+            doubled_start_time_array[gap_stop_position_matrix]
+            - doubled_start_time_array[unisono_event_index_array + 1]
+        )
+        return np.where(self.reader_incidence_matrix, gap_duration_matrix, 0)
+
+    def get_movement_tuple(self) -> tuple[Movement, ...]:
+        """Find all movements of all readers.
+
+        Each reader moves from one of its unisono events to its next
+        unisono event (and from its last unisono event back to its first
+        unisono event, because the sequence is cyclic). Readers which only
+        appear in one unisono event don't move.
+
+        The movements are sorted by the index of their right unisono event
+        and by their reader (the movements back to the first unisono events
+        are at the end).
+        """
+
+        next_occurrence_index_matrix = self.next_occurrence_index_matrix
+        reader_index_array, left_index_array = np.nonzero(
+            self.reader_incidence_matrix
+            & (next_occurrence_index_matrix != np.arange(len(self)))
+        )
+        right_index_array = next_occurrence_index_matrix[
+            reader_index_array, left_index_array
+        ]
+        is_back_to_first_array = right_index_array <= left_index_array
+        sorting_index_array = np.lexsort(
+            (reader_index_array, right_index_array, is_back_to_first_array)
+        )
+        return tuple(
+            self.Movement(
+                reader_index,
+                self[left_index],
+                self[right_index],
+                left_index,
+                right_index,
+            )
+            for reader_index, left_index, right_index in zip(
+                reader_index_array[sorting_index_array].tolist(),
+                left_index_array[sorting_index_array].tolist(),
+                right_index_array[sorting_index_array].tolist(),
+            )
+        )
+
     def get_movement_set(self) -> set[Movement]:
-        movement_list = []
-        for index, _ in enumerate(self):
-            for reader_index_to_movement in self.get_movement_dict(index).values():
-                for movement in reader_index_to_movement.values():
-                    if movement not in movement_list:
-                        movement_list.append(movement)
-        return set(movement_list)
+        return set(self.get_movement_tuple())
 
     def get_movement_dict(
         self, unisono_event_index: int
@@ -178,3 +422,290 @@ class SequentialUnisonoEvent(core_events.SequentialEvent[UnisonoEvent]):
                         ]
 
         return movement_dict
+
+
+class _RepeatedUnisonoEvent(UnisonoEvent):
+    """Unisono event at one position of a :class:`RepeatedSequentialUnisonoEvent`.
+
+    The view only knows its sequence and its position. Page, non terminal
+    pair, duration and repetition count are read from the overlay of the
+    position (if they have been set) or from the pattern unisono event.
+    Setting them only changes the overlay of the position. The reader
+    tuple is always the reader tuple of the pattern unisono event.
+    """
+
+    def __init__(
+        self,
+        repeated_sequential_unisono_event: "RepeatedSequentialUnisonoEvent",
+        index: int,
+    ):
+        self._repeated_sequential_unisono_event = repeated_sequential_unisono_event
+        self._index = index
+
+    def _get_value(self, attribute_name: str) -> typing.Any:
+        return self._repeated_sequential_unisono_event._get_overlay_value(
+            self._index, attribute_name
+        )
+
+    def _set_value(self, attribute_name: str, value: typing.Any):
+        self._repeated_sequential_unisono_event._set_overlay_value(
+            self._index, attribute_name, value
+        )
+
+    @property
+    def reader_tuple(self) -> tuple[int, ...]:
+        return self._get_value("reader_tuple")
+
+    @reader_tuple.setter
+    def reader_tuple(self, reader_tuple: tuple[int, ...]):
+        raise NotImplementedError(
+            "The reader tuple of a repeated unisono event can only be "
+            "changed in the pattern."
+        )
+
+    @property
+    def page(self) -> dfc22_events.Page:
+        return self._get_value("page")
+
+    @page.setter
+    def page(self, page: typing.Optional[dfc22_events.Page]):
+        self._set_value("page", page)
+        if page is not None:
+            self.duration = page.duration
+
+    @property
+    def duration(self) -> core_constants.DurationType:
+        return self._get_value("duration")
+
+    @duration.setter
+    def duration(self, duration: core_constants.DurationType):
+        self._set_value("duration", duration)
+
+    @property
+    def non_terminal_pair(self) -> typing.Optional[dfc22_parameters.NonTerminalPair]:
+        return self._get_value("non_terminal_pair")
+
+    @non_terminal_pair.setter
+    def non_terminal_pair(
+        self, non_terminal_pair: typing.Optional[dfc22_parameters.NonTerminalPair]
+    ):
+        self._set_value("non_terminal_pair", non_terminal_pair)
+
+    @property
+    def repetition_count(self) -> int:
+        return self._get_value("repetition_count")
+
+    @repetition_count.setter
+    def repetition_count(self, repetition_count: int):
+        self._set_value("repetition_count", repetition_count)
+
+    def to_unisono_event(self) -> UnisonoEvent:
+        """Independent unisono event with the current values of the view"""
+
+        unisono_event = UnisonoEvent(
+            self.reader_tuple,
+            page=self.page,
+            repetition_count=self.repetition_count,
+            non_terminal_pair=self.non_terminal_pair,
+        )
+        unisono_event.duration = self.duration
+        return unisono_event
+
+    # Copies of a view don't copy the complete sequence.
+    def __copy__(self) -> UnisonoEvent:
+        return self.to_unisono_event()
+
+    def __deepcopy__(self, memo: dict) -> UnisonoEvent:
+        return copy.deepcopy(self.to_unisono_event(), memo)
+
+    def __reduce__(self):
+        return (
+            UnisonoEvent.__new__,
+            (UnisonoEvent,),
+            self.to_unisono_event().__getstate__(),
+        )
+
+
+class RepeatedSequentialUnisonoEvent(SequentialUnisonoEvent):
+    """Sequence of unisono events which repeats a pattern.
+
+    :param repetition_count: How often the pattern is repeated.
+
+    The list only stores the unisono events of the pattern. The unisono
+    events of the complete sequence are light views: each of them has
+    the reader tuple of its pattern unisono event, but its own page,
+    non terminal pair and duration (so that repetitions don't overwrite
+    each other). Only the values which have been set for a position are
+    stored (as a sparse overlay of the position). The length of the
+    sequence can't be changed, because it is defined by the pattern and
+    the repetition count.
+    """
+
+    # Values of the unisono events which can be set for each position
+    _overlay_attribute_name_tuple = (
+        "page",
+        "non_terminal_pair",
+        "duration",
+        "repetition_count",
+    )
+
+    def __init__(self, *args, repetition_count: int = 1, **kwargs):
+        # Set before initializing the list, because the length
+        # depends on the repetition count.
+        self._repetition_count = repetition_count
+        self._index_to_overlay = {}
+        super().__init__(*args, **kwargs)
+
+    @property
+    def repetition_count(self) -> int:
+        return self._repetition_count
+
+    @property
+    def pattern_length(self) -> int:
+        return list.__len__(self)
+
+    def _get_index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(
+                f"Index '{index}' is out of range for sequence with length '{length}'."
+            )
+        return index
+
+    def _get_overlay_value(self, index: int, attribute_name: str) -> typing.Any:
+        try:
+            return self._index_to_overlay[index][attribute_name]
+        except KeyError:
+            return getattr(
+                list.__getitem__(self, index % self.pattern_length), attribute_name
+            )
+
+    def _set_overlay_value(self, index: int, attribute_name: str, value: typing.Any):
+        self._index_to_overlay.setdefault(index, {})[attribute_name] = value
+
+    def _get_unisono_event(self, index: int) -> _RepeatedUnisonoEvent:
+        return _RepeatedUnisonoEvent(self, index)
+
+    def _get_child_with_cache_iterable(self) -> typing.Iterable[UnisonoEvent]:
+        # Only the reader tuples of the pattern are cached.
+        return list.__iter__(self)
+
+    def __len__(self) -> int:
+        return self.pattern_length * self._repetition_count
+
+    def __iter__(self) -> typing.Iterator[_RepeatedUnisonoEvent]:
+        return (self._get_unisono_event(index) for index in range(len(self)))
+
+    def __reversed__(self) -> typing.Iterator[_RepeatedUnisonoEvent]:
+        return (
+            self._get_unisono_event(index) for index in reversed(range(len(self)))
+        )
+
+    def __getitem__(self, index_or_slice: typing.Union[int, slice]):
+        if isinstance(index_or_slice, slice):
+            return SequentialUnisonoEvent(
+                [
+                    self._get_unisono_event(index)
+                    for index in range(len(self))[index_or_slice]
+                ]
+            )
+        return self._get_unisono_event(self._get_index(index_or_slice))
+
+    def __setitem__(self, index: int, unisono_event: UnisonoEvent):
+        if isinstance(index, slice):
+            raise NotImplementedError(
+                f"'{type(self).__name__}' doesn't support slice assignment."
+            )
+        index = self._get_index(index)
+        if tuple(unisono_event.reader_tuple) != self._get_overlay_value(
+            index, "reader_tuple"
+        ):
+            raise Exception(
+                f"The reader tuple of unisono event '{index}' can only be "
+                "changed in the pattern."
+            )
+        self._index_to_overlay[index] = {
+            attribute_name: getattr(unisono_event, attribute_name)
+            for attribute_name in self._overlay_attribute_name_tuple
+        }
+
+    def _raise_fixed_sequence_exception(self, *args, **kwargs):
+        raise NotImplementedError(
+            f"Unisono events can't be added to, removed from or reordered in "
+            f"'{type(self).__name__}', because the sequence is defined by its "
+            "pattern and its repetition count."
+        )
+
+    __delitem__ = _raise_fixed_sequence_exception
+    __iadd__ = _raise_fixed_sequence_exception
+    __imul__ = _raise_fixed_sequence_exception
+    append = _raise_fixed_sequence_exception
+    extend = _raise_fixed_sequence_exception
+    insert = _raise_fixed_sequence_exception
+    remove = _raise_fixed_sequence_exception
+    pop = _raise_fixed_sequence_exception
+    clear = _raise_fixed_sequence_exception
+    sort = _raise_fixed_sequence_exception
+    reverse = _raise_fixed_sequence_exception
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        # Sequences which have been pickled when each position
+        # stored a complete unisono event
+        if "_index_to_unisono_event" in state:
+            state = dict(state)
+            state["_index_to_overlay"] = {
+                index: {
+                    attribute_name: getattr(unisono_event, attribute_name)
+                    for attribute_name in self._overlay_attribute_name_tuple
+                }
+                for index, unisono_event in state.pop("_index_to_unisono_event").items()
+            }
+        super().__setstate__(state)
+
+    def __reduce__(self):
+        # The default reduction would store the complete sequence
+        # as list items.
+        return (
+            type(self),
+            (list(list.__iter__(self)),),
+            self.__getstate__(),
+        )
+
+    @property
+    def reader_count(self) -> int:
+        def get_reader_count() -> int:
+            return (
+                max(
+                    [
+                        reader_index
+                        for unisono_event in list.__iter__(self)
+                        for reader_index in unisono_event.reader_tuple
+                    ]
+                    + [-1]
+                )
+                + 1
+            )
+
+        return self._get_cached_value("reader_count", get_reader_count)
+
+    @property
+    def reader_incidence_matrix(self) -> np.ndarray:
+        def get_reader_incidence_matrix() -> np.ndarray:
+            pattern_reader_incidence_matrix = np.zeros(
+                (self.reader_count, self.pattern_length), dtype=bool
+            )
+            for unisono_event_index, unisono_event in enumerate(
+                list.__iter__(self)
+            ):
+                pattern_reader_incidence_matrix[
+                    list(unisono_event.reader_tuple), unisono_event_index
+                ] = True
+            return self._make_read_only(
+                np.tile(pattern_reader_incidence_matrix, self._repetition_count)
+            )
+
+        return self._get_cached_value(
+            "reader_incidence_matrix", get_reader_incidence_matrix
+        )
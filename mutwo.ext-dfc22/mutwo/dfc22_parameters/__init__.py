@@ -1,6 +1,7 @@
 from .phonemes import *
 
 from . import abc
+from . import configurations
 from . import constants
 
 from .signs import *
@@ -0,0 +1,3 @@
+COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT = 8
+"""How many prime exponents a :class:`CompactNonTerminalPair` saves per
+non terminal (8 = all primes up to 19)"""
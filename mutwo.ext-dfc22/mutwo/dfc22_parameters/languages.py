@@ -1,10 +1,12 @@
 from __future__ import annotations
 import dataclasses
 import typing
+import weakref
 
+from mutwo import dfc22_parameters
 from mutwo import zimmermann_generators
 
-__all__ = ("NonTerminalPair",)
+__all__ = ("NonTerminalPair", "CompactNonTerminalPair")
 
 
 @dataclasses.dataclass(frozen=True)
@@ -54,3 +56,164 @@ class NonTerminalPair(object):
             return self.consonant == other.consonant and self.vowel == other.vowel
         except AttributeError:
             return False
+
+
+class CompactNonTerminalPair(object):
+    """Interned non terminal pair which is saved as an exponent vector.
+
+    :param exponent_tuple: The prime exponents of the consonant followed
+        by the prime exponents of the vowel. Both parts have the length
+        of :const:`dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT`.
+
+    There is only one instance for each exponent vector, therefore
+    equality checks between compact pairs are identity checks (pairs
+    which aren't used anymore are released). The
+    hash is equal to the hash of the :class:`NonTerminalPair` with
+    the same pitches, so both forms can be used to look up the same
+    dict key.
+    """
+
+    __slots__ = ("_exponent_tuple", "_hash", "_non_terminal_pair", "__weakref__")
+
+    _exponent_tuple_to_compact_non_terminal_pair: weakref.WeakValueDictionary[
+        tuple[int, ...], CompactNonTerminalPair
+    ] = weakref.WeakValueDictionary()
+
+    def __new__(cls, exponent_tuple: typing.Sequence[int] = tuple([])):
+        exponent_tuple = tuple(exponent_tuple)
+        try:
+            return cls._exponent_tuple_to_compact_non_terminal_pair[exponent_tuple]
+        except KeyError:
+            pass
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        if len(exponent_tuple) != exponent_count * 2:
+            raise Exception(
+                f"Found exponent tuple '{exponent_tuple}' with invalid length "
+                f"{len(exponent_tuple)}. Expected {exponent_count * 2} exponents "
+                "(for consonant and vowel)."
+            )
+        self = super().__new__(cls)
+        self._exponent_tuple = exponent_tuple
+        self._hash = hash(
+            cls._trim_exponent_tuple(exponent_tuple[:exponent_count])
+            + ("SEPARATOR",)
+            + cls._trim_exponent_tuple(exponent_tuple[exponent_count:])
+        )
+        self._non_terminal_pair = None
+        cls._exponent_tuple_to_compact_non_terminal_pair[exponent_tuple] = self
+        return self
+
+    @staticmethod
+    def _trim_exponent_tuple(exponent_tuple: tuple[int, ...]) -> tuple[int, ...]:
+        # Pitches don't save trailing zeros
+        exponent_list = list(exponent_tuple)
+        while exponent_list and exponent_list[-1] == 0:
+            del exponent_list[-1]
+        return tuple(exponent_list)
+
+    @staticmethod
+    def _pad_exponent_tuple(exponent_tuple: tuple[int, ...]) -> tuple[int, ...]:
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        if len(exponent_tuple) > exponent_count:
+            raise Exception(
+                f"Found exponent tuple '{exponent_tuple}' with more than "
+                f"{exponent_count} exponents. Please increase "
+                "'dfc22_parameters.configurations."
+                "COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT'."
+            )
+        return tuple(exponent_tuple) + (0,) * (exponent_count - len(exponent_tuple))
+
+    @classmethod
+    def from_non_terminal_pair(
+        cls, non_terminal_pair: typing.Union[NonTerminalPair, CompactNonTerminalPair]
+    ) -> CompactNonTerminalPair:
+        if isinstance(non_terminal_pair, CompactNonTerminalPair):
+            return non_terminal_pair
+        return cls(
+            cls._pad_exponent_tuple(non_terminal_pair.consonant.exponent_tuple)
+            + cls._pad_exponent_tuple(non_terminal_pair.vowel.exponent_tuple)
+        )
+
+    def to_non_terminal_pair(self) -> NonTerminalPair:
+        if self._non_terminal_pair is None:
+            exponent_count = (
+                dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+            )
+            self._non_terminal_pair = NonTerminalPair(
+                consonant=zimmermann_generators.JustIntonationPitchNonTerminal(
+                    self._trim_exponent_tuple(self._exponent_tuple[:exponent_count])
+                ),
+                vowel=zimmermann_generators.JustIntonationPitchNonTerminal(
+                    self._trim_exponent_tuple(self._exponent_tuple[exponent_count:])
+                ),
+            )
+        return self._non_terminal_pair
+
+    @property
+    def exponent_tuple(self) -> tuple[int, ...]:
+        return self._exponent_tuple
+
+    @property
+    def consonant(self) -> zimmermann_generators.JustIntonationPitchNonTerminal:
+        return self.to_non_terminal_pair().consonant
+
+    @property
+    def vowel(self) -> zimmermann_generators.JustIntonationPitchNonTerminal:
+        return self.to_non_terminal_pair().vowel
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._exponent_tuple})"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if self is other:
+            return True
+        # Interned instances are only equal if they are identical
+        if isinstance(other, CompactNonTerminalPair):
+            return False
+        try:
+            return self.consonant == other.consonant and self.vowel == other.vowel
+        except AttributeError:
+            return False
+
+    def __add__(
+        self, other: typing.Union[NonTerminalPair, CompactNonTerminalPair]
+    ) -> CompactNonTerminalPair:
+        other = self.from_non_terminal_pair(other)
+        return type(self)(
+            tuple(
+                exponent0 + exponent1
+                for exponent0, exponent1 in zip(
+                    self._exponent_tuple, other._exponent_tuple
+                )
+            )
+        )
+
+    def __sub__(
+        self, other: typing.Union[NonTerminalPair, CompactNonTerminalPair]
+    ) -> CompactNonTerminalPair:
+        other = self.from_non_terminal_pair(other)
+        return type(self)(
+            tuple(
+                exponent0 - exponent1
+                for exponent0, exponent1 in zip(
+                    self._exponent_tuple, other._exponent_tuple
+                )
+            )
+        )
+
+    def __reduce__(self):
+        # Unpickled pairs are interned again
+        return (type(self), (self._exponent_tuple,))
+
+    def __copy__(self) -> CompactNonTerminalPair:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> CompactNonTerminalPair:
+        return self
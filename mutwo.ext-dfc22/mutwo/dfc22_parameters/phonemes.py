@@ -1,13 +1,87 @@
+from __future__ import annotations
+
+import enum
 import typing
 
 from mutwo import isis_converters
 
-__all__ = ("XSAMPAPhoneme",)
+__all__ = ("XSAMPAPhonemeClass", "XSAMPAPhoneme")
+
+
+class XSAMPAPhonemeClass(enum.IntFlag):
+    """Classes of XSAMPA phonemes (as defined in :mod:`mutwo.isis_converters`)"""
+
+    VOWEL = enum.auto()
+    SEMI_VOWEL = enum.auto()
+    VOICED_FRICATIVE = enum.auto()
+    UNVOICED_FRICATIVE = enum.auto()
+    VOICED_PLOSIVE = enum.auto()
+    UNVOICED_PLOSIVE = enum.auto()
+    NASAL = enum.auto()
+    OTHER = enum.auto()
+
+    @classmethod
+    def from_phoneme(cls, phoneme: str) -> XSAMPAPhonemeClass:
+        xsampa = isis_converters.constants.XSAMPA
+        phoneme_class = cls(0)
+        for flag, phoneme_tuple in (
+            (cls.VOWEL, xsampa.vowel_tuple),
+            (cls.SEMI_VOWEL, xsampa.semi_vowel_tuple),
+            (cls.VOICED_FRICATIVE, xsampa.voiced_fricative_tuple),
+            (cls.UNVOICED_FRICATIVE, xsampa.unvoiced_fricative_tuple),
+            (cls.VOICED_PLOSIVE, xsampa.voiced_plosive_tuple),
+            (cls.UNVOICED_PLOSIVE, xsampa.unvoiced_plosive_tuple),
+            (cls.NASAL, xsampa.nasal_tuple),
+            (cls.OTHER, xsampa.other_tuple),
+        ):
+            if phoneme in phoneme_tuple:
+                phoneme_class |= flag
+        return phoneme_class
 
 
 class XSAMPAPhoneme(object):
-    def __init__(self, phoneme: str):
+    """Interned XSAMPA phoneme.
+
+    :param phoneme: The XSAMPA notation of the phoneme.
+
+    There is only one instance for each phoneme. Each phoneme gets a
+    small integer id (in the order in which the phonemes are created),
+    so that tables which are indexed by phoneme ids can be used instead
+    of dicts. The class of the phoneme is only looked up once.
+    """
+
+    __slots__ = ("_phoneme", "_phoneme_id", "_phoneme_class", "_hash", "__weakref__")
+
+    _phoneme_to_xsampa_phoneme: dict[str, XSAMPAPhoneme] = {}
+    _xsampa_phoneme_list: list[XSAMPAPhoneme] = []
+
+    def __new__(cls, phoneme: typing.Optional[str] = None):
+        if phoneme is None:
+            # Phonemes which have been pickled before they were
+            # interned (see __setstate__).
+            return super().__new__(cls)
+        try:
+            return cls._phoneme_to_xsampa_phoneme[phoneme]
+        except KeyError:
+            pass
+        self = super().__new__(cls)
         self._phoneme = phoneme
+        self._phoneme_id = len(cls._xsampa_phoneme_list)
+        self._phoneme_class = XSAMPAPhonemeClass.from_phoneme(phoneme)
+        self._hash = hash(phoneme)
+        cls._phoneme_to_xsampa_phoneme[phoneme] = self
+        cls._xsampa_phoneme_list.append(self)
+        return self
+
+    @classmethod
+    def from_phoneme_id(cls, phoneme_id: int) -> XSAMPAPhoneme:
+        return cls._xsampa_phoneme_list[phoneme_id]
+
+    @classmethod
+    def get_phoneme_count(cls) -> int:
+        """How many phonemes (and therefore phoneme ids) exist yet"""
+
+        return len(cls._xsampa_phoneme_list)
 
     def __str__(self) -> str:
         return self._phoneme
@@ -16,21 +90,50 @@ class XSAMPAPhoneme(object):
         return f"XSAMPAPhoneme({self._phoneme})"
 
     def __hash__(self) -> int:
-        return hash(self._phoneme)
+        return self._hash
 
     def __eq__(self, other: typing.Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, XSAMPAPhoneme):
+            return self._phoneme_id == other._phoneme_id
         try:
-            return hash(self) == hash(other)
+            return self._hash == hash(other)
         except TypeError:
             return False
 
+    def __reduce__(self):
+        # Unpickled phonemes are interned again
+        return (type(self), (self._phoneme,))
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        interned_xsampa_phoneme = type(self)(state["_phoneme"])
+        for attribute_name in ("_phoneme", "_phoneme_id", "_phoneme_class", "_hash"):
+            setattr(
+                self, attribute_name, getattr(interned_xsampa_phoneme, attribute_name)
+            )
+
+    def __copy__(self) -> XSAMPAPhoneme:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> XSAMPAPhoneme:
+        return self
+
     @property
     def phoneme(self) -> str:
         return self._phoneme
 
+    @property
+    def phoneme_id(self) -> int:
+        return self._phoneme_id
+
+    @property
+    def phoneme_class(self) -> XSAMPAPhonemeClass:
+        return self._phoneme_class
+
     @property
     def is_vowel(self) -> bool:
-        return str(self) in isis_converters.constants.XSAMPA.vowel_tuple
+        return bool(self._phoneme_class & XSAMPAPhonemeClass.VOWEL)
 
     @property
     def is_consonant(self) -> bool:
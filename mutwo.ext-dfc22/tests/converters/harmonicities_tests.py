@@ -0,0 +1,190 @@
+import math
+import unittest
+
+import numpy as np
+
+from mutwo import dfc22_converters
+from mutwo import dfc22_parameters
+
+from tests import utilities
+
+EXPONENT_COUNT = (
+    dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+)
+
+
+def make_exponent_tuple(
+    pulse_exponent_tuple: tuple[int, ...] = tuple([]),
+    pitch_exponent_tuple: tuple[int, ...] = tuple([]),
+) -> tuple[int, ...]:
+    return tuple(
+        list(pulse_exponent_tuple)
+        + [0] * (EXPONENT_COUNT - len(pulse_exponent_tuple))
+        + list(pitch_exponent_tuple)
+        + [0] * (EXPONENT_COUNT - len(pitch_exponent_tuple))
+    )
+
+
+def make_trajectory(
+    row_sequence: tuple[tuple[float, float, tuple[int, ...]], ...],
+) -> dfc22_converters.Trajectory:
+    return dfc22_converters.Trajectory(
+        np.array([row[0] for row in row_sequence], dtype=float),
+        np.array([row[1] for row in row_sequence], dtype=float),
+        np.array([row[2] for row in row_sequence], dtype=int).reshape(
+            len(row_sequence), EXPONENT_COUNT * 2
+        ),
+    )
+
+
+class TrajectoryTest(unittest.TestCase):
+    def assertTrajectoryEqual(self, trajectory0, trajectory1):
+        for attribute_name in ("start_time_array", "stop_time_array", "exponent_array"):
+            self.assertEqual(
+                getattr(trajectory0, attribute_name).tolist(),
+                getattr(trajectory1, attribute_name).tolist(),
+            )
+
+    def test_concatenate(self):
+        exponent_tuple0, exponent_tuple1 = make_exponent_tuple(
+            (1,)
+        ), make_exponent_tuple(pitch_exponent_tuple=(0, 1))
+        self.assertTrajectoryEqual(
+            dfc22_converters.Trajectory.concatenate(
+                (
+                    make_trajectory(((2, 3, exponent_tuple0),)),
+                    make_trajectory(((0, 1, exponent_tuple1), (4, 5, exponent_tuple1))),
+                )
+            ),
+            make_trajectory(
+                (
+                    (0, 1, exponent_tuple1),
+                    (2, 3, exponent_tuple0),
+                    (4, 5, exponent_tuple1),
+                )
+            ),
+        )
+        self.assertEqual(
+            dfc22_converters.Trajectory.concatenate(()).exponent_array.shape,
+            (0, EXPONENT_COUNT * 2),
+        )
+
+    def test_move(self):
+        exponent_tuple = make_exponent_tuple((1,), (-1, 1))
+        self.assertTrajectoryEqual(
+            make_trajectory(
+                ((0, 1, make_exponent_tuple()), (1, 3, exponent_tuple))
+            ).move(2, dfc22_parameters.CompactNonTerminalPair(exponent_tuple)),
+            make_trajectory(
+                (
+                    (2, 3, exponent_tuple),
+                    (3, 5, make_exponent_tuple((2,), (-2, 2))),
+                )
+            ),
+        )
+
+    def test_wrap(self):
+        exponent_tuple0, exponent_tuple1, exponent_tuple2 = (
+            make_exponent_tuple((exponent,)) for exponent in range(3)
+        )
+        trajectory = make_trajectory(((0, 1, exponent_tuple0), (1, 2, exponent_tuple1)))
+        # Rows which stop exactly at the end of the cycle aren't split
+        self.assertIs(trajectory.wrap(2), trajectory)
+        # Rows which start exactly at the end of the cycle move to the next cycle
+        self.assertTrajectoryEqual(
+            make_trajectory(((2, 3, exponent_tuple0),)).wrap(2),
+            make_trajectory(((0, 1, exponent_tuple0),)),
+        )
+        self.assertTrajectoryEqual(
+            make_trajectory(
+                (
+                    (0.5, 1.5, exponent_tuple0),
+                    (1.5, 2.5, exponent_tuple1),
+                    (2.5, 4, exponent_tuple2),
+                )
+            ).wrap(2),
+            make_trajectory(
+                (
+                    (0, 0.5, exponent_tuple1),
+                    (0.5, 1.5, exponent_tuple0),
+                    (0.5, 2, exponent_tuple2),
+                    (1.5, 2, exponent_tuple1),
+                )
+            ),
+        )
+
+
+class TrajectoryPairToHarmonicityTest(unittest.TestCase):
+    def test_convert(self):
+        trajectory0 = make_trajectory(
+            ((0, 1, make_exponent_tuple()), (1, 2, make_exponent_tuple((1,), (-1, 1))))
+        )
+        trajectory1 = make_trajectory(
+            ((0.5, 1.5, make_exponent_tuple((1,), (-2, 0, 1))),)
+        )
+        # 0.5 - 1: 2/1 against the pulse and 5/4 against the pitch
+        # 1 - 1.5: 1/1 against the pulse and 6/5 against the pitch
+        expected_harmonicity = -(
+            ((2 + math.log2(5)) + (0.25 * 1)) * 0.5
+            + (1 + math.log2(3) + math.log2(5)) * 0.5
+        )
+        trajectory_pair_to_harmonicity = dfc22_converters.TrajectoryPairToHarmonicity(
+            pulse_weight=0.25
+        )
+        for trajectory_pair in ((trajectory0, trajectory1), (trajectory1, trajectory0)):
+            self.assertAlmostEqual(
+                trajectory_pair_to_harmonicity(*trajectory_pair), expected_harmonicity
+            )
+        self.assertEqual(
+            trajectory_pair_to_harmonicity(
+                trajectory0, make_trajectory(((2, 3, make_exponent_tuple()),))
+            ),
+            0,
+        )
+
+
+class PageToTrajectoryTest(unittest.TestCase):
+    def setUp(self):
+        self.page_to_trajectory = dfc22_converters.PageToTrajectory()
+
+    def test_convert(self):
+        page = utilities.make_page(([[[["t", "a"], ["m"]], [["o"]]]],))
+        trajectory = self.page_to_trajectory(page)
+        phoneme_group_list = [phoneme_group for phoneme_group in page[0][0][0]] + [
+            phoneme_group for phoneme_group in page[0][0][1]
+        ]
+        stop_time_list = list(
+            np.cumsum(
+                [float(phoneme_group.duration) for phoneme_group in phoneme_group_list]
+            )
+        )
+        self.assertEqual(
+            trajectory.start_time_array.tolist(), [0] + stop_time_list[:-1]
+        )
+        self.assertEqual(trajectory.stop_time_array.tolist(), stop_time_list)
+        exponent_tuple = make_exponent_tuple()
+        for phoneme_group, exponent_list in zip(
+            phoneme_group_list, trajectory.exponent_array.tolist()
+        ):
+            self.assertEqual(tuple(exponent_list), exponent_tuple)
+            exponent_tuple = (
+                dfc22_parameters.CompactNonTerminalPair(exponent_tuple)
+                + dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                    phoneme_group.non_terminal_pair
+                )
+            ).exponent_tuple
+
+    def test_cache(self):
+        page_sequence = ([[[["t", "a"], ["m"]]]],)
+        trajectory = self.page_to_trajectory(utilities.make_page(page_sequence))
+        self.assertIs(
+            self.page_to_trajectory(utilities.make_page(page_sequence)), trajectory
+        )
+        self.assertIsNot(
+            self.page_to_trajectory(utilities.make_page(([[[["t", "o"], ["m"]]]],))),
+            trajectory,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
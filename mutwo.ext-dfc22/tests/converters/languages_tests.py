@@ -0,0 +1,266 @@
+import fractions
+import unittest
+
+import numpy as np
+
+from mutwo import dfc22_converters
+from mutwo import dfc22_parameters
+from mutwo import music_parameters
+
+from tests import utilities
+
+
+def _find_duration_with_loop(pulse: float, start: float, end: float) -> float:
+    """The original implementation of 'find_duration'"""
+
+    pulse_list = []
+    current_pulse = pulse
+    while True:
+        if current_pulse > end:
+            break
+        elif current_pulse >= start:
+            pulse_list.append(current_pulse)
+        current_pulse += pulse
+    if not pulse_list:
+        pulse_list = [pulse]
+    return float(pulse_list[int(len(pulse_list) // 2)])
+
+
+class DurationQuantizerTest(unittest.TestCase):
+    def setUp(self):
+        self.duration_quantizer = dfc22_converters.DurationQuantizer()
+        # Ranges of the configurations of mutwo.dfc22_events and dfc22
+        self.range_tuple = (
+            (0.3, 0.6),
+            (0.4, 1.2),
+            (1, 2),
+            (2, 3),
+            (3, 13),
+            (0.1, 0.195),
+            (0.04, 0.08),
+            (0.1, 0.3),
+            (0.4, 1),
+            (1.5, 2.5),
+            (3, 8),
+            (2.0, 2.05),
+        )
+        self.pulse_ratio_tuple = tuple(
+            fractions.Fraction(numerator, denominator)
+            for numerator in (1, 2, 3, 5, 7, 9, 15)
+            for denominator in (2, 3, 4, 8, 10, 12, 16, 24, 32, 64)
+        )
+
+    def test_get_duration(self):
+        for pulse_ratio, start, end, expected_duration in (
+            # The sixth accumulated multiple is slightly smaller than 2.
+            (fractions.Fraction(1, 3), 2.0, 2.05, 0.3333333333333333),
+            (fractions.Fraction(1, 10), 0.5, 0.6, 0.6),
+            (fractions.Fraction(1, 4), 0.3, 1.1, 0.75),
+            (fractions.Fraction(1, 3), 1, 2, 1.6666666666666665),
+            (fractions.Fraction(2, 1), 0.5, 1, 2.0),
+            (fractions.Fraction(3, 16), 0.3, 0.6, 0.5625),
+            (fractions.Fraction(1, 12), 1.5, 2.5, 2.0833333333333326),
+        ):
+            self.assertEqual(
+                self.duration_quantizer.get_duration(pulse_ratio, start, end),
+                expected_duration,
+            )
+
+    def test_get_duration_equals_loop(self):
+        for pulse_ratio in self.pulse_ratio_tuple:
+            for start, end in self.range_tuple:
+                self.assertEqual(
+                    self.duration_quantizer.get_duration(pulse_ratio, start, end),
+                    _find_duration_with_loop(float(pulse_ratio), start, end),
+                )
+
+    def test_get_duration_array(self):
+        pulse_list, start_list, end_list, expected_duration_list = [], [], [], []
+        for pulse_ratio in self.pulse_ratio_tuple:
+            for start, end in self.range_tuple:
+                pulse_list.append(float(pulse_ratio))
+                start_list.append(start)
+                end_list.append(end)
+                expected_duration_list.append(
+                    _find_duration_with_loop(float(pulse_ratio), start, end)
+                )
+        self.assertEqual(
+            self.duration_quantizer.get_duration_array(
+                np.array(pulse_list), np.array(start_list), np.array(end_list)
+            ).tolist(),
+            expected_duration_list,
+        )
+
+
+class NestedLanguageStructureToSequentialEventTest(unittest.TestCase):
+    def setUp(self):
+        # Simple pitches and ranges, so that the expected notes can
+        # be calculated by hand.
+        self.page = utilities.make_page(
+            ([[[["t", "a"], ["m", "o"]], [["k", "i"]]]],),
+            uncertain_duration=dfc22_parameters.UncertainRange(0.3, 0.6),
+            vowel_to_just_intonation_pitch_dict={
+                dfc22_parameters.XSAMPAPhoneme(phoneme): pitch
+                for phoneme, pitch in (
+                    ("a", music_parameters.JustIntonationPitch("3/2")),
+                    ("o", music_parameters.JustIntonationPitch("5/4")),
+                    ("i", music_parameters.JustIntonationPitch("1/1")),
+                )
+            },
+            consonant_to_just_intonation_pitch_dict={
+                dfc22_parameters.XSAMPAPhoneme(phoneme): pitch
+                for phoneme, pitch in (
+                    ("t", music_parameters.JustIntonationPitch("2/1")),
+                    ("m", music_parameters.JustIntonationPitch("3/2")),
+                    ("k", music_parameters.JustIntonationPitch("1/1")),
+                )
+            },
+        )
+        self.page.initial_non_terminal_pair = dfc22_parameters.NonTerminalPair(
+            consonant=music_parameters.JustIntonationPitch("1/8"),
+            vowel=music_parameters.JustIntonationPitch("1/1"),
+        )
+        self.page[0][0].uncertain_rest_duration = dfc22_parameters.UncertainRange(1, 2)
+        self.page[0].uncertain_rest_duration = dfc22_parameters.UncertainRange(2, 3)
+        self.page.uncertain_rest_duration = dfc22_parameters.UncertainRange(3, 4)
+
+    def test_convert(self):
+        for batch in (True, False):
+            sequential_event = (
+                dfc22_converters.NestedLanguageStructureToSequentialEvent(
+                    batch=batch, use_cache=False
+                ).convert(self.page)
+            )
+            # Three notes and three rests (sentence, paragraph and page)
+            self.assertEqual(
+                [event.phoneme for event in sequential_event],
+                ["t", "m", "k", "_", "_", "_"],
+            )
+            self.assertEqual(
+                [event.pitch_list for event in sequential_event],
+                [
+                    [music_parameters.JustIntonationPitch("1/1")],
+                    [music_parameters.JustIntonationPitch("3/2")],
+                    [music_parameters.JustIntonationPitch("15/8")],
+                    [],
+                    [],
+                    [],
+                ],
+            )
+            self.assertEqual(
+                [event.pulse for event in sequential_event[:3]],
+                [
+                    fractions.Fraction(1, 8),
+                    fractions.Fraction(1, 4),
+                    fractions.Fraction(3, 8),
+                ],
+            )
+            # The middle multiple of the pulse inside each range (rests
+            # have the pulse after the last phoneme group: 3/8)
+            self.assertEqual(
+                [event.duration for event in sequential_event],
+                [0.5, 0.5, 0.375, 1.5, 2.625, 3.375],
+            )
+
+    def test_batch_with_word_to_sequential_event_subclass(self):
+        class WordToSequentialEventWithConstantDuration(
+            dfc22_converters.WordToSequentialEvent
+        ):
+            def _phoneme_group_to_duration(self, *_):
+                return 1
+
+        # The batch conversion doesn't know the subclass
+        sequential_event = dfc22_converters.NestedLanguageStructureToSequentialEvent(
+            WordToSequentialEventWithConstantDuration(), batch=True, use_cache=False
+        ).convert(self.page)
+        self.assertEqual([event.duration for event in sequential_event[:3]], [1, 1, 1])
+
+    def test_batch_with_big_primes(self):
+        # 59 is the 17th prime and doesn't fit into a compact pair
+        page = utilities.make_page(
+            ([[[["t", "a"], ["m", "o"]]]],),
+            vowel_to_just_intonation_pitch_dict={
+                dfc22_parameters.XSAMPAPhoneme(phoneme): pitch
+                for phoneme, pitch in (
+                    ("a", music_parameters.JustIntonationPitch("59/32")),
+                    ("o", music_parameters.JustIntonationPitch("5/4")),
+                )
+            },
+        )
+        sequential_event_tuple = tuple(
+            dfc22_converters.NestedLanguageStructureToSequentialEvent(
+                batch=batch, use_cache=False
+            ).convert(page)
+            for batch in (True, False)
+        )
+        self.assertEqual(
+            len(sequential_event_tuple[0][1].pitch_list[0].exponent_tuple), 17
+        )
+        for attribute_name in ("phoneme", "pitch_list", "duration"):
+            self.assertEqual(
+                [getattr(event, attribute_name) for event in sequential_event_tuple[0]],
+                [getattr(event, attribute_name) for event in sequential_event_tuple[1]],
+            )
+        self.assertEqual(
+            dfc22_converters.NestedLanguageStructureToSequentialEvent().get_duration(
+                page
+            ),
+            sequential_event_tuple[0].duration,
+        )
+
+    def test_conversion_cache(self):
+        conversion_cache = {}
+        nested_language_structure_to_sequential_event = (
+            dfc22_converters.NestedLanguageStructureToSequentialEvent(
+                conversion_cache=conversion_cache
+            )
+        )
+        sequential_event0 = nested_language_structure_to_sequential_event.convert(
+            self.page
+        )
+        sequential_event0[0].duration = 100
+        sequential_event1 = nested_language_structure_to_sequential_event.convert(
+            self.page
+        )
+        self.assertEqual(len(conversion_cache), 1)
+        self.assertIsNot(sequential_event0, sequential_event1)
+        self.assertNotEqual(sequential_event1[0].duration, 100)
+        expected_sequential_event = (
+            dfc22_converters.NestedLanguageStructureToSequentialEvent(
+                use_cache=False
+            ).convert(self.page)
+        )
+        self.assertEqual(
+            [event.duration for event in sequential_event1],
+            [event.duration for event in expected_sequential_event],
+        )
+        # Converters with another duration quantizer don't share results
+        dfc22_converters.NestedLanguageStructureToSequentialEvent(
+            dfc22_converters.WordToSequentialEvent(
+                duration_quantizer=dfc22_converters.DurationQuantizer()
+            ),
+            conversion_cache=conversion_cache,
+        ).convert(self.page)
+        self.assertEqual(len(conversion_cache), 2)
+
+    def test_conversion_cache_size(self):
+        conversion_cache = {}
+        nested_language_structure_to_sequential_event = (
+            dfc22_converters.NestedLanguageStructureToSequentialEvent(
+                conversion_cache=conversion_cache, cache_size=2
+            )
+        )
+        page_tuple = tuple(
+            utilities.make_page(([[[[phoneme]]]],)) for phoneme in ("a", "o", "i")
+        )
+        for page in (page_tuple[0], page_tuple[1], page_tuple[0], page_tuple[2]):
+            nested_language_structure_to_sequential_event.convert(page)
+        # The second page is the least recently used one.
+        self.assertEqual(
+            [key[0] for key in conversion_cache],
+            [page_tuple[0].content_digest, page_tuple[2].content_digest],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import random
+import unittest
+
+import numpy as np
+
+from mutwo import dfc22_converters
+from mutwo.dfc22_converters import searches
+
+
+class TableScore(dfc22_converters.PageCombinationScore):
+    """Score with random local and pair scores (doesn't need pages)"""
+
+    movement_index_pair_tuple = ((0, 1), (1, 2), (0, 3), (2, 3))
+
+    def __init__(self, movement_count: int, page_combination_count: int):
+        random_generator = np.random.default_rng(10)
+        self._local_score_array = random_generator.normal(
+            size=(movement_count, page_combination_count)
+        )
+        self._pair_score_array = random_generator.normal(
+            size=(
+                movement_count,
+                page_combination_count,
+                movement_count,
+                page_combination_count,
+            )
+        )
+
+    def get_local_score(
+        self, movement_index: int, page_combination_index: int
+    ) -> float:
+        return float(self._local_score_array[movement_index, page_combination_index])
+
+    def get_movement_index_pair_tuple(self) -> tuple[tuple[int, int], ...]:
+        return self.movement_index_pair_tuple
+
+    def get_pair_score(
+        self,
+        movement_index0: int,
+        page_combination_index0: int,
+        movement_index1: int,
+        page_combination_index1: int,
+    ) -> float:
+        return float(
+            self._pair_score_array[
+                movement_index0,
+                page_combination_index0,
+                movement_index1,
+                page_combination_index1,
+            ]
+        )
+
+
+class PageCombinationSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.movement_count, self.page_combination_count = 4, 6
+        self.table_score = TableScore(self.movement_count, self.page_combination_count)
+        # Only the amount of page combinations per movement matters
+        self.movement_tuple = (None,) * self.movement_count
+        self.page_combination_tuple_per_movement = tuple(
+            tuple(range(self.page_combination_count))
+            for _ in range(self.movement_count)
+        )
+        self.table_score.prepare(
+            None, self.movement_tuple, self.page_combination_tuple_per_movement, ()
+        )
+
+    def test_get_delta(self):
+        memoized_page_combination_score = searches._MemoizedPageCombinationScore(
+            self.table_score, self.movement_count
+        )
+        random_generator = random.Random(1)
+        page_combination_index_list = [0] * self.movement_count
+        for _ in range(100):
+            movement_index = random_generator.randrange(self.movement_count)
+            new_page_combination_index = random_generator.randrange(
+                self.page_combination_count
+            )
+            new_page_combination_index_list = list(page_combination_index_list)
+            new_page_combination_index_list[movement_index] = new_page_combination_index
+            self.assertAlmostEqual(
+                memoized_page_combination_score.get_delta(
+                    page_combination_index_list,
+                    movement_index,
+                    new_page_combination_index,
+                ),
+                memoized_page_combination_score.get_score(
+                    new_page_combination_index_list
+                )
+                - memoized_page_combination_score.get_score(
+                    page_combination_index_list
+                ),
+            )
+            page_combination_index_list = new_page_combination_index_list
+
+    def test_anneal(self):
+        for chain_index in (0, 1):
+            argument_tuple = (
+                self.table_score,
+                None,
+                self.movement_tuple,
+                self.page_combination_tuple_per_movement,
+                (),
+                100,
+                chain_index,
+                500,
+                None,
+                None,
+                1,
+                0.001,
+            )
+            score, page_combination_index_tuple = searches._anneal(*argument_tuple)
+            # The score which is updated with deltas equals the full score.
+            self.assertAlmostEqual(
+                score,
+                searches._MemoizedPageCombinationScore(
+                    self.table_score, self.movement_count
+                ).get_score(list(page_combination_index_tuple)),
+            )
+            self.assertEqual(
+                searches._anneal(*argument_tuple),
+                (score, page_combination_index_tuple),
+            )
+
+    def test_process_count(self):
+        def convert(process_count: int) -> tuple[int, ...]:
+            page_combination_search = (
+                searches.PageCombinationTuplePerMovementToPageCombinationIndexTuple(
+                    self.table_score,
+                    iteration_count=200,
+                    chain_count=3,
+                    process_count=process_count,
+                    seed=5,
+                )
+            )
+            return page_combination_search.convert(
+                None, self.movement_tuple, self.page_combination_tuple_per_movement, ()
+            )
+
+        self.assertEqual(convert(1), convert(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,277 @@
+import unittest
+
+from mutwo import core_events
+from mutwo import dfc22_converters
+from mutwo import dfc22_events
+from mutwo import dfc22_parameters
+from mutwo import music_parameters
+from mutwo.dfc22_converters import timelines
+
+from tests import utilities
+
+
+class ReaderTimelineBuilderTest(unittest.TestCase):
+    def test_build(self):
+        reader_timeline_builder = dfc22_converters.ReaderTimelineBuilder(2, 10)
+        reader_timeline_builder.add_event(0, 5, core_events.SimpleEvent(2))
+        reader_timeline_builder.add_event(0, 1, core_events.SimpleEvent(1))
+        reader_timeline_builder.add_event(1, 0, core_events.SimpleEvent(10))
+        simultaneous_event = reader_timeline_builder.build()
+        self.assertEqual(
+            [event.duration for event in simultaneous_event[0]], [1, 1, 3, 2, 3]
+        )
+        self.assertEqual([event.duration for event in simultaneous_event[1]], [10])
+
+    def test_build_with_overlapping_events(self):
+        reader_timeline_builder = dfc22_converters.ReaderTimelineBuilder(1, 10)
+        reader_timeline_builder.add_event(0, 1, core_events.SimpleEvent(3))
+        reader_timeline_builder.add_event(0, 2, core_events.SimpleEvent(1))
+        self.assertRaises(Exception, reader_timeline_builder.build)
+
+
+class ReaderTimelineIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.event0, self.event1, self.event2 = (
+            core_events.SimpleEvent(2),
+            core_events.SimpleEvent(3),
+            core_events.SimpleEvent(4),
+        )
+        self.reader_timeline_index = dfc22_converters.ReaderTimelineIndex(
+            core_events.SimultaneousEvent(
+                [
+                    core_events.SequentialEvent([self.event0, self.event1]),
+                    core_events.SequentialEvent([self.event2]),
+                ]
+            )
+        )
+
+    def test_get_event_at(self):
+        self.assertIs(self.reader_timeline_index.get_event_at(0, 0), self.event0)
+        self.assertIs(self.reader_timeline_index.get_event_at(0, 2), self.event1)
+        self.assertIsNone(self.reader_timeline_index.get_event_at(0, 5))
+        self.assertEqual(
+            self.reader_timeline_index.get_event_tuple_at(4.5), (self.event1, None)
+        )
+
+    def test_get_overlapping_placement_tuple(self):
+        self.assertEqual(
+            self.reader_timeline_index.get_overlapping_placement_tuple(0, 1, 3),
+            ((0, self.event0), (2, self.event1)),
+        )
+        self.assertEqual(
+            self.reader_timeline_index.get_overlapping_placement_tuple(0, 2, 3),
+            ((2, self.event1),),
+        )
+        self.assertEqual(
+            self.reader_timeline_index.get_overlapping_placement_tuple(1, 4, 6), ()
+        )
+
+
+class SimultaneousEventWithPagesToSimultaneousEventWithNotesTest(unittest.TestCase):
+    def setUp(self):
+        page = utilities.make_page(([[[["t", "a"], ["m", "o"]]]],))
+        # Pages with different pitch dicts can't be saved as page arrays
+        page_with_pitch_dicts = utilities.make_page(([[[["k", "i"], ["t", "o"]]]],))
+        pitch = music_parameters.JustIntonationPitch("7/4")
+        page_with_pitch_dicts[0][0][0][1] = dfc22_events.PhonemeGroup(
+            phoneme_list=["t", "o"],
+            vowel_to_just_intonation_pitch_dict={
+                dfc22_parameters.XSAMPAPhoneme("o"): pitch
+            },
+        )
+        self.simultaneous_event_with_pages = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(2), page, core_events.SimpleEvent(1)]
+                ),
+                core_events.SequentialEvent(
+                    [
+                        page,
+                        page.make_placement(
+                            dfc22_parameters.NonTerminalPair(
+                                consonant=music_parameters.JustIntonationPitch("1/4"),
+                                vowel=music_parameters.JustIntonationPitch("3/2"),
+                            )
+                        ),
+                        page_with_pitch_dicts,
+                        page_with_pitch_dicts,
+                    ]
+                ),
+            ]
+        )
+
+    @staticmethod
+    def _get_attribute_list(
+        simultaneous_event_with_notes: core_events.SimultaneousEvent,
+    ) -> list[list[tuple]]:
+        attribute_list_per_reader = []
+        for sequential_event in simultaneous_event_with_notes:
+            attribute_list = []
+            for event in sequential_event:
+                if isinstance(event, core_events.SequentialEvent):
+                    event_tuple = tuple(event)
+                else:
+                    event_tuple = (event,)
+                attribute_list.extend(
+                    (
+                        type(event),
+                        event.duration,
+                        getattr(event, "pitch_list", None),
+                        getattr(event, "pulse", None),
+                        getattr(event, "phoneme", None),
+                    )
+                    for event in event_tuple
+                )
+            attribute_list_per_reader.append(attribute_list)
+        return attribute_list_per_reader
+
+    def test_convert_in_process_pool(self):
+        simultaneous_event_with_notes = (
+            dfc22_converters.SimultaneousEventWithPagesToSimultaneousEventWithNotes(
+                process_count=2
+            ).convert(self.simultaneous_event_with_pages)
+        )
+        expected_simultaneous_event_with_notes = (
+            dfc22_converters.SimultaneousEventWithPagesToSimultaneousEventWithNotes(
+                process_count=1
+            ).convert(self.simultaneous_event_with_pages)
+        )
+        self.assertEqual(
+            self._get_attribute_list(simultaneous_event_with_notes),
+            self._get_attribute_list(expected_simultaneous_event_with_notes),
+        )
+        self.assertEqual(
+            [note.phoneme for note in simultaneous_event_with_notes[1][1][:2]],
+            ["t", "m"],
+        )
+        # The placement starts with its own pitch
+        self.assertEqual(
+            simultaneous_event_with_notes[1][1][0].pitch_list,
+            [music_parameters.JustIntonationPitch("3/2")],
+        )
+
+
+class SimultaneousEventWithPagesToWindowedSimultaneousEventWithNotesTest(
+    unittest.TestCase
+):
+    def setUp(self):
+        page0 = utilities.make_page(([[[["t", "a"], ["m", "o"]]]],))
+        page1 = utilities.make_page(([[[["k", "i"]], [["t", "o"]]]],))
+        self.simultaneous_event_with_pages = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        core_events.SimpleEvent(1),
+                        page0,
+                        core_events.SimpleEvent(0.5),
+                        page0,
+                        core_events.SimpleEvent(100),
+                    ]
+                ),
+                core_events.SequentialEvent(
+                    [
+                        core_events.SimpleEvent(1),
+                        page1,
+                        page1,
+                        core_events.SimpleEvent(100),
+                    ]
+                ),
+                core_events.SequentialEvent([core_events.SimpleEvent(100)]),
+            ]
+        )
+        self.simultaneous_event_with_notes = (
+            timelines.SimultaneousEventWithPagesToSimultaneousEventWithNotes()
+        ).convert(self.simultaneous_event_with_pages)
+        # The windows refer to the durations of the notes (which differ
+        # from the durations of the pages).
+        page_to_sequential_event = (
+            dfc22_converters.NestedLanguageStructureToSequentialEvent()
+        )
+        self.note_duration0, self.note_duration1 = (
+            float(page_to_sequential_event(page).duration) for page in (page0, page1)
+        )
+
+    @staticmethod
+    def _flatten(
+        sequential_event: core_events.SequentialEvent,
+    ) -> list[core_events.abc.Event]:
+        """Notes and rests of a timeline (converted pages are nested)"""
+
+        event_list = []
+        for event in sequential_event:
+            if isinstance(event, core_events.SequentialEvent):
+                event_list.extend(event)
+            else:
+                event_list.append(event)
+        # Ignore rests which only exist due to rounding errors
+        return [event for event in event_list if float(event.duration) > 1e-9]
+
+    def _test_window(self, start_time: float, stop_time: float):
+        windowed_simultaneous_event_with_notes = (
+            timelines.SimultaneousEventWithPagesToWindowedSimultaneousEventWithNotes()
+        ).convert(self.simultaneous_event_with_pages, start_time, stop_time)
+        self.assertEqual(
+            len(windowed_simultaneous_event_with_notes),
+            len(self.simultaneous_event_with_notes),
+        )
+        for sequential_event, windowed_sequential_event in zip(
+            self.simultaneous_event_with_notes, windowed_simultaneous_event_with_notes
+        ):
+            sequential_event = sequential_event.copy()
+            sequential_event.cut_out(start_time, stop_time)
+            self.assertAlmostEqual(
+                float(windowed_sequential_event.duration), stop_time - start_time
+            )
+            event_list, windowed_event_list = (
+                self._flatten(sequential_event),
+                self._flatten(windowed_sequential_event),
+            )
+            self.assertEqual(
+                [
+                    (type(event), getattr(event, "phoneme", None))
+                    for event in windowed_event_list
+                ],
+                [
+                    (type(event), getattr(event, "phoneme", None))
+                    for event in event_list
+                ],
+            )
+            for event, windowed_event in zip(event_list, windowed_event_list):
+                self.assertEqual(
+                    getattr(windowed_event, "pitch_list", None),
+                    getattr(event, "pitch_list", None),
+                )
+                self.assertEqual(
+                    getattr(windowed_event, "pulse", None),
+                    getattr(event, "pulse", None),
+                )
+                self.assertAlmostEqual(
+                    float(windowed_event.duration), float(event.duration)
+                )
+
+    def test_get_duration(self):
+        page_to_sequential_event = (
+            dfc22_converters.NestedLanguageStructureToSequentialEvent()
+        )
+        for event in self.simultaneous_event_with_pages[1][1:]:
+            self.assertAlmostEqual(
+                page_to_sequential_event.get_duration(event),
+                float(page_to_sequential_event(event).duration),
+            )
+
+    def test_convert_inside_first_pages(self):
+        minimal_duration = min(self.note_duration0, self.note_duration1)
+        self._test_window(1 + (minimal_duration * 0.25), 1 + (minimal_duration * 0.75))
+
+    def test_convert_after_pages(self):
+        # Starts in the middle of the second page of the first reader
+        # and stops after its last rest started.
+        start_time = 1 + self.note_duration0 + 0.5 + (self.note_duration0 * 0.5)
+        self._test_window(start_time, start_time + self.note_duration0)
+        # Starts after all pages
+        start_time = 1 + (self.note_duration0 * 2) + 0.5 + (self.note_duration1 * 2)
+        self._test_window(start_time, start_time + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,346 @@
+import functools
+import itertools
+import operator
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from mutwo import dfc22_converters
+from mutwo import dfc22_events
+from mutwo import dfc22_parameters
+from mutwo import zimmermann_generators
+from mutwo.dfc22_converters import unisonos
+
+from tests import utilities
+
+
+class PageCombinationTest(unittest.TestCase):
+    def setUp(self):
+        self.non_terminal_pair_tuple = tuple(
+            dfc22_parameters.NonTerminalPair(
+                consonant=zimmermann_generators.JustIntonationPitchNonTerminal(
+                    consonant
+                ),
+                vowel=zimmermann_generators.JustIntonationPitchNonTerminal(vowel),
+            )
+            for consonant, vowel in (("3/2", "1/1"), ("1/1", "5/4"), ("2/3", "7/8"))
+        )
+
+    def test_make_combination_with_replacement_index_array(self):
+        for item_count, combination_count in ((1, 1), (3, 1), (3, 2), (4, 3)):
+            self.assertEqual(
+                unisonos._make_combination_with_replacement_index_array(
+                    item_count, combination_count
+                ).tolist(),
+                [
+                    list(combination)
+                    for combination in itertools.combinations_with_replacement(
+                        range(item_count), combination_count
+                    )
+                ],
+            )
+
+    def test_make_shard_combination_index_array(self):
+        for item_count, combination_count in ((1, 1), (3, 1), (3, 2), (4, 3)):
+            # All shards together contain all combinations in the same order
+            self.assertEqual(
+                np.concatenate(
+                    [
+                        unisonos._make_shard_combination_index_array(
+                            item_count, combination_count, first_index
+                        )
+                        for first_index in range(item_count)
+                    ]
+                ).tolist(),
+                unisonos._make_combination_with_replacement_index_array(
+                    item_count, combination_count
+                ).tolist(),
+            )
+
+    def test_non_terminal_pair_tuple_to_exponent_array(self):
+        exponent_array = unisonos._non_terminal_pair_tuple_to_exponent_array(
+            self.non_terminal_pair_tuple
+        )
+        for combination_count in (1, 2, 3):
+            for combination in itertools.combinations_with_replacement(
+                range(len(self.non_terminal_pair_tuple)), combination_count
+            ):
+                # Sum of pitch objects (as it was calculated before)
+                expected_non_terminal_pair = functools.reduce(
+                    operator.add,
+                    [self.non_terminal_pair_tuple[index] for index in combination],
+                )
+                self.assertEqual(
+                    unisonos._exponent_array_to_non_terminal_pair(
+                        exponent_array[list(combination)].sum(axis=0)
+                    ),
+                    expected_non_terminal_pair,
+                )
+
+    def test_missing_non_terminal_pair(self):
+        # Each non terminal pair has two distinct pages.
+        page_catalog = {
+            non_terminal_pair: tuple(
+                utilities.make_page(([[[[phoneme]]]],)) for phoneme in ("a", "o")
+            )
+            for non_terminal_pair in self.non_terminal_pair_tuple
+        }
+        # No sum of up to two non terminal pairs of the catalog has
+        # the consonant 11/8.
+        unreachable_non_terminal_pair = dfc22_parameters.NonTerminalPair(
+            consonant=zimmermann_generators.JustIntonationPitchNonTerminal("11/8"),
+            vowel=zimmermann_generators.JustIntonationPitchNonTerminal("1/1"),
+        )
+
+        def make_page_catalog_to_page_combination_catalog(
+            minimal_page_combination_count: int,
+        ) -> dfc22_converters.PageCatalogToPageCombinationCatalog:
+            return dfc22_converters.PageCatalogToPageCombinationCatalog(
+                maximum_page_combination_count=2,
+                minimal_page_combination_count=minimal_page_combination_count,
+                process_count=1,
+            )
+
+        (
+            _,
+            non_terminal_pair_to_page_combination_count,
+        ) = make_page_catalog_to_page_combination_catalog(
+            1
+        )._make_non_terminal_pair_to_shard_key_tuple(
+            page_catalog
+        )
+        non_terminal_pair0, non_terminal_pair1, _ = self.non_terminal_pair_tuple
+        # The first non terminal pair can only be reached by one of its
+        # own pages.
+        self.assertEqual(
+            non_terminal_pair_to_page_combination_count[non_terminal_pair0], 2
+        )
+        # Two pages of two different non terminal pairs in both orders
+        self.assertEqual(
+            non_terminal_pair_to_page_combination_count[
+                non_terminal_pair0 + non_terminal_pair1
+            ],
+            8,
+        )
+        # Two pages of the same non terminal pair (the same page can be
+        # used twice)
+        self.assertEqual(
+            non_terminal_pair_to_page_combination_count[
+                non_terminal_pair1 + non_terminal_pair1
+            ],
+            4,
+        )
+        self.assertNotIn(
+            unreachable_non_terminal_pair, non_terminal_pair_to_page_combination_count
+        )
+        # The exception is raised before any page combination is made.
+        # Each requested non terminal pair needs more page combinations
+        # than 'minimal_page_combination_count'.
+        for minimal_page_combination_count, missing_non_terminal_pair_count in (
+            (1, 1),
+            (2, 2),
+        ):
+            self.assertRaisesRegex(
+                Exception,
+                f"for {missing_non_terminal_pair_count} of the requested non "
+                "terminal pairs",
+                make_page_catalog_to_page_combination_catalog(
+                    minimal_page_combination_count
+                ).convert,
+                page_catalog,
+                (non_terminal_pair0, unreachable_non_terminal_pair),
+            )
+
+
+class PageCatalogToPageCombinationCatalogCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.cache_directory_path = self.temporary_directory.name
+        self.page_catalog = {
+            dfc22_parameters.NonTerminalPair(
+                consonant=zimmermann_generators.JustIntonationPitchNonTerminal(
+                    consonant
+                ),
+                vowel=zimmermann_generators.JustIntonationPitchNonTerminal("1/1"),
+            ): tuple(
+                utilities.make_page(([[[[phoneme]]]],)) for phoneme in phoneme_tuple
+            )
+            for consonant, phoneme_tuple in (("3/2", ("a", "o")), ("4/3", ("i", "e")))
+        }
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def _convert(self, page_catalog, cache_directory_path) -> tuple:
+        """Return the page combination catalog and how many shards were computed"""
+
+        function_name = "_find_page_index_tuple_list_per_reduced_non_terminal_pair_index"
+        page_catalog_to_page_combination_catalog = (
+            dfc22_converters.PageCatalogToPageCombinationCatalog(
+                maximum_page_combination_count=2,
+                minimal_page_combination_count=1,
+                process_count=1,
+                cache_directory_path=cache_directory_path,
+            )
+        )
+        with mock.patch.object(
+            unisonos, function_name, wraps=getattr(unisonos, function_name)
+        ) as find_page_index_tuple_list:
+            page_combination_catalog = page_catalog_to_page_combination_catalog.convert(
+                page_catalog
+            )
+        return page_combination_catalog, find_page_index_tuple_list.call_count
+
+    def _get_shard_file_name_list(self) -> list[str]:
+        return sorted(os.listdir(self.cache_directory_path))
+
+    def test_resume(self):
+        page_combination_catalog, shard_count = self._convert(
+            self.page_catalog, self.cache_directory_path
+        )
+        self.assertTrue(page_combination_catalog)
+        shard_file_name_list = self._get_shard_file_name_list()
+        # No temporary files are left
+        self.assertEqual(len(shard_file_name_list), shard_count)
+        self.assertTrue(
+            all(file_name.endswith(".pickle") for file_name in shard_file_name_list)
+        )
+        self.assertEqual(
+            self._convert(self.page_catalog, self.cache_directory_path),
+            (page_combination_catalog, 0),
+        )
+
+    def test_truncated_shard(self):
+        page_combination_catalog, _ = self._convert(
+            self.page_catalog, self.cache_directory_path
+        )
+        shard_path = os.path.join(
+            self.cache_directory_path, self._get_shard_file_name_list()[0]
+        )
+        with open(shard_path, "rb+") as shard_file:
+            shard_file.truncate(10)
+        # Only the truncated shard is computed again
+        self.assertEqual(
+            self._convert(self.page_catalog, self.cache_directory_path),
+            (page_combination_catalog, 1),
+        )
+
+    def test_signature(self):
+        self._convert(self.page_catalog, self.cache_directory_path)
+        other_page_catalog = dict(self.page_catalog)
+        non_terminal_pair = tuple(other_page_catalog)[0]
+        other_page_catalog[non_terminal_pair] = (
+            utilities.make_page(([[[["u"]]]],)),
+        ) + other_page_catalog[non_terminal_pair][1:]
+        page_combination_catalog, shard_count = self._convert(
+            other_page_catalog, self.cache_directory_path
+        )
+        # The shards of the old catalog aren't valid anymore.
+        self.assertEqual(shard_count, len(self._get_shard_file_name_list()))
+        self.assertEqual(
+            page_combination_catalog, self._convert(other_page_catalog, None)[0]
+        )
+
+
+class FindMinimalCyclicIncrementArrayTest(unittest.TestCase):
+    def test_non_cyclic_ranges(self):
+        # Both ranges share position 1, so it's enough to only raise it.
+        increment_array = unisonos._find_minimal_cyclic_increment_array(
+            3, np.array([0, 1]), np.array([2, 2]), np.array([2.0, 2.0])
+        )
+        self.assertAlmostEqual(increment_array.sum(), 2)
+        self.assertTrue(np.all(increment_array >= 0))
+
+    def test_cyclic_ranges(self):
+        # Three ranges of length two, each one needs 1: the total
+        # needs to be at least 1.5.
+        increment_array = unisonos._find_minimal_cyclic_increment_array(
+            3, np.array([0, 1, 2]), np.array([2, 2, 2]), np.array([1.0, 1.0, 1.0])
+        )
+        self.assertAlmostEqual(increment_array.sum(), 1.5)
+        doubled_increment_array = np.tile(increment_array, 2)
+        for start_index in range(3):
+            self.assertGreaterEqual(
+                doubled_increment_array[start_index : start_index + 2].sum(),
+                1 - 1e-9,
+            )
+
+    def test_two_positions(self):
+        # The first position needs 1, the second one 2 and the range
+        # which wraps around needs 3.
+        increment_array = unisonos._find_minimal_cyclic_increment_array(
+            2, np.array([0, 1, 1]), np.array([1, 1, 2]), np.array([1.0, 2.0, 3.0])
+        )
+        self.assertEqual(increment_array.tolist(), [1, 2])
+
+    def test_infeasible_ranges(self):
+        # A range without any position can't have a positive sum.
+        with self.assertRaisesRegex(Exception, "can't be satisfied"):
+            unisonos._find_minimal_cyclic_increment_array(
+                3, np.array([0, 1]), np.array([2, 0]), np.array([1.0, 1.0])
+            )
+
+    def test_satisfied_ranges(self):
+        increment_array = unisonos._find_minimal_cyclic_increment_array(
+            4, np.array([3]), np.array([2]), np.array([-1.0])
+        )
+        self.assertEqual(increment_array.tolist(), [0, 0, 0, 0])
+
+
+class ReaderCountToUnisonoEventIteratorTest(unittest.TestCase):
+    def test_convert(self):
+        reader_count_to_unisono_event_iterator = (
+            dfc22_converters.ReaderCountToUnisonoEventIterator(1, 3)
+        )
+        reader_tuple_list = [
+            unisono_event.reader_tuple
+            for unisono_event in dfc22_converters.ReaderCountToSequentialUnisonoEvent(
+                1, 3
+            ).convert(7)
+        ]
+        self.assertEqual(
+            [
+                unisono_event.reader_tuple
+                for unisono_event in reader_count_to_unisono_event_iterator.convert(7)
+            ],
+            reader_tuple_list,
+        )
+        self.assertEqual(
+            [
+                unisono_event.reader_tuple
+                for unisono_event in reader_count_to_unisono_event_iterator.convert(
+                    7, 10, 20
+                )
+            ],
+            reader_tuple_list[10:20],
+        )
+
+    def test_convert_sample(self):
+        reader_count_to_unisono_event_iterator = (
+            dfc22_converters.ReaderCountToUnisonoEventIterator(1, 5, sample_count=10)
+        )
+        reader_tuple_list = [
+            unisono_event.reader_tuple
+            for unisono_event in reader_count_to_unisono_event_iterator.convert(24)
+        ]
+        self.assertEqual(len(reader_tuple_list), 50)
+        self.assertEqual(
+            sorted(set(len(reader_tuple) for reader_tuple in reader_tuple_list)),
+            [1, 2, 3, 4, 5],
+        )
+        self.assertEqual(
+            [
+                unisono_event.reader_tuple
+                for unisono_event in reader_count_to_unisono_event_iterator.convert(
+                    24, 10, 20
+                )
+            ],
+            reader_tuple_list[10:20],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import pickle
+import unittest
+
+from mutwo import dfc22_events
+from mutwo import dfc22_parameters
+from mutwo import music_parameters
+
+from tests import utilities
+
+
+class PageArrayTest(unittest.TestCase):
+    def setUp(self):
+        self.page = utilities.make_page(
+            ([[[["t", "a"], ["m"]], [["o"]]]], [[[["k", "i"]]]])
+        )
+        self.page[0][0][1].uncertain_rest_duration = dfc22_parameters.UncertainRange(
+            1, 2
+        )
+        self.page_array = dfc22_events.PageArray.from_page(self.page)
+
+    def test_round_trip(self):
+        self.assertEqual(self.page_array.to_page(), self.page)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.page_array)).to_page(), self.page
+        )
+
+    def test_big_exponents(self):
+        # Bigger than the exponents of 'int8'
+        page = utilities.make_page(
+            ([[[["t", "a"], ["m"]]]],),
+            vowel_to_just_intonation_pitch_dict={
+                dfc22_parameters.XSAMPAPhoneme(
+                    "a"
+                ): music_parameters.JustIntonationPitch((0, 200))
+            },
+        )
+        page_array = dfc22_events.PageArray.from_page(page)
+        self.assertEqual(page_array.to_page(), page)
+        self.assertEqual(page_array.view.non_terminal_pair, page.non_terminal_pair)
+
+    def test_abstract_view(self):
+        self.assertRaises(
+            TypeError, dfc22_events.arrays.LanguageStructureView, self.page_array, 0
+        )
+
+    def test_view(self):
+        view = self.page_array.view
+        self.assertEqual(len(view), 2)
+        self.assertEqual(len(view[0][0]), 2)
+        self.assertEqual(view.as_xsampa_text, self.page.as_xsampa_text)
+        self.assertEqual(view[0][0].as_xsampa_text, self.page[0][0].as_xsampa_text)
+        self.assertAlmostEqual(view.duration, self.page.duration)
+        self.assertAlmostEqual(view[1].duration, self.page[1].duration)
+        self.assertEqual(view.non_terminal_pair, self.page.non_terminal_pair)
+        self.assertEqual(
+            view[0][0][0].pitch_movement, self.page[0][0][0].pitch_movement
+        )
+        self.assertEqual(view[-1][0][0][0].as_xsampa_text, "ki")
+
+
+if __name__ == "__main__":
+    unittest.main()
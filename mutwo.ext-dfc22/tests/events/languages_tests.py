@@ -0,0 +1,169 @@
+import copy
+import pickle
+import unittest
+
+from mutwo import dfc22_events
+from mutwo import dfc22_parameters
+from mutwo import music_parameters
+
+from tests import utilities
+
+
+class PageTest(unittest.TestCase):
+    def setUp(self):
+        self.page = utilities.make_page(([[[["t", "a"], ["m"]]]],))
+
+    def test_content_digest(self):
+        self.assertEqual(self.page.content_digest, copy.deepcopy(self.page).content_digest)
+        self.assertEqual(
+            self.page.content_digest,
+            pickle.loads(pickle.dumps(self.page)).content_digest,
+        )
+        self.assertEqual(self.page, copy.deepcopy(self.page))
+        self.assertEqual(hash(self.page), hash(copy.deepcopy(self.page)))
+
+    def test_content_digest_with_different_rest(self):
+        other_page = copy.deepcopy(self.page)
+        other_page[0].uncertain_rest_duration = dfc22_parameters.UncertainRange(7, 8)
+        self.assertEqual(self.page.as_xsampa_text, other_page.as_xsampa_text)
+        self.assertNotEqual(self.page, other_page)
+
+    def test_content_digest_with_different_pitch_dict(self):
+        vowel_to_just_intonation_pitch_dict = dict(
+            self.page[0][0][0][0].vowel_to_just_intonation_pitch_dict
+        )
+        # Equal dicts lead to equal digests
+        self.assertEqual(
+            utilities.make_page(
+                ([[[["t", "a"], ["m"]]]],),
+                vowel_to_just_intonation_pitch_dict=vowel_to_just_intonation_pitch_dict,
+            ),
+            self.page,
+        )
+        # Pitch dicts shouldn't be mutated, therefore a new dict is used.
+        other_page = utilities.make_page(
+            ([[[["t", "a"], ["m"]]]],),
+            vowel_to_just_intonation_pitch_dict={
+                **vowel_to_just_intonation_pitch_dict,
+                dfc22_parameters.XSAMPAPhoneme(
+                    "a"
+                ): music_parameters.JustIntonationPitch("11/8"),
+            },
+        )
+        self.assertEqual(self.page.as_xsampa_text, other_page.as_xsampa_text)
+        self.assertNotEqual(self.page, other_page)
+
+    def test_content_digest_invalidation(self):
+        content_digest = self.page.content_digest
+        phoneme_group = self.page[0][0][0][1]
+        phoneme_group.phoneme_list.append(dfc22_parameters.XSAMPAPhoneme("a"))
+        self.assertNotEqual(self.page.content_digest, content_digest)
+        content_digest = self.page.content_digest
+        phoneme_group.uncertain_duration = dfc22_parameters.UncertainRange(1, 2)
+        self.assertNotEqual(self.page.content_digest, content_digest)
+        content_digest = self.page.content_digest
+        self.page[0][0].append(copy.deepcopy(self.page[0][0][0]))
+        self.assertNotEqual(self.page.content_digest, content_digest)
+
+    def test_cached_aggregates(self):
+        duration = self.page.duration
+        self.assertIsNot(self.page.pitch_movement, self.page.pitch_movement)
+        self.assertEqual(self.page.pitch_movement, self.page.pitch_movement)
+        self.page[0][0][0][0].uncertain_duration = dfc22_parameters.UncertainRange(
+            1, 2
+        )
+        self.assertNotEqual(self.page.duration, duration)
+        self.assertAlmostEqual(self.page.uncertain_duration.end, 2.6)
+        non_terminal_pair = self.page.non_terminal_pair
+        self.page[0][0][0].append(dfc22_events.PhonemeGroup(phoneme_list=["t"]))
+        self.assertEqual(
+            self.page.non_terminal_pair.consonant,
+            non_terminal_pair.consonant + self.page[0][0][0][-1].time_movement,
+        )
+
+    def test_make_placement(self):
+        non_terminal_pair = dfc22_parameters.NonTerminalPair(
+            consonant=music_parameters.JustIntonationPitch("3/2"),
+            vowel=music_parameters.JustIntonationPitch("5/4"),
+        )
+        placement = self.page.make_placement(non_terminal_pair)
+        self.assertEqual(placement.initial_non_terminal_pair, non_terminal_pair)
+        self.assertNotEqual(
+            self.page.initial_non_terminal_pair, placement.initial_non_terminal_pair
+        )
+        self.assertIs(placement[0], self.page[0])
+        # Placements share the content digest, but they are only equal
+        # if they start with the same non terminal pair.
+        self.assertEqual(placement.content_digest, self.page.content_digest)
+        self.assertNotEqual(placement, self.page)
+        self.assertEqual(
+            placement, copy.deepcopy(self.page).make_placement(non_terminal_pair)
+        )
+        self.assertEqual(
+            hash(placement), hash(self.page.make_placement(non_terminal_pair))
+        )
+        self.assertEqual(
+            placement.make_placement(self.page.initial_non_terminal_pair), self.page
+        )
+
+    def test_xsampa_text(self):
+        self.assertEqual(self.page.as_xsampa_text, "\ttam! \n")
+        self.assertEqual(
+            "".join(self.page.iterate_xsampa_text()), self.page.as_xsampa_text
+        )
+        self.page[0][0][0][1].phoneme_list.append(dfc22_parameters.XSAMPAPhoneme("a"))
+        self.assertEqual(self.page.as_xsampa_text, "\ttama! \n")
+
+    def test_phoneme_list_with_strings(self):
+        phoneme_group = self.page[0][0][0][1]
+        phoneme_list = phoneme_group.phoneme_list
+        content_digest = self.page.content_digest
+        phoneme_list.append("a")
+        phoneme_list.insert(0, "t")
+        phoneme_list.extend(["o"])
+        phoneme_list += ["i"]
+        phoneme_list[1] = "k"
+        phoneme_list[2:3] = ["a", "m"]
+        self.assertTrue(
+            all(
+                isinstance(phoneme, dfc22_parameters.XSAMPAPhoneme)
+                for phoneme in phoneme_group.phoneme_list
+            )
+        )
+        self.assertEqual(phoneme_group.as_xsampa_text, "tkamoi")
+        self.assertNotEqual(self.page.content_digest, content_digest)
+        self.assertEqual(
+            phoneme_group.pitch_movement,
+            dfc22_events.PhonemeGroup(phoneme_list=list("tkamoi")).pitch_movement,
+        )
+
+    def test_deepcopy(self):
+        page_copy = copy.deepcopy(self.page)
+        phoneme_group, phoneme_group_copy = self.page[0][0][0][0], page_copy[0][0][0][0]
+        self.assertIsNot(phoneme_group_copy, phoneme_group)
+        self.assertIsNot(phoneme_group_copy.phoneme_list, phoneme_group.phoneme_list)
+        self.assertIs(
+            phoneme_group_copy.vowel_to_just_intonation_pitch_dict,
+            phoneme_group.vowel_to_just_intonation_pitch_dict,
+        )
+        # Ranges are mutable and therefore not shared
+        self.assertIsNot(
+            phoneme_group_copy.uncertain_duration, phoneme_group.uncertain_duration
+        )
+        self.assertEqual(
+            phoneme_group_copy.uncertain_duration, phoneme_group.uncertain_duration
+        )
+        phoneme_group_copy.uncertain_duration.end += 1
+        self.assertNotEqual(
+            phoneme_group_copy.uncertain_duration, phoneme_group.uncertain_duration
+        )
+        self.assertIsNot(
+            page_copy[0].uncertain_rest_duration, self.page[0].uncertain_rest_duration
+        )
+        phoneme_group_copy.phoneme_list.append(dfc22_parameters.XSAMPAPhoneme("o"))
+        self.assertNotEqual(page_copy, self.page)
+        self.assertEqual(len(phoneme_group.phoneme_list), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
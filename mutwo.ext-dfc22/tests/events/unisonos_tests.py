@@ -0,0 +1,163 @@
+import copy
+import pickle
+import unittest
+
+from mutwo import dfc22_events
+
+
+class SequentialUnisonoEventTest(unittest.TestCase):
+    def setUp(self):
+        self.sequential_unisono_event = dfc22_events.SequentialUnisonoEvent(
+            [
+                dfc22_events.UnisonoEvent((0, 1)),
+                dfc22_events.UnisonoEvent((1, 2)),
+                dfc22_events.UnisonoEvent((0, 2, 3)),
+            ]
+        )
+
+    def test_get_movement_tuple(self):
+        self.assertEqual(
+            tuple(
+                (
+                    movement.reader,
+                    movement.unisono_event_left_index,
+                    movement.unisono_event_right_index,
+                )
+                for movement in self.sequential_unisono_event.get_movement_tuple()
+            ),
+            (
+                (1, 0, 1),
+                (0, 0, 2),
+                (2, 1, 2),
+                (0, 2, 0),
+                (1, 1, 0),
+                (2, 2, 1),
+            ),
+        )
+
+    def test_reader_incidence_matrix(self):
+        self.assertEqual(
+            self.sequential_unisono_event.reader_incidence_matrix.tolist(),
+            [
+                [True, False, True],
+                [True, True, False],
+                [False, True, True],
+                [False, False, True],
+            ],
+        )
+        self.sequential_unisono_event[1].reader_tuple = (1,)
+        self.assertEqual(
+            self.sequential_unisono_event.reader_incidence_matrix[:, 1].tolist(),
+            [False, True, False, False],
+        )
+
+    def test_next_and_previous_occurrence_index_matrix(self):
+        self.assertEqual(
+            self.sequential_unisono_event.next_occurrence_index_matrix.tolist(),
+            [[2, 2, 0], [1, 0, 0], [1, 2, 1], [2, 2, 2]],
+        )
+        self.assertEqual(
+            self.sequential_unisono_event.previous_occurrence_index_matrix.tolist(),
+            [[2, 0, 0], [1, 0, 1], [2, 2, 1], [2, 2, 2]],
+        )
+        self.assertEqual(
+            self.sequential_unisono_event.gap_length_matrix.tolist(),
+            [[2, 1, 1], [1, 2, 1], [1, 1, 2], [2, 1, 3]],
+        )
+
+    def test_get_movement_set(self):
+        movement_set = self.sequential_unisono_event.get_movement_set()
+        for unisono_event_index, _ in enumerate(self.sequential_unisono_event):
+            for (
+                reader_index_to_movement
+            ) in self.sequential_unisono_event.get_movement_dict(
+                unisono_event_index
+            ).values():
+                for movement in reader_index_to_movement.values():
+                    self.assertIn(movement, movement_set)
+        self.assertEqual(len(movement_set), 6)
+
+
+class RepeatedSequentialUnisonoEventTest(unittest.TestCase):
+    def setUp(self):
+        self.repeated_sequential_unisono_event = (
+            dfc22_events.RepeatedSequentialUnisonoEvent(
+                [
+                    dfc22_events.UnisonoEvent((0, 1), 1),
+                    dfc22_events.UnisonoEvent((1, 2), 2),
+                ],
+                repetition_count=3,
+            )
+        )
+
+    def test_length(self):
+        self.assertEqual(len(self.repeated_sequential_unisono_event), 6)
+        self.assertEqual(self.repeated_sequential_unisono_event.pattern_length, 2)
+        self.assertEqual(self.repeated_sequential_unisono_event.duration, 9)
+
+    def test_independent_repetitions(self):
+        self.repeated_sequential_unisono_event[2].duration = 10
+        self.assertEqual(self.repeated_sequential_unisono_event[0].duration, 1)
+        self.assertEqual(self.repeated_sequential_unisono_event[2].duration, 10)
+        self.assertEqual(
+            self.repeated_sequential_unisono_event[-1].reader_tuple, (1, 2)
+        )
+
+    def test_sparse_overlay(self):
+        self.repeated_sequential_unisono_event[3].set_parameter("repetition_count", 2)
+        # Only the changed value of the changed position is stored.
+        self.assertEqual(
+            self.repeated_sequential_unisono_event._index_to_overlay,
+            {3: {"repetition_count": 2}},
+        )
+        self.repeated_sequential_unisono_event[4] = dfc22_events.UnisonoEvent((0, 1), 5)
+        self.assertEqual(self.repeated_sequential_unisono_event[4].duration, 5)
+        self.assertRaises(
+            Exception,
+            self.repeated_sequential_unisono_event.__setitem__,
+            4,
+            dfc22_events.UnisonoEvent((0, 2), 5),
+        )
+
+    def test_fixed_length(self):
+        for method_name, argument_tuple in (
+            ("append", (dfc22_events.UnisonoEvent((0, 1), 1),)),
+            ("insert", (0, dfc22_events.UnisonoEvent((0, 1), 1))),
+            ("pop", tuple([])),
+            ("__delitem__", (0,)),
+        ):
+            self.assertRaises(
+                NotImplementedError,
+                getattr(self.repeated_sequential_unisono_event, method_name),
+                *argument_tuple,
+            )
+        self.assertEqual(len(self.repeated_sequential_unisono_event), 6)
+
+    def test_copy_and_pickle(self):
+        self.repeated_sequential_unisono_event[2].duration = 10
+        unisono_event_copy = copy.deepcopy(self.repeated_sequential_unisono_event[2])
+        self.assertEqual(type(unisono_event_copy), dfc22_events.UnisonoEvent)
+        self.assertEqual(unisono_event_copy.duration, 10)
+        self.assertEqual(unisono_event_copy.reader_tuple, (0, 1))
+        for sequence_copy in (
+            copy.deepcopy(self.repeated_sequential_unisono_event),
+            pickle.loads(pickle.dumps(self.repeated_sequential_unisono_event)),
+        ):
+            self.assertEqual(
+                [unisono_event.duration for unisono_event in sequence_copy],
+                [1, 2, 10, 2, 1, 2],
+            )
+            sequence_copy[0].duration = 7
+            self.assertEqual(self.repeated_sequential_unisono_event[0].duration, 1)
+
+    def test_reader_incidence_matrix(self):
+        self.assertEqual(
+            self.repeated_sequential_unisono_event.reader_incidence_matrix.tolist(),
+            dfc22_events.SequentialUnisonoEvent(
+                list(self.repeated_sequential_unisono_event)
+            ).reader_incidence_matrix.tolist(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
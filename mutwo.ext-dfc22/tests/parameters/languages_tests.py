@@ -0,0 +1,80 @@
+import copy
+import gc
+import pickle
+import unittest
+
+from mutwo import dfc22_parameters
+from mutwo import zimmermann_generators
+
+
+class CompactNonTerminalPairTest(unittest.TestCase):
+    def setUp(self):
+        self.non_terminal_pair = dfc22_parameters.NonTerminalPair(
+            consonant=zimmermann_generators.JustIntonationPitchNonTerminal("3/2"),
+            vowel=zimmermann_generators.JustIntonationPitchNonTerminal("5/4"),
+        )
+        self.compact_non_terminal_pair = (
+            dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                self.non_terminal_pair
+            )
+        )
+
+    def test_interning(self):
+        self.assertIs(
+            self.compact_non_terminal_pair,
+            dfc22_parameters.CompactNonTerminalPair.from_non_terminal_pair(
+                copy.deepcopy(self.non_terminal_pair)
+            ),
+        )
+        self.assertIs(
+            self.compact_non_terminal_pair,
+            pickle.loads(pickle.dumps(self.compact_non_terminal_pair)),
+        )
+        self.assertIs(
+            self.compact_non_terminal_pair,
+            copy.deepcopy(self.compact_non_terminal_pair),
+        )
+
+    def test_release(self):
+        exponent_count = (
+            dfc22_parameters.configurations.COMPACT_NON_TERMINAL_PAIR_EXPONENT_COUNT
+        )
+        exponent_tuple = (0,) * (exponent_count * 2 - 1) + (-17,)
+        compact_non_terminal_pair = dfc22_parameters.CompactNonTerminalPair(
+            exponent_tuple
+        )
+        intern_dict = (
+            dfc22_parameters.CompactNonTerminalPair._exponent_tuple_to_compact_non_terminal_pair
+        )
+        self.assertIs(intern_dict[exponent_tuple], compact_non_terminal_pair)
+        del compact_non_terminal_pair
+        gc.collect()
+        self.assertNotIn(exponent_tuple, intern_dict)
+
+    def test_conversion(self):
+        self.assertEqual(
+            self.compact_non_terminal_pair.to_non_terminal_pair(),
+            self.non_terminal_pair,
+        )
+        self.assertEqual(self.compact_non_terminal_pair, self.non_terminal_pair)
+        self.assertEqual(
+            hash(self.compact_non_terminal_pair), hash(self.non_terminal_pair)
+        )
+        self.assertEqual(
+            {self.non_terminal_pair: 1}[self.compact_non_terminal_pair], 1
+        )
+
+    def test_add_and_sub(self):
+        self.assertEqual(
+            self.compact_non_terminal_pair + self.compact_non_terminal_pair,
+            self.non_terminal_pair + self.non_terminal_pair,
+        )
+        self.assertIs(
+            (self.compact_non_terminal_pair + self.compact_non_terminal_pair)
+            - self.compact_non_terminal_pair,
+            self.compact_non_terminal_pair,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import copy
+import pickle
+import unittest
+
+from mutwo import dfc22_parameters
+
+
+class XSAMPAPhonemeTest(unittest.TestCase):
+    def test_interning(self):
+        phoneme = dfc22_parameters.XSAMPAPhoneme("a")
+        self.assertIs(phoneme, dfc22_parameters.XSAMPAPhoneme("a"))
+        self.assertIs(phoneme, pickle.loads(pickle.dumps(phoneme)))
+        self.assertIs(phoneme, copy.deepcopy(phoneme))
+        self.assertIs(
+            phoneme, dfc22_parameters.XSAMPAPhoneme.from_phoneme_id(phoneme.phoneme_id)
+        )
+        self.assertEqual(phoneme, "a")
+
+    def test_phoneme_class(self):
+        vowel = dfc22_parameters.XSAMPAPhoneme("a")
+        consonant = dfc22_parameters.XSAMPAPhoneme("m")
+        self.assertTrue(vowel.is_vowel)
+        self.assertFalse(vowel.is_consonant)
+        self.assertTrue(consonant.is_consonant)
+        self.assertEqual(
+            consonant.phoneme_class, dfc22_parameters.XSAMPAPhonemeClass.NASAL
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Functions which are shared by multiple test modules"""
+
+import typing
+
+from mutwo import dfc22_events
+
+
+def make_page(
+    paragraph_sequence: typing.Sequence[
+        typing.Sequence[typing.Sequence[typing.Sequence[typing.Sequence[str]]]]
+    ],
+    **phoneme_group_keyword_argument_dict,
+) -> dfc22_events.Page:
+    """Make a page from nested phoneme lists.
+
+    :param paragraph_sequence: Each paragraph is a sequence of sentences,
+        each sentence is a sequence of words and each word is a sequence
+        of the phoneme lists of its phoneme groups.
+    :param phoneme_group_keyword_argument_dict: Passed to each
+        :class:`mutwo.dfc22_events.PhonemeGroup`.
+    """
+
+    return dfc22_events.Page(
+        [
+            dfc22_events.Paragraph(
+                [
+                    dfc22_events.Sentence(
+                        [
+                            dfc22_events.Word(
+                                [
+                                    dfc22_events.PhonemeGroup(
+                                        phoneme_list=list(phoneme_list),
+                                        **phoneme_group_keyword_argument_dict,
+                                    )
+                                    for phoneme_list in word
+                                ]
+                            )
+                            for word in sentence
+                        ]
+                    )
+                    for sentence in paragraph
+                ]
+            )
+            for paragraph in paragraph_sequence
+        ]
+    )
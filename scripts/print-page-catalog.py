@@ -1,27 +1,24 @@
-import dfc22
+import argparse
+import sys
+
+from mutwo import dfc22_converters
 
-print(dfc22.constants.NON_TERMINAL_PAIR_TO_PAGE_TUPLE)
+import dfc22
 
-print("")
+parser = argparse.ArgumentParser(description="Print all pages of the page catalog.")
+parser.add_argument(
+    "--format",
+    default="text",
+    choices=("text", "jsonl"),
+    help="'text' for a readable overview, 'jsonl' for one JSON object per page",
+)
+arguments = parser.parse_args()
 
-for (
-    non_terminal_pair,
-    page_tuple,
-) in dfc22.constants.NON_TERMINAL_PAIR_TO_PAGE_TUPLE.items():
-    print(non_terminal_pair)
-    print([page.duration for page in page_tuple])
-    print([len(page) for page in page_tuple])
-    for page in page_tuple:
-        print(
-            "NEW PAGE. It has: {} paragraphs, {} sentences, {} words.".format(
-                len(page),
-                sum(len(para) for para in page),
-                sum(sum(len(sen) for sen in para) for para in page),
-            )
-        )
-        print('')
-        print(page.as_xsampa_text)
-        print('')
-    print("")
+# Pages are written one after another, so that large catalogs
+# don't need to be converted to one string before printing.
+dfc22_converters.PageCatalogToFile(arguments.format).convert(
+    dfc22.constants.NON_TERMINAL_PAIR_TO_PAGE_TUPLE, sys.stdout
+)
 
-print(len(dfc22.constants.NON_TERMINAL_PAIR_TO_PAGE_TUPLE))
+if arguments.format == "text":
+    print(len(dfc22.constants.NON_TERMINAL_PAIR_TO_PAGE_TUPLE))
@@ -1,3 +1,6 @@
+import argparse
+import os
+
 from mutwo import core_events
 from mutwo import dfc22_converters
 from mutwo import isis_converters
@@ -46,6 +49,69 @@ def render_isis():
         )
 
 
+def render_window(start_time: float, stop_time: float):
+    """Only render the pages which overlap with the window"""
+
+    for (
+        name,
+        page_to_sequential_event,
+        event_to_sound_file,
+    ) in (
+        (
+            "pages",
+            dfc22_converters.NestedLanguageStructureToSequentialEvent(),
+            mbrola_converters.EventToSpeakSynthesis(),
+        ),
+        (
+            "isis-pages",
+            dfc22.constants.make_page_to_isis_friendly_sequential_event(),
+            isis_converters.EventToSingingSynthesis(
+                isis_converters.EventToIsisScore(),
+                "--cfg_synth etc/isis-cfg-synth.cfg",
+                "--cfg_style etc/isis-cfg-style.cfg",
+                "--seed 100",
+            ),
+        ),
+    ):
+        windowed_simultaneous_event = dfc22_converters.SimultaneousEventWithPagesToWindowedSimultaneousEventWithNotes(
+            page_to_sequential_event
+        ).convert(
+            dfc22.constants.SIMULTANEOUS_EVENT_WITH_PAGES, start_time, stop_time
+        )
+        directory_path = f"builds/{name}/window-{start_time}-{stop_time}"
+        if not os.path.isdir(directory_path):
+            os.makedirs(directory_path)
+        for index, sequential_event in enumerate(windowed_simultaneous_event):
+            event_to_mixed_sound_file = dfc22_converters.EventToMixedSoundFile(
+                f"{directory_path}/{index}",
+                event_to_sound_file,
+                lambda event: isinstance(event, core_events.SequentialEvent)
+                and len(event) > 0
+                and isinstance(event[0], music_events.NoteLike),
+            )
+            event_to_mixed_sound_file.convert(
+                sequential_event, f"{directory_path}/{index}.wav"
+            )
+
+
 if __name__ == "__main__":
-    render_mbrola()
-    render_isis()
+    argument_parser = argparse.ArgumentParser(
+        description="Render the readers of the simultaneous event."
+    )
+    argument_parser.add_argument(
+        "--start", type=float, help="start time of the window in seconds"
+    )
+    argument_parser.add_argument(
+        "--stop", type=float, help="stop time of the window in seconds"
+    )
+    arguments = argument_parser.parse_args()
+    if arguments.start is None and arguments.stop is None:
+        render_mbrola()
+        render_isis()
+    else:
+        render_window(
+            arguments.start or 0,
+            arguments.stop
+            if arguments.stop is not None
+            else float(dfc22.constants.SIMULTANEOUS_EVENT_WITH_PAGES.duration),
+        )